@@ -1,8 +1,13 @@
-from .config import Config
+from .config import Config, PlayerConfig, UpdateTrigger
+from .events import EventBus, StatusDiffer
+from .library import AlbumIndex, AlbumRecord, Library
 from .mpd_client import MPDClient
+from .song_cache import SongCache, SongRecord
+from .store import Store
+from .systemd import SystemdNotifier
 from src.utils.logger import Logger
 
 log = Logger()
 log.debug("Initializing core components")
 
-__all__ = ["Config", "MPDClient"]
+__all__ = ["Config", "PlayerConfig", "UpdateTrigger", "EventBus", "StatusDiffer", "AlbumIndex", "AlbumRecord", "Library", "MPDClient", "SongCache", "SongRecord", "Store", "SystemdNotifier"]
@@ -1,7 +1,10 @@
 import json
 import os
-from typing import Any, Optional
+import time
+from typing import Any, Dict, Optional
 from src.utils.logger import Logger
+from src.utils.metrics import Metrics
+from src.utils.trace import Trace
 
 log = Logger()
 
@@ -20,6 +23,7 @@ class Config:
             self.config_path = os.path.join(base_path, 'config', 'settings.json')
             self.load_config()
             log.configure(self.config)
+            Metrics().configure(self.config)
             self.initialized = True
 
     def load_config(self) -> None:
@@ -38,3 +42,87 @@ class Config:
                 return default
         return value
 
+def _merge(base: Any, override: Any) -> Any:
+    if isinstance(base, dict) and isinstance(override, dict):
+        merged = dict(base)
+        for key, value in override.items():
+            merged[key] = _merge(base.get(key), value)
+        return merged
+    return override if override is not None else base
+
+class PlayerConfig:
+    def __init__(self, base: Config, name: str, index: int) -> None:
+        self.base = base
+        self.name = name
+        self.index = index
+        self._loaded: Optional[Dict[str, Any]] = None
+        self._cached: Dict[str, Any] = {}
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        return self.base.config
+
+    def load_config(self) -> None:
+        self.base.load_config()
+
+    def _overrides(self) -> Dict[str, Any]:
+        config = self.base.config
+        if config is not self._loaded:
+            self._loaded = config
+            self._cached = self._find_overrides()
+        return self._cached
+
+    def _find_overrides(self) -> Dict[str, Any]:
+        players = self.base.get('players', []) or []
+        for player in players:
+            if isinstance(player, dict) and player.get('name') == self.name:
+                return player
+        if self.index < len(players):
+            player = players[self.index]
+            if isinstance(player, dict) and not player.get('name'):
+                return player
+        return {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self._overrides()
+        for k in key.split('.'):
+            value = value.get(k) if isinstance(value, dict) else None
+            if value is None:
+                break
+        merged = _merge(self.base.get(key), value)
+        return default if merged is None else merged
+
+class UpdateTrigger:
+    def __init__(self, config: Any) -> None:
+        self.config = config
+        self.last_check = 0
+
+    def poll(self) -> bool:
+        current_time = time.time()
+        update_config = self.config.get('updates.trigger', {})
+        check_interval = update_config.get('check_interval', 2)
+        trigger_file = update_config.get('file', '.update_trigger')
+        debounce_time = update_config.get('debounce_time', 0.1)
+
+        if (current_time - self.last_check) < check_interval:
+            return False
+
+        self.last_check = current_time
+        base_path = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        trigger_path = os.path.join(base_path, 'config', trigger_file)
+
+        try:
+            os.stat(trigger_path)
+        except FileNotFoundError:
+            return False
+
+        log.debug("Configuration update triggered")
+        time.sleep(debounce_time)
+        self.config.load_config()
+        Metrics().configure(self.config.config)
+        Trace().record('config', self.config.config)
+        try:
+            os.unlink(trigger_path)
+        except FileNotFoundError:
+            pass
+        return True
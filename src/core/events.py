@@ -0,0 +1,92 @@
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Type
+from src.utils.logger import Logger
+from src.utils.metrics import Metrics
+
+log = Logger()
+metrics = Metrics()
+
+OPTIONS = ('repeat', 'random', 'single', 'consume')
+
+class StateChanged(NamedTuple):
+    previous: Optional[str]
+    state: str
+    status: Dict[str, Any]
+
+class SongChanged(NamedTuple):
+    previous: Optional[str]
+    song_id: str
+    status: Dict[str, Any]
+
+class VolumeChanged(NamedTuple):
+    previous: Optional[str]
+    volume: str
+    status: Dict[str, Any]
+
+class OptionsChanged(NamedTuple):
+    options: Dict[str, bool]
+    status: Dict[str, Any]
+
+class PlaylistChanged(NamedTuple):
+    version: str
+    length: int
+    status: Dict[str, Any]
+
+class StatusUpdated(NamedTuple):
+    status: Dict[str, Any]
+
+Handler = Callable[[Any], None]
+
+class EventBus:
+    def __init__(self) -> None:
+        self._handlers: Dict[type, List[Handler]] = {}
+
+    def subscribe(self, event_type: Type[Any], handler: Handler) -> Callable[[], None]:
+        self._handlers.setdefault(event_type, []).append(handler)
+
+        def unsubscribe() -> None:
+            handlers = self._handlers.get(event_type, [])
+            if handler in handlers:
+                handlers.remove(handler)
+        return unsubscribe
+
+    def publish(self, event: Any) -> None:
+        for handler in self._handlers.get(type(event), ()):
+            try:
+                handler(event)
+            except Exception as e:
+                metrics.incr('events.handler_errors')
+                log.error(f"{type(event).__name__} handler failed: {e}")
+
+    def publish_all(self, events: Iterable[Any]) -> None:
+        for event in events:
+            self.publish(event)
+
+class StatusDiffer:
+    def __init__(self) -> None:
+        self.status: Dict[str, Any] = {}
+
+    def reset(self) -> None:
+        self.status = {}
+
+    def diff(self, status: Dict[str, Any]) -> List[Any]:
+        previous, self.status = self.status, status
+        events: List[Any] = []
+
+        options = {name: status.get(name, '0') == '1' for name in OPTIONS}
+        if not previous or any(previous.get(name) != status.get(name) for name in OPTIONS):
+            events.append(OptionsChanged(options, status))
+
+        version = status.get('playlist', '0')
+        if version != previous.get('playlist'):
+            events.append(PlaylistChanged(version, int(status.get('playlistlength', 0) or 0), status))
+
+        for key, default, event_type in (('state', 'stop', StateChanged),
+                                         ('songid', '0', SongChanged),
+                                         ('volume', '0', VolumeChanged)):
+            value = status.get(key, default)
+            before = previous.get(key, default) if previous else None
+            if value != before:
+                events.append(event_type(before, value, status))
+
+        events.append(StatusUpdated(status))
+        return events
@@ -0,0 +1,204 @@
+import json
+import os
+import random
+import threading
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+from src.core.mpd_client import MPDClient
+from src.utils.logger import Logger
+from src.utils.metrics import Metrics
+
+log = Logger()
+metrics = Metrics()
+
+VERSION = 1
+
+class AlbumRecord(NamedTuple):
+    albumartist: str
+    album: str
+    tracks: int
+    duration: float
+
+def _as_list(value: Any) -> List[str]:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+def _number(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+class AlbumIndex:
+    def __init__(self, path: str = '') -> None:
+        self.path = path
+        self.db_update: Optional[int] = None
+        self.albums: Dict[Tuple[str, str], AlbumRecord] = {}
+        self._artists: Dict[str, Tuple[int, float]] = {}
+        self._pool: List[AlbumRecord] = []
+
+    def load(self) -> bool:
+        if not self.path:
+            return False
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            if data.get('version') != VERSION:
+                return False
+            self.db_update = data.get('db_update')
+            self._artists = {artist: (int(songs), float(playtime)) for artist, songs, playtime in data['artists']}
+            self._set_albums(AlbumRecord(*album) for album in data['albums'])
+            return True
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            log.debug("Library index not loaded: %s", e)
+            return False
+
+    def save(self) -> bool:
+        if not self.path:
+            return False
+        temp_file = f"{self.path}.tmp"
+        try:
+            with open(temp_file, 'w') as f:
+                json.dump({
+                    'version': VERSION,
+                    'db_update': self.db_update,
+                    'artists': [[artist, songs, playtime] for artist, (songs, playtime) in self._artists.items()],
+                    'albums': [list(album) for album in self.albums.values()]
+                }, f, separators=(',', ':'))
+            os.replace(temp_file, self.path)
+            return True
+        except OSError as e:
+            log.error(f"Library index save failed: {e}")
+            return False
+
+    def _set_albums(self, albums: Any) -> None:
+        self.albums = {(album.albumartist, album.album): album for album in albums}
+        self._pool = [album for album in self.albums.values() if album.album and album.tracks]
+
+    def refresh(self, mpd: MPDClient) -> bool:
+        stats = mpd.get_stats()
+        if stats is None:
+            return False
+        db_update = int(_number(stats.get('db_update')))
+        if db_update == self.db_update and self.albums:
+            return False
+
+        started = time.perf_counter()
+        listing = mpd.list_grouped('album', 'albumartist')
+        totals = mpd.count_grouped('albumartist')
+        if listing is None or totals is None:
+            return False
+
+        keys: Set[Tuple[str, str]] = set()
+        for row in listing:
+            for artist in _as_list(row.get('albumartist', '')) or ['']:
+                keys.update((artist, album) for album in _as_list(row.get('album')))
+
+        artists = {
+            row.get('albumartist', ''): (int(_number(row.get('songs'))), _number(row.get('playtime')))
+            for row in totals
+        }
+        albums = {key: album for key, album in self.albums.items()
+                  if key in keys and self._artists.get(key[0]) == artists.get(key[0])}
+        changed = [artist for artist, total in artists.items() if self._artists.get(artist) != total]
+        for artist in changed:
+            rows = mpd.count_grouped('album', 'albumartist', artist)
+            if rows is None:
+                return False
+            for row in rows:
+                key = (artist, row.get('album', ''))
+                if key in keys:
+                    albums[key] = AlbumRecord(artist, key[1], int(_number(row.get('songs'))), _number(row.get('playtime')))
+
+        self._artists = artists
+        self._set_albums(albums.values())
+        self.db_update = db_update
+        elapsed = (time.perf_counter() - started) * 1000.0
+        metrics.observe('library.refresh', elapsed)
+        log.info(f"Library index: {len(self.albums)} albums, {len(changed)} artists rescanned in {elapsed:.0f} ms")
+        self.save()
+        return True
+
+    def pick(self, rng: Optional[random.Random] = None) -> Optional[AlbumRecord]:
+        if not self._pool:
+            return None
+        return (rng or random).choice(self._pool)
+
+class Library:
+    def __init__(self, host: str = 'localhost', port: int = 6600, path: str = '',
+                 mpd: Optional[MPDClient] = None) -> None:
+        self.index = AlbumIndex(path)
+        self.mpd = mpd or MPDClient(host, port)
+        self._rng = random.Random()
+        self._roulette_pending = False
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+
+    def start(self) -> None:
+        if self.index.load():
+            log.ok(f"Library index loaded: {len(self.index.albums)} albums")
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name='library', daemon=True)
+        self._thread.start()
+
+    def _wake(self) -> None:
+        try:
+            os.write(self._wake_w, b'x')
+        except OSError:
+            pass
+
+    def _drain(self) -> None:
+        try:
+            while os.read(self._wake_r, 64):
+                pass
+        except OSError:
+            pass
+
+    def request_roulette(self) -> None:
+        self._roulette_pending = True
+        self._wake()
+
+    def roulette(self) -> Optional[AlbumRecord]:
+        started = time.perf_counter()
+        album = self.index.pick(self._rng)
+        if album is None:
+            log.warning("Library index is empty, nothing to play")
+            return None
+        if not self.mpd.play_album(album.albumartist, album.album):
+            return None
+        elapsed = (time.perf_counter() - started) * 1000.0
+        metrics.observe('library.roulette', elapsed)
+        log.ok(f"Roulette: {album.album} by {album.albumartist or 'unknown artist'} "
+               f"({album.tracks} tracks) in {elapsed:.0f} ms")
+        return album
+
+    def _run(self) -> None:
+        self.index.refresh(self.mpd)
+        while self._running:
+            changes = self.mpd.wait_idle(self._wake_r, None, ('database',))
+            self._drain()
+            if not self._running:
+                break
+            if self._roulette_pending:
+                self._roulette_pending = False
+                self.roulette()
+            if 'database' in (changes or ()) or not self.index.albums:
+                self.index.refresh(self.mpd)
+            if changes == []:
+                time.sleep(1.0)
+
+    def stop(self) -> None:
+        self._running = False
+        self._wake()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+        self.mpd.close()
+        for fd in (self._wake_r, self._wake_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
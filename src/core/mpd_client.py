@@ -1,20 +1,35 @@
-from mpd import MPDClient as BaseMPDClient
 import time
+import select
 import socket
-from typing import Optional, Dict, Any
+import threading
+from typing import Optional, Dict, Any, Callable, List, Sequence
 from src.utils.logger import Logger
+from src.utils.metrics import Metrics
+from src.utils.trace import Trace
 
 log = Logger()
+metrics = Metrics()
+trace = Trace()
 
 class MPDClient:
-    def __init__(self, host: str = 'localhost', port: int = 6600) -> None:
+    def __init__(self, host: str = 'localhost', port: int = 6600, retry_interval: float = 5,
+                 timeout: Optional[float] = None) -> None:
         self.host = host
         self.port = port
+        from mpd import MPDClient as BaseMPDClient
+
         self._client = BaseMPDClient()
+        if timeout is not None:
+            self._client.timeout = timeout
+        self._legacy_idle = hasattr(self._client, 'send_idle')
         self._connected = False
+        self._idling = False
         self._last_try = 0
-        self._retry_interval = 5
-        log.debug(f"MPD client initialized for {host}:{port}")
+        self._retry_interval = retry_interval
+        self._ever_connected = False
+        self._lock = threading.Lock()
+        self.last_rtt_ms = None
+        log.debug("MPD client initialized for %s:%s", host, port)
 
     def connect(self) -> bool:
         current_time = time.time()
@@ -23,38 +38,152 @@ class MPDClient:
                 log.wait("Attempting to connect to MPD...")
                 self._client.connect(self.host, self.port)
                 self._connected = True
+                if self._ever_connected:
+                    metrics.incr('mpd.reconnects')
+                self._ever_connected = True
                 log.ok(f"Connected to MPD at {self.host}:{self.port}")
                 return True
             except Exception:
-                self._connected = False
+                self._drop_connection()
                 self._last_try = current_time
+                metrics.incr('mpd.connect_failures')
                 log.error(f"Failed to connect to MPD at {self.host}:{self.port}")
         return self._connected
 
-    def get_status(self) -> Optional[Dict[str, Any]]:
+    @property
+    def connected(self) -> bool:
+        return self._connected
+
+    def fileno(self) -> int:
+        return self._client.fileno()
+
+    def _drop_connection(self) -> None:
+        self._connected = False
+        self._idling = False
         try:
-            if self.connect():
-                status = self._client.status()
-                return status
+            self._client.disconnect()
         except Exception:
-            self._connected = False
-            log.error("Failed to get MPD status")
-        return None
+            pass
+
+    def get_status(self) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            try:
+                if self.connect():
+                    started = time.perf_counter()
+                    status = self._client.status()
+                    self.last_rtt_ms = (time.perf_counter() - started) * 1000.0
+                    metrics.observe('mpd.get_status', self.last_rtt_ms)
+                    trace.record('mpd', 'status', status)
+                    return status
+            except Exception:
+                self._drop_connection()
+                metrics.incr('mpd.errors')
+                log.error("Failed to get MPD status")
+            trace.record('mpd', 'status', None)
+            return None
 
     def get_current_song(self) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            try:
+                if self.connect():
+                    with metrics.timer('mpd.get_current_song'):
+                        song = self._client.currentsong()
+                    trace.record('mpd', 'currentsong', song)
+                    return song
+            except Exception:
+                self._drop_connection()
+                metrics.incr('mpd.errors')
+                log.error("Failed to get current song")
+            trace.record('mpd', 'currentsong', None)
+            return None
+
+    def get_song(self, song_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            try:
+                if self.connect():
+                    with metrics.timer('mpd.get_song'):
+                        songs = self._client.playlistid(song_id)
+                    song = songs[0] if songs else None
+                    trace.record('mpd', 'playlistid', song)
+                    return song
+            except Exception:
+                self._drop_connection()
+                metrics.incr('mpd.errors')
+                log.error(f"Failed to get song {song_id}")
+            trace.record('mpd', 'playlistid', None)
+            return None
+
+    def wait_idle(self, wake_fd: Optional[int] = None, timeout: Optional[float] = None,
+                  subsystems: Sequence[str] = ()) -> Optional[List[str]]:
+        if not self.begin_idle(subsystems):
+            return []
+
+        readers = [self._client] + ([wake_fd] if wake_fd is not None else [])
         try:
-            if self.connect():
-                song = self._client.currentsong()
-                return song
-        except Exception:
-            self._connected = False
-            log.error("Failed to get current song")
-        return None
+            ready, _, _ = select.select(readers, [], [], timeout)
+        except (OSError, ValueError):
+            ready = [wake_fd]
+        return self.end_idle(self._client in ready, bool(ready))
+
+    def begin_idle(self, subsystems: Sequence[str] = ()) -> bool:
+        with self._lock:
+            try:
+                if not self.connect():
+                    return False
+                self._send_idle(subsystems)
+                self._idling = True
+                return True
+            except Exception:
+                self._drop_connection()
+                metrics.incr('mpd.errors')
+                return False
+
+    def end_idle(self, readable: bool, woken: bool = False) -> Optional[List[str]]:
+        with self._lock:
+            if not self._idling:
+                return []
+            try:
+                self._idling = False
+                if readable:
+                    return self._fetch_idle()
+                changed = self._noidle()
+                if changed or woken:
+                    return list(changed or ['wake'])
+                return None
+            except Exception:
+                self._drop_connection()
+                metrics.incr('mpd.errors')
+                log.error("MPD idle wait failed")
+                return []
 
-    def wait_for_mpd(self, max_attempts: int = 30, wait_interval: int = 2) -> bool:
+    def _send_idle(self, subsystems: Sequence[str]) -> None:
+        if self._legacy_idle:
+            self._client.send_idle(*subsystems)
+        else:
+            self._client._write_command('idle', subsystems)
+
+    def _fetch_idle(self) -> List[str]:
+        if self._legacy_idle:
+            return self._client.fetch_idle()
+        return [line.partition(': ')[2] for line in self._client._read_lines()]
+
+    def _noidle(self) -> List[str]:
+        if self._legacy_idle:
+            return self._client.noidle()
+        self._client._write_command('noidle')
+        return self._fetch_idle()
+
+    def wait_for_mpd(self, timeout: float = 60, poll_interval: float = 0.25,
+                     on_wait: Optional[Callable[[], None]] = None,
+                     cancelled: Optional[Callable[[], bool]] = None) -> bool:
         log.wait("Waiting for MPD...")
+        started = time.monotonic()
+        attempt = 0
 
-        for attempt in range(max_attempts):
+        while True:
+            if cancelled and cancelled():
+                return False
+            attempt += 1
             try:
                 sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                 sock.settimeout(1)
@@ -66,36 +195,135 @@ class MPDClient:
             except Exception:
                 pass
 
-            if attempt < max_attempts - 1:
-                log.debug(f"MPD not ready, attempt {attempt + 1}/{max_attempts}, waiting {wait_interval}s...")
-                time.sleep(wait_interval)
+            waited = time.monotonic() - started
+            if waited >= timeout:
+                break
+            if attempt % 8 == 1:
+                log.debug("MPD not ready after %.1fs, polling every %ss...", waited, poll_interval)
+            if on_wait:
+                on_wait()
+            time.sleep(poll_interval)
 
-        log.error("MPD timeout after 60 seconds")
+        log.error(f"MPD timeout after {timeout:g} seconds")
         return False
 
     def close(self) -> None:
-        if self._connected:
-            try:
+        with self._lock:
+            if self._connected:
                 log.debug("Closing MPD connection")
-                self._client.close()
-                self._client.disconnect()
+                try:
+                    if not self._idling:
+                        self._client.close()
+                except Exception:
+                    log.error("Error closing MPD connection")
+                finally:
+                    self._drop_connection()
                 log.ok("MPD connection closed")
-            except Exception:
-                log.error("Error closing MPD connection")
-            finally:
-                self._connected = False
 
-    def get_playlist_info(self) -> Dict[str, Any]:
+    def stop_playback(self, lock_timeout: float = 0.2) -> bool:
+        if not self._lock.acquire(timeout=lock_timeout):
+            log.debug("MPD connection busy, cannot stop playback through it")
+            return False
         try:
             if self.connect():
-                status = self._client.status()
-                playlist = self._client.playlistinfo()
-                return {
-                    'total_tracks': int(status.get('playlistlength', 0)),
-                    'tracks': playlist
-                }
+                if self._idling:
+                    self._idling = False
+                    self._noidle()
+                self._client.stop()
+                log.ok("Playback stopped")
+                return True
         except Exception:
-            self._connected = False
-            log.error("Failed to get playlist info")
-        return {'total_tracks': 0, 'tracks': []}
+            self._drop_connection()
+            metrics.incr('mpd.errors')
+            log.error("Failed to stop playback")
+        finally:
+            self._lock.release()
+        return False
+
+    def get_playlist_info(self) -> Dict[str, Any]:
+        with self._lock:
+            try:
+                if self.connect():
+                    with metrics.timer('mpd.get_playlist_info'):
+                        status = self._client.status()
+                        playlist = self._client.playlistinfo()
+                    playlist_info = {
+                        'total_tracks': int(status.get('playlistlength', 0)),
+                        'tracks': playlist
+                    }
+                    trace.record('mpd', 'playlistinfo', playlist_info)
+                    return playlist_info
+            except Exception:
+                self._drop_connection()
+                metrics.incr('mpd.errors')
+                log.error("Failed to get playlist info")
+            trace.record('mpd', 'playlistinfo', None)
+            return {'total_tracks': 0, 'tracks': []}
+
+    def get_stats(self) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            try:
+                if self.connect():
+                    return self._client.stats()
+            except Exception:
+                self._drop_connection()
+                metrics.incr('mpd.errors')
+                log.error("Failed to get MPD stats")
+            return None
+
+    def list_grouped(self, tag: str, group: str) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            try:
+                if self.connect():
+                    with metrics.timer('mpd.list'):
+                        return _group_rows(self._client.list(tag, 'group', group), group)
+            except Exception:
+                self._drop_connection()
+                metrics.incr('mpd.errors')
+                log.error(f"Failed to list {tag} grouped by {group}")
+            return None
+
+    def count_grouped(self, group: str, *filters: str) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            try:
+                if self.connect():
+                    with metrics.timer('mpd.count'):
+                        return _group_rows(self._client.count(*filters, 'group', group), group)
+            except Exception:
+                self._drop_connection()
+                metrics.incr('mpd.errors')
+                log.error(f"Failed to count songs grouped by {group}")
+            return None
+
+    def play_album(self, albumartist: str, album: str) -> bool:
+        with self._lock:
+            try:
+                if self.connect():
+                    with metrics.timer('mpd.play_album'):
+                        self._client.command_list_ok_begin()
+                        self._client.random(0)
+                        self._client.single(0)
+                        self._client.clear()
+                        self._client.findadd('albumartist', albumartist, 'album', album)
+                        self._client.play(0)
+                        self._client.command_list_end()
+                    return True
+            except Exception:
+                self._drop_connection()
+                metrics.incr('mpd.errors')
+                log.error(f"Failed to queue album {album}")
+            return False
+
+def _group_rows(result: Any, group: str) -> List[Dict[str, Any]]:
+    if isinstance(result, list):
+        return result
+    if not result:
+        return []
+    keys = result.get(group)
+    if not isinstance(keys, list):
+        return [result]
+    return [
+        {key: value[i] if isinstance(value, list) else value for key, value in result.items()}
+        for i in range(len(keys))
+    ]
 
@@ -0,0 +1,74 @@
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from src.utils.logger import Logger
+from src.utils.metrics import Metrics
+
+log = Logger()
+metrics = Metrics()
+
+Step = Tuple[str, Callable[[], None]]
+
+_deadline_at: Optional[float] = None
+
+def current_deadline() -> Optional[float]:
+    return _deadline_at
+
+class ShutdownSequencer:
+    def __init__(self, deadline: float = 3.0, deadline_at: Optional[float] = None) -> None:
+        self.deadline = max(0.1, float(deadline))
+        self.deadline_at = deadline_at
+        self.timings: Dict[str, float] = {}
+        self.timed_out: List[str] = []
+
+    def run(self, stages: Sequence[List[Step]]) -> bool:
+        global _deadline_at
+        started = time.monotonic()
+        end = self.deadline_at if self.deadline_at is not None else started + self.deadline
+        outermost = _deadline_at is None
+        if outermost:
+            _deadline_at = end
+        try:
+            return self._run_stages(stages, started, end)
+        finally:
+            if outermost:
+                _deadline_at = None
+
+    def _run_stages(self, stages: Sequence[List[Step]], started: float, end: float) -> bool:
+        completed = True
+
+        for stage in stages:
+            threads = []
+            for name, step in stage:
+                thread = threading.Thread(
+                    target=self._run_step, args=(name, step),
+                    name=f"shutdown-{name}", daemon=True
+                )
+                thread.start()
+                threads.append((name, thread))
+
+            timed_out = []
+            for name, thread in threads:
+                thread.join(max(0.0, end - time.monotonic()))
+                if thread.is_alive():
+                    timed_out.append(name)
+
+            if timed_out:
+                self.timed_out.extend(timed_out)
+                log.error(f"Shutdown deadline of {end - started:.1f}s exceeded by: {', '.join(timed_out)}")
+                completed = False
+
+        log.debug("Shutdown sequence finished in %.0f ms", (time.monotonic() - started) * 1000.0)
+        return completed
+
+    def _run_step(self, name: str, step: Callable[[], None]) -> None:
+        started = time.monotonic()
+        try:
+            step()
+        except Exception as e:
+            log.error(f"Shutdown step {name} failed: {e}")
+        finally:
+            elapsed_ms = (time.monotonic() - started) * 1000.0
+            self.timings[name] = elapsed_ms
+            metrics.observe(f'shutdown.{name}', elapsed_ms)
+            log.debug("Shutdown step %s: %.0f ms", name, elapsed_ms)
@@ -1,8 +1,11 @@
+from src.core.config import Config
+from src.core.shutdown import ShutdownSequencer
+from src.core.systemd import SystemdNotifier
 from src.utils.logger import Logger
-from typing import Callable
+from src.utils.metrics import Metrics
+from typing import Callable, Optional
 import signal
 import sys
-import time
 import subprocess
 
 log = Logger()
@@ -14,6 +17,9 @@ class SignalHandler:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._cleanup_callbacks = []
+            cls._instance._playback_stop = None
+            cls._instance._stop = None
+            cls._instance._shutdown_signal = None
             cls._instance._initialized = False
             cls._instance._shutdown_in_progress = False
         return cls._instance
@@ -26,49 +32,71 @@ class SignalHandler:
     def _setup_signals(self) -> None:
         signal.signal(signal.SIGTERM, self._handle_shutdown)
         signal.signal(signal.SIGINT, self._handle_shutdown)
+        signal.signal(signal.SIGUSR1, self._handle_metrics_dump)
         log.debug("Signal handlers initialized")
 
     def register_cleanup(self, callback: Callable) -> None:
         if callback not in self._cleanup_callbacks:
             self._cleanup_callbacks.append(callback)
-            log.debug(f"Registered cleanup: {callback.__name__}")
+            log.debug("Registered cleanup: %s", callback.__name__)
+
+    def register_playback_stop(self, callback: Optional[Callable[[], bool]]) -> None:
+        self._playback_stop = callback
+
+    def register_stop(self, callback: Callable[[], None]) -> None:
+        self._stop = callback
+        if self._shutdown_in_progress:
+            callback()
+
+    @property
+    def shutdown_requested(self) -> bool:
+        return self._shutdown_in_progress
+
+    def _stop_playback(self) -> None:
+        if self._playback_stop and self._playback_stop():
+            return
+        subprocess.run(["mpc", "stop"], check=True, timeout=2)
+
+    def _handle_metrics_dump(self, signum: int, frame) -> None:
+        Metrics().dump_async()
 
     def _handle_shutdown(self, signum: int, frame) -> None:
         if self._shutdown_in_progress:
             return
-        
         self._shutdown_in_progress = True
-        signal_name = signal.Signals(signum).name
+        self._shutdown_signal = signum
+        if self._stop:
+            self._stop()
+
+    def run_shutdown(self) -> None:
+        signum = self._shutdown_signal
+        signal_name = signal.Signals(signum).name if signum else "none"
         log.info(f"Received signal: {signal_name}")
+        SystemdNotifier().stopping()
         
-        try:
-            log.info("Stopping audio playback...")
-            subprocess.run(["mpc", "stop"], check=True, timeout=2)
-            time.sleep(1.0)
-        except Exception as e:
-            log.error(f"Error stopping audio: {e}")
-        
-        for i, callback in enumerate(reversed(self._cleanup_callbacks)):
-            try:
-                log.debug(f"Executing cleanup {i+1}/{len(self._cleanup_callbacks)}: {callback.__name__}")
-                callback()
-                log.debug(f"Cleanup {callback.__name__} completed")
-            except Exception as e:
-                log.error(f"Cleanup error in {callback.__name__}: {e}")
-                continue
-        
-        log.debug("Waiting for hardware shutdown...")
-        time.sleep(0.5)
-        
+        sequencer = ShutdownSequencer(Config().get('timing.shutdown_deadline', 3))
+        cleanup_steps = [(callback.__name__, callback) for callback in reversed(self._cleanup_callbacks)]
+        log.info("Stopping audio playback...")
+        complete = sequencer.run([[("stop_playback", self._stop_playback)], cleanup_steps])
+        log.info("Shutdown steps: " + ", ".join(f"{name} {ms:.0f} ms" for name, ms in sequencer.timings.items()))
+        if complete:
+            status = "Cleanup complete."
+        else:
+            status = f"Cleanup incomplete, timed out: {', '.join(sequencer.timed_out)}."
+            log.error(status)
+
         if signum == signal.SIGINT:
-            log.ok("Cleanup complete. Powering off system.")
+            if complete:
+                log.ok(f"{status} Powering off system.")
             try:
                 log.info("Initiating system poweroff...")
+                log.flush()
                 subprocess.run(["poweroff"], check=True)
             except Exception as e:
                 log.error(f"Failed to power off system: {e}")
                 sys.exit(1)
             sys.exit(0)
         else:
-            log.ok("Cleanup complete. Exiting service without poweroff.")
+            if complete:
+                log.ok(f"{status} Exiting service without poweroff.")
             sys.exit(0)
\ No newline at end of file
@@ -0,0 +1,62 @@
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional
+from src.utils.metrics import Metrics
+
+metrics = Metrics()
+
+class SongRecord(NamedTuple):
+    track: Optional[int]
+    duration: float
+    file: str
+    title: str
+    artist: str
+
+    @classmethod
+    def from_mpd(cls, song: Dict[str, Any]) -> 'SongRecord':
+        track = str(song.get('track', '0'))
+        try:
+            duration = float(song.get('duration', song.get('time', 0)))
+        except (ValueError, TypeError):
+            duration = 0.0
+        return cls(
+            track=int(track) if track.isdigit() else None,
+            duration=duration,
+            file=song.get('file', ''),
+            title=song.get('title', ''),
+            artist=song.get('artist', '')
+        )
+
+class SongCache:
+    def __init__(self, max_size: int = 128) -> None:
+        self.max_size = max(1, int(max_size))
+        self.hits = 0
+        self.misses = 0
+        self._songs: 'OrderedDict[str, SongRecord]' = OrderedDict()
+        self._playlist_version = None
+
+    def _check_version(self, playlist_version: Optional[str]) -> None:
+        if playlist_version is not None and playlist_version != self._playlist_version:
+            self._songs.clear()
+            self._playlist_version = playlist_version
+
+    def get(self, song_id: str, playlist_version: Optional[str] = None) -> Optional[SongRecord]:
+        self._check_version(playlist_version)
+        record = self._songs.get(song_id)
+        if record is None:
+            self.misses += 1
+            metrics.incr('song_cache.misses')
+            return None
+        self._songs.move_to_end(song_id)
+        self.hits += 1
+        metrics.incr('song_cache.hits')
+        return record
+
+    def put(self, song_id: str, record: SongRecord, playlist_version: Optional[str] = None) -> None:
+        self._check_version(playlist_version)
+        self._songs[song_id] = record
+        self._songs.move_to_end(song_id)
+        while len(self._songs) > self.max_size:
+            self._songs.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        return {'size': len(self._songs), 'hits': self.hits, 'misses': self.misses}
@@ -0,0 +1,183 @@
+import argparse
+import json
+import mmap
+import os
+import struct
+import time
+from typing import Any, Dict, NamedTuple, Optional
+
+MAGIC = b'A3SB'
+VERSION = 1
+HEADER = struct.Struct('<4sHHI')
+BODY = struct.Struct('<ddddBbBBBB2xiiii16sI')
+SIZE = HEADER.size + BODY.size
+SEQ_OFFSET = 8
+SEQ = struct.Struct('<I')
+DEFAULT_PATH = '/dev/shm/adam3-gpio-state'
+
+STATES = ('stop', 'play', 'pause')
+
+class PlayerState(NamedTuple):
+    updated_at: float = 0.0
+    elapsed: float = 0.0
+    duration: float = 0.0
+    playlist_total: float = -1.0
+    state: str = 'stop'
+    volume: int = -1
+    repeat: bool = False
+    random: bool = False
+    single: int = 0
+    consume: bool = False
+    track: int = -1
+    playlist_length: int = 0
+    song_id: int = -1
+    playlist_version: int = 0
+    display_mode: str = ''
+    pid: int = 0
+
+    @classmethod
+    def from_mpd(cls, status: Dict[str, Any], **extra: Any) -> 'PlayerState':
+        def number(key: str, default: Any, kind: type = float) -> Any:
+            try:
+                return kind(status.get(key, default))
+            except (TypeError, ValueError):
+                return default
+
+        single = status.get('single', '0')
+        return cls(
+            elapsed=number('elapsed', 0.0),
+            duration=number('duration', 0.0),
+            state=status.get('state', 'stop'),
+            volume=number('volume', -1, int),
+            repeat=status.get('repeat', '0') == '1',
+            random=status.get('random', '0') == '1',
+            single=2 if single == 'oneshot' else int(single == '1'),
+            consume=status.get('consume', '0') == '1',
+            track=number('song', -2, int) + 1,
+            playlist_length=number('playlistlength', 0, int),
+            song_id=number('songid', -1, int),
+            playlist_version=number('playlist', 0, int),
+            **extra
+        )
+
+    def pack(self) -> bytes:
+        return BODY.pack(
+            self.updated_at, self.elapsed, self.duration, self.playlist_total,
+            STATES.index(self.state) if self.state in STATES else 0,
+            max(-1, min(127, self.volume)),
+            self.repeat, self.random, self.single, self.consume,
+            self.track, self.playlist_length, self.song_id, self.playlist_version,
+            self.display_mode.encode()[:16], self.pid
+        )
+
+    @classmethod
+    def unpack(cls, data: bytes) -> 'PlayerState':
+        fields = list(BODY.unpack(data))
+        fields[4] = STATES[fields[4]] if fields[4] < len(STATES) else 'stop'
+        for index in (6, 7, 9):
+            fields[index] = bool(fields[index])
+        fields[14] = fields[14].rstrip(b'\0').decode(errors='replace')
+        return cls(*fields)
+
+def _map(path: str, writable: bool) -> mmap.mmap:
+    flags = os.O_RDWR | os.O_CREAT if writable else os.O_RDONLY
+    fd = os.open(path, flags, 0o644)
+    try:
+        if writable and os.fstat(fd).st_size != SIZE:
+            os.ftruncate(fd, SIZE)
+        access = mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+        return mmap.mmap(fd, SIZE, access=access)
+    finally:
+        os.close(fd)
+
+class StateBusWriter:
+    def __init__(self, path: str = DEFAULT_PATH) -> None:
+        self.path = path
+        self._map = _map(path, True)
+        self._seq = 0
+        HEADER.pack_into(self._map, 0, MAGIC, VERSION, SIZE, self._seq)
+        self._last = None
+
+    def publish(self, state: PlayerState) -> bool:
+        body = state._replace(updated_at=0.0).pack()
+        if body == self._last:
+            return False
+        self._last = body
+        self._seq += 1
+        SEQ.pack_into(self._map, SEQ_OFFSET, self._seq)
+        self._map[HEADER.size:SIZE] = state.pack()
+        self._seq += 1
+        SEQ.pack_into(self._map, SEQ_OFFSET, self._seq)
+        return True
+
+    def close(self, unlink: bool = True) -> None:
+        try:
+            self._map.close()
+            if unlink:
+                os.unlink(self.path)
+        except (OSError, BufferError, ValueError):
+            pass
+
+class StateBusReader:
+    def __init__(self, path: str = DEFAULT_PATH) -> None:
+        self.path = path
+        self._map = _map(path, False)
+        magic, version, size, _ = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION or size != SIZE:
+            self._map.close()
+            raise ValueError(f"{path} is not a version {VERSION} state bus")
+
+    def sequence(self) -> int:
+        return SEQ.unpack_from(self._map, SEQ_OFFSET)[0]
+
+    def read(self, retries: int = 1000) -> Optional[PlayerState]:
+        for _ in range(retries):
+            before = self.sequence()
+            if before & 1:
+                continue
+            data = self._map[HEADER.size:SIZE]
+            if self.sequence() == before:
+                return PlayerState.unpack(data) if before else None
+        return None
+
+    def close(self) -> None:
+        self._map.close()
+
+def read_state(path: str = DEFAULT_PATH) -> Optional[PlayerState]:
+    try:
+        reader = StateBusReader(path)
+    except (OSError, ValueError):
+        return None
+    try:
+        return reader.read()
+    finally:
+        reader.close()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Print the player state published by adam3-gpio')
+    parser.add_argument('--path', default=DEFAULT_PATH)
+    parser.add_argument('--field', help='Print a single field')
+    parser.add_argument('--watch', type=float, metavar='SECONDS',
+                        help='Print on every change, polling at this interval')
+    args = parser.parse_args()
+
+    try:
+        reader = StateBusReader(args.path)
+    except (OSError, ValueError) as e:
+        raise SystemExit(f"State bus unavailable: {e}")
+
+    last_seq = None
+    while True:
+        seq = reader.sequence()
+        if seq != last_seq:
+            last_seq = seq
+            state = reader.read()
+            if state is not None:
+                output = getattr(state, args.field) if args.field else json.dumps(state._asdict())
+                print(output, flush=True)
+        if not args.watch:
+            break
+        time.sleep(args.watch)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+import threading
+from typing import Any, Callable, Generic, Tuple, TypeVar
+
+T = TypeVar('T')
+
+class Store(Generic[T]):
+    def __init__(self, initial: T, name: str = 'store') -> None:
+        self.name = name
+        self._snapshot: Tuple[int, T] = (0, initial)
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> T:
+        return self._snapshot[1]
+
+    @property
+    def version(self) -> int:
+        return self._snapshot[0]
+
+    def snapshot(self) -> Tuple[int, T]:
+        return self._snapshot
+
+    def update(self, **changes: Any) -> bool:
+        return self.apply(lambda state: state._replace(**changes))
+
+    def apply(self, change: Callable[[T], T]) -> bool:
+        with self._lock:
+            version, state = self._snapshot
+            updated = change(state)
+            if updated == state:
+                return False
+            self._snapshot = (version + 1, updated)
+            return True
@@ -0,0 +1,104 @@
+import os
+import socket
+import time
+from typing import Callable, Optional
+from src.utils.logger import Logger
+from src.utils.metrics import Metrics
+
+log = Logger()
+metrics = Metrics()
+
+class SystemdNotifier:
+    _instance = None
+
+    def __new__(cls) -> 'SystemdNotifier':
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self) -> None:
+        if self._initialized:
+            return
+        self._initialized = True
+        self._sock = None
+        self._address = None
+        self.ready_sent = False
+        self.tick_budget = 2.0
+        self.status_interval = 5.0
+        self.watchdog_interval = None
+        self._last_ping = 0.0
+        self._last_status = time.monotonic()
+        self._ticks = 0
+
+        address = os.environ.get('NOTIFY_SOCKET')
+        if address:
+            if address.startswith('@'):
+                address = '\0' + address[1:]
+            try:
+                self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+                self._address = address
+            except OSError as e:
+                log.error(f"systemd notify socket failed: {e}")
+
+        watchdog_usec = os.environ.get('WATCHDOG_USEC')
+        watchdog_pid = os.environ.get('WATCHDOG_PID')
+        if watchdog_usec and (not watchdog_pid or watchdog_pid == str(os.getpid())):
+            try:
+                self.watchdog_interval = int(watchdog_usec) / 1e6 / 2
+                log.debug("systemd watchdog enabled, pinging every %.1fs", self.watchdog_interval)
+            except ValueError:
+                self.watchdog_interval = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._sock is not None
+
+    def configure(self, tick_budget: float, status_interval: float) -> None:
+        self.tick_budget = max(0.1, float(tick_budget))
+        self.status_interval = max(1.0, float(status_interval))
+
+    def notify(self, state: str) -> bool:
+        if not self._sock:
+            return False
+        try:
+            self._sock.sendto(state.encode(), self._address)
+            return True
+        except OSError as e:
+            log.debug("systemd notify failed: %s", e)
+            return False
+
+    def ready(self) -> None:
+        if not self.ready_sent:
+            self.ready_sent = self.notify("READY=1")
+
+    def stopping(self) -> None:
+        self.notify("STOPPING=1")
+
+    def status(self, text: str) -> None:
+        self.notify(f"STATUS={text}")
+
+    def keepalive(self) -> None:
+        if self.watchdog_interval and self.notify("WATCHDOG=1"):
+            self._last_ping = time.monotonic()
+
+    def loop_tick(self, duration: float, describe: Optional[Callable[[], str]] = None) -> None:
+        if not self._sock:
+            return
+        now = time.monotonic()
+        self._ticks += 1
+
+        if duration > self.tick_budget:
+            metrics.incr('watchdog.late_ticks')
+        elif self.watchdog_interval and now - self._last_ping >= self.watchdog_interval / 2:
+            if self.notify("WATCHDOG=1"):
+                self._last_ping = now
+
+        window = now - self._last_status
+        if window >= self.status_interval:
+            text = f"{self._ticks / window:.1f} ticks/s"
+            if describe:
+                text = f"{text}, {describe()}"
+            self.status(text)
+            self._ticks = 0
+            self._last_status = now
@@ -0,0 +1,63 @@
+import os
+import struct
+from typing import NamedTuple, Optional
+from src.utils.logger import Logger
+
+log = Logger()
+
+MAGIC = b'A3WS'
+VERSION = 2
+LAYOUT = struct.Struct('<4sHxxdQIdiiBbd')
+
+STATES = ('stop', 'play', 'pause')
+
+class WarmState(NamedTuple):
+    saved_at: float = 0.0
+    playlist_version: int = 0
+    track_count: int = 0
+    playlist_total: float = 0.0
+    song_id: int = -1
+    track: int = -1
+    state: str = 'stop'
+    volume: int = -1
+    elapsed: float = 0.0
+
+    def pack(self) -> bytes:
+        return LAYOUT.pack(
+            MAGIC, VERSION, self.saved_at, self.playlist_version, self.track_count,
+            self.playlist_total, self.song_id, self.track,
+            STATES.index(self.state) if self.state in STATES else 0,
+            max(-1, min(127, self.volume)), self.elapsed
+        )
+
+    @classmethod
+    def unpack(cls, data: bytes) -> Optional['WarmState']:
+        if len(data) != LAYOUT.size:
+            return None
+        (magic, version, saved_at, playlist_version, track_count, playlist_total,
+         song_id, track, state, volume, elapsed) = LAYOUT.unpack(data)
+        if magic != MAGIC or version != VERSION:
+            return None
+        return cls(
+            saved_at, playlist_version, track_count, playlist_total, song_id, track,
+            STATES[state] if state < len(STATES) else 'stop',
+            volume, elapsed
+        )
+
+def load_warm_state(path: str) -> Optional[WarmState]:
+    try:
+        with open(path, 'rb') as f:
+            return WarmState.unpack(f.read(LAYOUT.size + 1))
+    except OSError:
+        return None
+
+def save_warm_state(path: str, state: WarmState) -> bool:
+    temp_file = f"{path}.tmp"
+    try:
+        with open(temp_file, 'wb') as f:
+            f.write(state.pack())
+        os.replace(temp_file, path)
+        return True
+    except OSError as e:
+        log.error(f"Warm state save failed: {e}")
+        return False
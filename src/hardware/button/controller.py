@@ -1,24 +1,29 @@
 import os
-import time
 import subprocess
 import signal
+from typing import Callable, Optional
 
-from gpiozero import Button
 from src.core.config import Config
+from src.utils.clock import Clock, SYSTEM_CLOCK
 from src.utils.logger import Logger
 from src.utils.paths import PROJECT_ROOT
 
 log = Logger()
 
 class ButtonController:
-    def __init__(self) -> None:
-        self.config = Config()
+    def __init__(self, config: Optional[Config] = None, clock: Optional[Clock] = None) -> None:
+        self.config = config or Config()
+        self.clock = clock or SYSTEM_CLOCK
         self.last_command_time = 0
         self.press_start_time = None
+        self.on_activity: Optional[Callable[[], None]] = None
+        self.on_short_press: Optional[Callable[[], None]] = None
         
         self.command_cooldown = self.config.get('timing.command_cooldown', 0.5)
         self.long_press_time = self.config.get('timing.long_press_time', 2)
         
+        from gpiozero import Button
+
         button_pin = self.config.get('gpio.button', 20)
         self.button = Button(button_pin, pull_up=True, bounce_time=0.1)
         self.button.when_pressed = self._on_press
@@ -27,16 +32,18 @@ class ButtonController:
         log.ok("Button initialized")
 
     def _on_press(self) -> None:
-        self.press_start_time = time.time()
+        self.press_start_time = self.clock.time()
+        if self.on_activity:
+            self.on_activity()
 
     def _on_release(self) -> None:
         if self.press_start_time is None:
             return
 
-        press_duration = time.time() - self.press_start_time
+        press_duration = self.clock.time() - self.press_start_time
         self.press_start_time = None
         
-        current_time = time.time()
+        current_time = self.clock.time()
         if (current_time - self.last_command_time) < self.command_cooldown:
             return
         
@@ -46,7 +53,10 @@ class ButtonController:
             self._execute_short_press()
 
     def _execute_short_press(self) -> None:
-        self.last_command_time = time.time()
+        self.last_command_time = self.clock.time()
+        if self.on_short_press:
+            self.on_short_press()
+            return
         script_path = self.config.get('paths.roulette', 'scripts/roulette.sh')
         full_script_path = os.path.join(PROJECT_ROOT, script_path)
         
@@ -54,7 +64,7 @@ class ButtonController:
             subprocess.run(['sudo', full_script_path], check=True)
 
     def _execute_long_press(self) -> None:
-        self.last_command_time = time.time()
+        self.last_command_time = self.clock.time()
         os.kill(os.getpid(), signal.SIGINT)
 
     def cleanup(self) -> None:
@@ -1,7 +1,10 @@
+from .segment_display import SegmentDisplay
 from .tm1652 import TM1652
+from .transitions import TransitionDisplay
+from .pipeline import DisplayOutput, DisplayPipeline, create_display
 from src.utils.logger import Logger
 
 log = Logger()
 log.debug("Initializing display module")
 
-__all__ = ["TM1652"]
+__all__ = ["SegmentDisplay", "TM1652", "DisplayOutput", "DisplayPipeline", "TransitionDisplay", "create_display"]
@@ -0,0 +1,64 @@
+from typing import Dict, List, Tuple
+
+Frame = Tuple[int, int, int, int]
+
+_GLYPHS = {
+    '0': 0x3F, '1': 0x06, '2': 0x5B, '3': 0x4F, '4': 0x66,
+    '5': 0x6D, '6': 0x7D, '7': 0x07, '8': 0x7F, '9': 0x6F,
+    'A': 0x77, 'B': 0x7C, 'C': 0x39, 'D': 0x5E, 'E': 0x79,
+    'F': 0x71, 'G': 0x3D, 'H': 0x76, 'I': 0x30, 'J': 0x1E,
+    'K': 0x75, 'L': 0x38, 'M': 0x37, 'N': 0x54, 'O': 0x3F,
+    'P': 0x73, 'Q': 0x67, 'R': 0x50, 'S': 0x6D, 'T': 0x78,
+    'U': 0x3E, 'V': 0x1C, 'W': 0x2A, 'X': 0x76, 'Y': 0x6E,
+    'Z': 0x5B,
+    'b': 0x7C, 'c': 0x58, 'd': 0x5E, 'h': 0x74, 'i': 0x10,
+    'n': 0x54, 'o': 0x5C, 'r': 0x50, 't': 0x78, 'u': 0x1C,
+    ' ': 0x00, '-': 0x40, '_': 0x08, '=': 0x48, '"': 0x22,
+    "'": 0x02, '`': 0x20, '[': 0x39, ']': 0x0F, '(': 0x39,
+    ')': 0x0F, '?': 0x53, '/': 0x52, '\\': 0x64, '|': 0x30,
+    '^': 0x23, ',': 0x04, '.': 0x08, '!': 0x06, '*': 0x63,
+    '+': 0x46, '<': 0x58, '>': 0x4C,
+}
+
+FONT: Dict[str, int] = {**{k.lower(): v for k, v in _GLYPHS.items()}, **_GLYPHS}
+
+def encode_text(text: str) -> List[int]:
+    return [FONT.get(ch, 0x00) for ch in text]
+
+class Marquee:
+    def __init__(self, text: str, fps: float = 4.0, width: int = 4, loop: bool = False,
+                 hold: float = 0.0) -> None:
+        self.fps = max(0.5, float(fps))
+        self.loop = loop
+        self.hold = hold
+        self.started_at = 0.0
+        segments = encode_text(text)
+        if len(segments) <= width:
+            padded = segments + [0x00] * (width - len(segments))
+            self.frames: List[Frame] = [tuple(padded)]
+        else:
+            strip = [0x00] * width + segments + [0x00] * width
+            self.frames = [tuple(strip[i:i + width]) for i in range(len(strip) - width + 1)]
+
+    @property
+    def duration(self) -> float:
+        return max(len(self.frames) / self.fps, self.hold)
+
+    def start(self, now: float) -> None:
+        self.started_at = now
+
+    def finished(self, now: float) -> bool:
+        return not self.loop and now - self.started_at >= self.duration
+
+    def next_change(self, now: float) -> float:
+        if now < self.started_at:
+            return self.started_at
+        if len(self.frames) == 1:
+            return float('inf') if self.loop else self.started_at + self.duration
+        return self.started_at + (int((now - self.started_at) * self.fps) + 1) / self.fps
+
+    def frame_at(self, now: float) -> Frame:
+        index = int((now - self.started_at) * self.fps)
+        if self.loop:
+            return self.frames[index % len(self.frames)]
+        return self.frames[max(0, min(index, len(self.frames) - 1))]
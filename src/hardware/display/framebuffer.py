@@ -0,0 +1,121 @@
+import os
+from typing import Any, Dict, Optional, Tuple
+from src.core.config import Config
+from src.hardware.display.segment_display import SegmentDisplay
+from src.utils.clock import Clock
+from src.utils.logger import Logger
+from src.utils.metrics import Metrics
+
+log = Logger()
+metrics = Metrics()
+
+class FramebufferDisplay(SegmentDisplay):
+    def __init__(self, config: Optional[Config] = None, clock: Optional[Clock] = None,
+                 settings: Optional[Dict[str, Any]] = None) -> None:
+        super().__init__(config, clock)
+        settings = settings or {}
+        self.device = settings.get('device', '/dev/fb1')
+        self.color = self._parse_color(settings.get('color', '#ff3000'))
+        self.width, self.height, self.bpp, self.stride = self._geometry(settings)
+        self._level = self._brightness
+        self._fd: Optional[int] = None
+        try:
+            self._fd = os.open(self.device, os.O_WRONLY)
+            log.ok(f"Framebuffer display initialized on {self.device} ({self.width}x{self.height}, {self.bpp} bpp)")
+        except OSError as e:
+            log.error(f"Failed to open framebuffer {self.device}: {e}")
+
+    def _geometry(self, settings: Dict[str, Any]) -> Tuple[int, int, int, int]:
+        sysfs = f"/sys/class/graphics/{os.path.basename(self.device)}"
+        width, height, bpp, stride = 320, 240, 16, 0
+        try:
+            with open(f"{sysfs}/virtual_size") as f:
+                width, height = (int(v) for v in f.read().strip().split(','))
+            with open(f"{sysfs}/bits_per_pixel") as f:
+                bpp = int(f.read().strip())
+            with open(f"{sysfs}/stride") as f:
+                stride = int(f.read().strip())
+        except (OSError, ValueError):
+            pass
+        width = settings.get('width', width)
+        height = settings.get('height', height)
+        bpp = settings.get('bpp', bpp)
+        stride = settings.get('stride', stride) or width * (bpp // 8)
+        return width, height, bpp, stride
+
+    @staticmethod
+    def _parse_color(value: str) -> Tuple[int, int, int]:
+        value = value.lstrip('#')
+        return int(value[0:2], 16), int(value[2:4], 16), int(value[4:6], 16)
+
+    def _pixel(self) -> bytes:
+        scale = self._level / 8.0
+        r, g, b = (int(c * scale) for c in self.color)
+        if self.bpp == 16:
+            return (((r >> 3) << 11) | ((g >> 2) << 5) | (b >> 3)).to_bytes(2, 'little')
+        if self.bpp == 24:
+            return bytes((b, g, r))
+        return bytes((b, g, r, 0))
+
+    def _fill(self, buf: bytearray, x: int, y: int, w: int, h: int, pixel: bytes) -> None:
+        row = pixel * w
+        offset = x * len(pixel)
+        for line in range(y, y + h):
+            start = line * self.stride + offset
+            buf[start:start + len(row)] = row
+
+    def _render(self, frame: bytes) -> bytearray:
+        buf = bytearray(self.stride * self.height)
+        pixel = self._pixel()
+        cell = self.width // 4
+        pad = cell // 8
+        w = cell - 2 * pad
+        h = self.height - 2 * pad
+        t = max(1, w // 6)
+        half = h // 2
+        for i, seg in enumerate(frame[:4]):
+            x, y = i * cell + pad, pad
+            rects = (
+                (x + t, y, w - 2 * t, t),
+                (x + w - t, y + t, t, half - t),
+                (x + w - t, y + half, t, half - t),
+                (x + t, y + h - t, w - 2 * t, t),
+                (x, y + half, t, half - t),
+                (x, y + t, t, half - t),
+                (x + t, y + half - t // 2, w - 2 * t, t)
+            )
+            for bit, rect in enumerate(rects):
+                if seg & (1 << bit):
+                    self._fill(buf, *rect, pixel)
+            if i == 1 and seg & self.COLON_BIT:
+                cx = 2 * cell - t // 2
+                self._fill(buf, cx, y + h // 3 - t // 2, t, t, pixel)
+                self._fill(buf, cx, y + 2 * h // 3 - t // 2, t, t, pixel)
+        return buf
+
+    def _blit(self, buf: bytearray) -> None:
+        if self._fd is None:
+            return
+        try:
+            with metrics.timer('display.framebuffer_write'):
+                os.pwrite(self._fd, buf, 0)
+        except OSError as e:
+            self._last_frame = None
+            log.error(f"Framebuffer write failed: {e}")
+
+    def _send_frame(self, frame: bytes) -> None:
+        self._blit(self._render(frame))
+
+    def _set_brightness_internal(self, brightness: int) -> None:
+        self._level = max(1, min(8, brightness))
+        if self._last_frame is not None:
+            self._send_frame(self._last_frame)
+
+    def cleanup(self) -> None:
+        try:
+            self._blit(bytearray(self.stride * self.height))
+            if self._fd is not None:
+                os.close(self._fd)
+            self._fd = None
+        except Exception as e:
+            log.error(f"Framebuffer cleanup failed: {e}")
@@ -0,0 +1,132 @@
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from src.core.config import Config
+from src.hardware.display.segment_display import SegmentDisplay
+from src.hardware.display.tm1652 import TM1652
+from src.hardware.display.transitions import TransitionDisplay
+from src.utils.clock import Clock
+from src.utils.logger import Logger
+from src.utils.metrics import Metrics
+
+log = Logger()
+metrics = Metrics()
+
+class DisplayOutput:
+    def __init__(self, name: str, device: SegmentDisplay, max_fps: float = 0.0, threaded: bool = True) -> None:
+        self.name = name
+        self.device = device
+        self.min_interval = 1.0 / max_fps if max_fps > 0 else 0.0
+        self.coalesced = 0
+        self._cond = threading.Condition()
+        self._frame: Optional[bytes] = None
+        self._brightness: Optional[int] = None
+        self._last_sent = 0.0
+        self._running = True
+        self._thread: Optional[threading.Thread] = None
+        if threaded:
+            self._thread = threading.Thread(target=self._run, name=f"display-{name}", daemon=True)
+            self._thread.start()
+
+    def submit(self, frame: bytes) -> None:
+        if self._thread is None:
+            self.device.show_frame(frame)
+            return
+        with self._cond:
+            if self._frame is not None:
+                self.coalesced += 1
+                metrics.incr('display.frames_coalesced')
+            self._frame = frame
+            self._cond.notify()
+
+    def set_brightness(self, brightness: int) -> None:
+        if self._thread is None:
+            self.device.set_brightness(brightness)
+            return
+        with self._cond:
+            self._brightness = brightness
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._running and self._brightness is None:
+                    if self._frame is None:
+                        self._cond.wait()
+                        continue
+                    delay = self._last_sent + self.min_interval - time.monotonic()
+                    if delay <= 0:
+                        break
+                    self._cond.wait(delay)
+                if not self._running:
+                    return
+                brightness, self._brightness = self._brightness, None
+                frame = None
+                if self._frame is not None and time.monotonic() >= self._last_sent + self.min_interval:
+                    frame, self._frame = self._frame, None
+            if brightness is not None:
+                self.device.set_brightness(brightness)
+            if frame is not None:
+                self._last_sent = time.monotonic()
+                self.device.show_frame(frame)
+
+    def stop(self) -> None:
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+        self.device.cleanup()
+
+class DisplayPipeline(SegmentDisplay):
+    def __init__(self, outputs: List[DisplayOutput], config: Optional[Config] = None,
+                 clock: Optional[Clock] = None) -> None:
+        super().__init__(config, clock)
+        self.outputs = outputs
+        log.ok(f"Display pipeline initialized with outputs: {', '.join(o.name for o in outputs)}")
+
+    def _send_frame(self, frame: bytes) -> None:
+        for output in self.outputs:
+            output.submit(frame)
+
+    def _set_brightness_internal(self, brightness: int) -> None:
+        for output in self.outputs:
+            output.set_brightness(brightness)
+
+    def cleanup(self) -> None:
+        for output in self.outputs:
+            try:
+                output.stop()
+            except Exception as e:
+                log.error(f"Display output {output.name} cleanup failed: {e}")
+
+def create_output(config: Config, clock: Optional[Clock], settings: Dict[str, Any]) -> SegmentDisplay:
+    kind = settings.get('type', 'tm1652')
+    if kind == 'framebuffer':
+        from src.hardware.display.framebuffer import FramebufferDisplay
+        return FramebufferDisplay(config, clock=clock, settings=settings)
+    if kind != 'tm1652':
+        raise ValueError(f"Unknown display output type: {kind}")
+    return TM1652(config, clock=clock, settings=settings)
+
+def create_display(config: Config, clock: Optional[Clock] = None) -> SegmentDisplay:
+    display_cfg = config.get('gpio.display', {})
+    outputs_cfg = display_cfg.get('outputs') or []
+    if not outputs_cfg:
+        return _with_transitions(TM1652(config, clock=clock), config, clock)
+    threaded = display_cfg.get('threaded', True)
+    outputs = []
+    for index, settings in enumerate(outputs_cfg):
+        name = settings.get('name', f"{settings.get('type', 'tm1652')}{index}")
+        try:
+            device = create_output(config, clock, settings)
+        except Exception as e:
+            log.error(f"Display output {name} failed: {e}")
+            continue
+        outputs.append(DisplayOutput(name, device, settings.get('max_fps', 0), threaded))
+    return _with_transitions(DisplayPipeline(outputs, config, clock), config, clock)
+
+def _with_transitions(display: SegmentDisplay, config: Config, clock: Optional[Clock]) -> SegmentDisplay:
+    if not config.get('display.transitions.enable', False):
+        return display
+    return TransitionDisplay(display, config, clock)
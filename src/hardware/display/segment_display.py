@@ -0,0 +1,201 @@
+from abc import ABC, abstractmethod
+from typing import Union, List, Optional
+from src.core.config import Config
+from src.hardware.display.font import FONT, encode_text
+from src.utils.clock import Clock, SYSTEM_CLOCK
+from src.utils.logger import Logger
+from src.utils.metrics import Metrics
+
+log = Logger()
+metrics = Metrics()
+
+class SegmentDisplay(ABC):
+    CHAR_MAP = FONT
+    
+    COLON_BIT = 0x80
+
+    BOOT_FRAMES = (
+        [0x01, 0, 0, 0], [0, 0x01, 0, 0], [0, 0, 0x01, 0], [0, 0, 0, 0x01],
+        [0, 0, 0, 0x02], [0, 0, 0, 0x04], [0, 0, 0, 0x08], [0, 0, 0x08, 0],
+        [0, 0x08, 0, 0], [0x08, 0, 0, 0], [0x10, 0, 0, 0], [0x20, 0, 0, 0]
+    )
+
+    def __init__(self, config: Optional[Config] = None, clock: Optional[Clock] = None) -> None:
+        self.config = config or Config()
+        self.clock = clock or SYSTEM_CLOCK
+        self._last_frame: Optional[bytes] = None
+        self._brightness = self.config.get('display.brightness', 4)
+        self._dim_level = None
+
+    @abstractmethod
+    def _send_frame(self, frame: bytes) -> None:
+        pass
+
+    @abstractmethod
+    def _set_brightness_internal(self, brightness: int) -> None:
+        pass
+
+    def update_brightness(self) -> None:
+        try:
+            new_brightness = self.config.get('display.brightness', 4)
+            if new_brightness != self._brightness:
+                self._brightness = new_brightness
+                self._set_brightness_internal(self._brightness)
+        except Exception as e:
+            log.error(f"Display brightness update failed: {e}")
+
+    def dim(self, factor: float) -> None:
+        level = None if factor >= 1.0 else max(1, round(self._brightness * factor))
+        if level != self._dim_level:
+            self._dim_level = level
+            self._set_brightness_internal(self._brightness if level is None else level)
+
+    def set_brightness(self, brightness: int) -> None:
+        try:
+            self._set_brightness_internal(brightness)
+        except Exception as e:
+            log.error(f"Display brightness set failed: {e}")
+
+    def fade(self) -> None:
+        pass
+
+    def pulse(self, active: bool) -> bool:
+        return False
+
+    def step(self, now: float) -> Optional[float]:
+        return None
+
+    @property
+    def current_frame(self) -> Optional[bytes]:
+        return self._last_frame
+
+    def _write_segments(self, segments: List[int], colon: bool = False, force: bool = False) -> None:
+        try:
+            frame = bytearray()
+            for i, seg in enumerate(segments[:4]):
+                if colon and i == 1:
+                    seg |= self.COLON_BIT
+                frame.append(seg)
+            frame = bytes(frame)
+            if frame == self._last_frame and not force:
+                metrics.incr('display.frames_deduplicated')
+                return
+            self._last_frame = frame
+            self._send_frame(frame)
+        except Exception as e:
+            log.error(f"Display segments write failed: {e}")
+
+    def show_number(self, number: Union[int, float], colon: bool = False) -> None:
+        try:
+            number = max(-999, min(9999, int(number)))
+            digits = f"{abs(number):04d}"
+            segments = []
+            
+            if number < 0:
+                segments.append(self.CHAR_MAP['-'])
+                digits = digits[1:]
+            
+            segments.extend(self.CHAR_MAP[d] for d in digits)
+            self._write_segments(segments, colon)
+        except Exception as e:
+            log.error(f"Display show_number failed: {e}")
+
+    def show_time(self, minutes: int, seconds: int, colon: bool = True) -> None:
+        try:
+            minutes = max(0, min(99, int(minutes)))
+            seconds = max(0, min(59, int(seconds)))
+            segments = [
+                self.CHAR_MAP[str(minutes // 10)],
+                self.CHAR_MAP[str(minutes % 10)],
+                self.CHAR_MAP[str(seconds // 10)],
+                self.CHAR_MAP[str(seconds % 10)]
+            ]
+            self._write_segments(segments, colon)
+        except Exception as e:
+            log.error(f"Display show_time failed: {e}")
+
+    def show_track_number(self, number: int) -> None:
+        try:
+            number = max(1, min(99, int(number)))
+            num_str = f"{number:02d}"
+            segments = [
+                self.CHAR_MAP['-'],
+                self.CHAR_MAP[num_str[0]],
+                self.CHAR_MAP[num_str[1]],
+                self.CHAR_MAP['-']
+            ]
+            self._write_segments(segments, False)
+        except Exception as e:
+            log.error(f"Display show_track_number failed: {e}")
+
+    def show_track_total(self, count: int) -> None:
+        try:
+            count = max(0, min(99, int(count)))
+            segments = [
+                self.CHAR_MAP[str(count // 10)],
+                self.CHAR_MAP[str(count % 10)],
+                self.CHAR_MAP['-'],
+                self.CHAR_MAP['-']
+            ]
+            self._write_segments(segments, False)
+        except Exception as e:
+            log.error(f"Display show_track_total failed: {e}")
+
+    def show_volume(self, number: Union[int, str]) -> None:
+        try:
+            number = max(0, min(100, int(number)))
+            if number == 100:
+                segments = [
+                    self.CHAR_MAP['-'],
+                    self.CHAR_MAP['1'],
+                    self.CHAR_MAP['0'],
+                    self.CHAR_MAP['0']
+                ]
+            else:
+                num_str = f"{number:02d}"
+                segments = [
+                    self.CHAR_MAP['-'],
+                    self.CHAR_MAP['-'],
+                    self.CHAR_MAP[num_str[0]],
+                    self.CHAR_MAP[num_str[1]]
+                ]
+            self._write_segments(segments, False)
+        except Exception as e:
+            log.error(f"Display show_volume failed: {e}")
+
+    def show_boot_frame(self, step: int) -> None:
+        try:
+            self._write_segments(self.BOOT_FRAMES[step % len(self.BOOT_FRAMES)], False)
+        except Exception as e:
+            log.error(f"Display show_boot_frame failed: {e}")
+
+    def show_segments(self, segments: List[int], colon: bool = False) -> None:
+        try:
+            self._write_segments(list(segments), colon)
+        except Exception as e:
+            log.error(f"Display show_segments failed: {e}")
+
+    def show_frame(self, frame: bytes) -> None:
+        try:
+            self._write_segments(list(frame), False)
+        except Exception as e:
+            log.error(f"Display show_frame failed: {e}")
+
+    def show_text(self, text: str) -> None:
+        try:
+            segments = encode_text(text[:4])
+            self._write_segments(segments + [0x00] * (4 - len(segments)), False)
+        except Exception as e:
+            log.error(f"Display show_text failed: {e}")
+
+    def show_dashes(self) -> None:
+        try:
+            self._write_segments([self.CHAR_MAP['-']] * 4, False)
+        except Exception as e:
+            log.error(f"Display show_dashes failed: {e}")
+
+    def clear(self) -> None:
+        try:
+            self._write_segments([0, 0, 0, 0], False)
+        except Exception as e:
+            log.error(f"Display clear failed: {e}")
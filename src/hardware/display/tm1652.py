@@ -1,38 +1,37 @@
-import serial
-import time
-from typing import Union, List
+from typing import Any, Dict, Optional
 from src.core.config import Config
+from src.hardware.display.segment_display import SegmentDisplay
+from src.utils.clock import Clock
 from src.utils.logger import Logger
+from src.utils.metrics import Metrics
+from src.utils.trace import Trace
 
 log = Logger()
+metrics = Metrics()
+trace = Trace()
 
-class TM1652:
+class TM1652(SegmentDisplay):
     CMD_WRITE_DATA = 0x08
     CMD_SET_BRIGHTNESS = 0x18
     CMD_BRIGHTNESS_BASE = 0x10
     
-    CHAR_MAP = {
-        '0': 0x3F, '1': 0x06, '2': 0x5B, '3': 0x4F, '4': 0x66,
-        '5': 0x6D, '6': 0x7D, '7': 0x07, '8': 0x7F, '9': 0x6F,
-        '-': 0x40, ' ': 0x00
-    }
-    
-    COLON_BIT = 0x80
-    
-    def __init__(self) -> None:
-        self.config = Config()
-        self.ser = None
+    def __init__(self, config: Optional[Config] = None, transport: Optional[Any] = None,
+                 clock: Optional[Clock] = None, settings: Optional[Dict[str, Any]] = None) -> None:
+        super().__init__(config, clock)
+        self.ser = transport
         self._connection_retry_count = 0
         self._max_retries = 3
         self._retry_delay = 0.5
         self._last_retry_time = 0
         
-        display_config = self.config.get('gpio.display', {})
+        display_config = settings or self.config.get('gpio.display', {})
         self.serial_port = display_config.get('serial_port', '/dev/ttyAMA0')
         self.baudrate = display_config.get('baudrate', 19200)
+        self.backend = display_config.get('backend', 'pyserial')
+        self.frame_gap = display_config.get('frame_gap', 0.002)
         
-        self._connect_serial()
-        self._brightness = self.config.get('display.brightness', 4)
+        if transport is None:
+            self._connect_serial()
         self._set_brightness_internal(self._brightness)
         log.ok("TM1652 initialized")
 
@@ -41,21 +40,28 @@ class TM1652:
             if self.ser and self.ser.is_open:
                 self.ser.close()
                 
-            current_time = time.time()
+            current_time = self.clock.time()
             if current_time - self._last_retry_time < self._retry_delay:
-                time.sleep(self._retry_delay - (current_time - self._last_retry_time))
+                self.clock.sleep(self._retry_delay - (current_time - self._last_retry_time))
             
-            self.ser = serial.Serial(
-                port=self.serial_port,
-                baudrate=self.baudrate,
-                bytesize=8,
-                parity=serial.PARITY_ODD,
-                stopbits=1,
-                timeout=0.1
-            )
+            if self.backend == 'termios':
+                from src.hardware.display.uart import RawUART
+
+                self.ser = RawUART(self.serial_port, self.baudrate, self.frame_gap, clock=self.clock)
+            else:
+                import serial
+
+                self.ser = serial.Serial(
+                    port=self.serial_port,
+                    baudrate=self.baudrate,
+                    bytesize=8,
+                    parity=serial.PARITY_ODD,
+                    stopbits=1,
+                    timeout=0.1
+                )
             
             self.ser.flush()
-            time.sleep(0.1)
+            self.clock.sleep(0.1)
             
             log.ok(f"Connected to serial port {self.serial_port}")
             self._connection_retry_count = 0
@@ -63,7 +69,7 @@ class TM1652:
             
         except Exception as e:
             self._connection_retry_count += 1
-            self._last_retry_time = time.time()
+            self._last_retry_time = self.clock.time()
             log.error(f"Failed to connect to serial port {self.serial_port} (attempt {self._connection_retry_count}): {e}")
             
             if self._connection_retry_count >= self._max_retries:
@@ -76,6 +82,7 @@ class TM1652:
         return int(bits[::-1], 2)
 
     def _write_command(self, data: bytearray) -> None:
+        trace.record('display', data.hex())
         max_attempts = 3
         for attempt in range(max_attempts):
             try:
@@ -83,18 +90,23 @@ class TM1652:
                     if not self._connect_serial():
                         return
 
-                self.ser.write(data)
-                self.ser.flush()
-                time.sleep(0.002)
+                with metrics.timer('display.write_command'):
+                    self.ser.write(data)
+                    if not getattr(self.ser, 'paced', False):
+                        self.ser.flush()
+                        self.clock.sleep(self.frame_gap)
                 return
 
             except Exception as e:
                 log.error(f"Failed to write to serial port (attempt {attempt + 1}): {e}")
 
                 if attempt < max_attempts - 1:
+                    metrics.incr('display.serial_retries')
                     self._connect_serial()
-                    time.sleep(0.05)
+                    self.clock.sleep(0.05)
                 else:
+                    self._last_frame = None
+                    metrics.incr('display.write_failures')
                     log.error("Failed to write after all attempts")
 
     def _set_brightness_internal(self, brightness: int) -> None:
@@ -108,124 +120,15 @@ class TM1652:
         except Exception as e:
             log.error(f"Display brightness internal set failed: {e}")
 
-    def update_brightness(self) -> None:
-        try:
-            new_brightness = self.config.get('display.brightness', 4)
-            if new_brightness != self._brightness:
-                self._brightness = new_brightness
-                self._set_brightness_internal(self._brightness)
-        except Exception as e:
-            log.error(f"Display brightness update failed: {e}")
-
-    def _write_segments(self, segments: List[int], colon: bool = False) -> None:
-        try:
-            send = bytearray([self.CMD_WRITE_DATA])
-            for i, seg in enumerate(segments[:4]):
-                if colon and i == 1:
-                    seg |= self.COLON_BIT
-                send.append(seg)
-            self._write_command(send)
-        except Exception as e:
-            log.error(f"Display segments write failed: {e}")
-
-    def show_number(self, number: Union[int, float], colon: bool = False) -> None:
-        try:
-            number = max(-999, min(9999, int(number)))
-            digits = f"{abs(number):04d}"
-            segments = []
-            
-            if number < 0:
-                segments.append(self.CHAR_MAP['-'])
-                digits = digits[1:]
-            
-            segments.extend(self.CHAR_MAP[d] for d in digits)
-            self._write_segments(segments, colon)
-        except Exception as e:
-            log.error(f"Display show_number failed: {e}")
+    def _send_frame(self, frame: bytes) -> None:
+        self._write_command(bytearray([self.CMD_WRITE_DATA]) + frame)
 
-    def show_time(self, minutes: int, seconds: int, colon: bool = True) -> None:
-        try:
-            minutes = max(0, min(99, int(minutes)))
-            seconds = max(0, min(59, int(seconds)))
-            segments = [
-                self.CHAR_MAP[str(minutes // 10)],
-                self.CHAR_MAP[str(minutes % 10)],
-                self.CHAR_MAP[str(seconds // 10)],
-                self.CHAR_MAP[str(seconds % 10)]
-            ]
-            self._write_segments(segments, colon)
-        except Exception as e:
-            log.error(f"Display show_time failed: {e}")
-
-    def show_track_number(self, number: int) -> None:
-        try:
-            number = max(1, min(99, int(number)))
-            num_str = f"{number:02d}"
-            segments = [
-                self.CHAR_MAP['-'],
-                self.CHAR_MAP[num_str[0]],
-                self.CHAR_MAP[num_str[1]],
-                self.CHAR_MAP['-']
-            ]
-            self._write_segments(segments, False)
-        except Exception as e:
-            log.error(f"Display show_track_number failed: {e}")
-
-    def show_track_total(self, count: int) -> None:
-        try:
-            count = max(0, min(99, int(count)))
-            segments = [
-                self.CHAR_MAP[str(count // 10)],
-                self.CHAR_MAP[str(count % 10)],
-                self.CHAR_MAP['-'],
-                self.CHAR_MAP['-']
-            ]
-            self._write_segments(segments, False)
-        except Exception as e:
-            log.error(f"Display show_track_total failed: {e}")
-
-    def show_volume(self, number: Union[int, str]) -> None:
-        try:
-            number = max(0, min(100, int(number)))
-            if number == 100:
-                segments = [
-                    self.CHAR_MAP['-'],
-                    self.CHAR_MAP['1'],
-                    self.CHAR_MAP['0'],
-                    self.CHAR_MAP['0']
-                ]
-            else:
-                num_str = f"{number:02d}"
-                segments = [
-                    self.CHAR_MAP['-'],
-                    self.CHAR_MAP['-'],
-                    self.CHAR_MAP[num_str[0]],
-                    self.CHAR_MAP[num_str[1]]
-                ]
-            self._write_segments(segments, False)
-        except Exception as e:
-            log.error(f"Display show_volume failed: {e}")
-
-    def show_dashes(self) -> None:
-        try:
-            self._write_segments([self.CHAR_MAP['-']] * 4, False)
-        except Exception as e:
-            log.error(f"Display show_dashes failed: {e}")
-
-    def clear(self) -> None:
-        try:
-            self._write_segments([0, 0, 0, 0], False)
-        except Exception as e:
-            log.error(f"Display clear failed: {e}")
-    
     def force_off(self) -> None:
         try:
             if self.ser and self.ser.is_open:
                 self._set_brightness_internal(1)
-                time.sleep(0.1)
                 for _ in range(3):
-                    self.clear()
-                    time.sleep(0.05)
+                    self._write_segments([0, 0, 0, 0], False, force=True)
                 self.ser.flush()
         except Exception as e:
             log.error(f"Display force_off failed: {e}")
@@ -233,7 +136,6 @@ class TM1652:
     def cleanup(self) -> None:
         try:
             self.force_off()
-            time.sleep(0.2)
             if self.ser and self.ser.is_open:
                 self.ser.close()
             self.ser = None
@@ -0,0 +1,191 @@
+from collections import deque
+from typing import Deque, Optional, Tuple
+from src.core.config import Config
+from src.hardware.display.segment_display import SegmentDisplay
+from src.utils.clock import Clock
+from src.utils.logger import Logger
+from src.utils.metrics import Metrics
+
+log = Logger()
+metrics = Metrics()
+
+LEVEL, CLEAR, RELEASE = 'level', 'clear', 'release'
+
+class CommandBudget:
+    def __init__(self, rate: float, burst: float) -> None:
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self.tokens = self.burst
+        self._updated: Optional[float] = None
+
+    def _refill(self, now: float) -> None:
+        if self._updated is not None and now > self._updated:
+            self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def spend(self, now: float) -> None:
+        if self.rate > 0:
+            self._refill(now)
+            self.tokens -= 1
+
+    def try_spend(self, now: float, reserve: float) -> bool:
+        if self.rate <= 0:
+            return True
+        self._refill(now)
+        if self.tokens < 1 + reserve:
+            return False
+        self.tokens -= 1
+        return True
+
+    def ready_at(self, now: float, reserve: float) -> float:
+        return now + max(0.0, 1 + reserve - self.tokens) / self.rate
+
+class TransitionDisplay(SegmentDisplay):
+    def __init__(self, inner: SegmentDisplay, config: Optional[Config] = None,
+                 clock: Optional[Clock] = None) -> None:
+        super().__init__(config, clock)
+        self.inner = inner
+        transitions_cfg = self.config.get('display.transitions', {})
+        self.ramp_time = transitions_cfg.get('ramp_time', 0.4)
+        self.fade_time = transitions_cfg.get('fade_time', 0.3)
+        self.pulse_min = max(1, transitions_cfg.get('pulse_min', 1))
+        self.pulse_period = 2.0 * self.config.get('display.pause_mode.blink_interval', 1)
+        self.reserve = transitions_cfg.get('reserve', 2)
+        self.budget = CommandBudget(transitions_cfg.get('max_command_rate', 20), transitions_cfg.get('burst', 4))
+        self._level = self._brightness
+        self._steps: Deque[Tuple[float, str, int]] = deque()
+        self._held: Optional[bytes] = None
+        self._holding = False
+        self._hold_until = 0.0
+        self._fade_pending = False
+        self._pulsing = False
+        log.ok("Display transitions enabled")
+
+    @property
+    def _target(self) -> int:
+        return self._brightness if self._dim_level is None else self._dim_level
+
+    def _forward(self, frame: bytes, now: float) -> None:
+        self.budget.spend(now)
+        self.inner.show_frame(frame)
+
+    def _send_frame(self, frame: bytes) -> None:
+        if self._fade_pending:
+            self._fade_pending = False
+            self._holding = True
+            self._schedule_fade(self.clock.time())
+        if self._holding:
+            self._held = frame
+            return
+        self._forward(frame, self.clock.time())
+
+    def _set_brightness_internal(self, brightness: int) -> None:
+        now = self.clock.time()
+        self._cancel(now)
+        self.budget.spend(now)
+        self._level = brightness
+        self.inner.set_brightness(brightness)
+
+    def _cancel(self, now: float) -> None:
+        self._steps.clear()
+        self._fade_pending = False
+        if self._holding:
+            self._holding = False
+            if self._held is not None:
+                self._forward(self._held, now)
+            self._held = None
+
+    def _schedule_ramp(self, start: float, level_from: int, level_to: int, duration: float) -> float:
+        count = abs(level_to - level_from)
+        if count == 0:
+            return start
+        direction = 1 if level_to > level_from else -1
+        interval = duration / count
+        for i in range(1, count + 1):
+            self._steps.append((start + interval * i, LEVEL, level_from + direction * i))
+        return start + duration
+
+    def _schedule_fade(self, now: float) -> None:
+        half = self.fade_time / 2.0
+        self._hold_until = now + self.fade_time
+        dark_at = self._schedule_ramp(now, self._level, 1, half)
+        self._steps.append((dark_at, CLEAR, 0))
+        release_at = dark_at + half / 2.0
+        self._steps.append((release_at, RELEASE, 0))
+        self._schedule_ramp(release_at, 1, self._target, half)
+
+    def update_brightness(self) -> None:
+        try:
+            new_brightness = self.config.get('display.brightness', 4)
+            if new_brightness != self._brightness:
+                self._brightness = new_brightness
+                if self._dim_level is None and not self._pulsing:
+                    now = self.clock.time()
+                    self._cancel(now)
+                    self._schedule_ramp(now, self._level, self._target, self.ramp_time)
+        except Exception as e:
+            log.error(f"Display brightness update failed: {e}")
+
+    def fade(self) -> None:
+        if self._holding or self._pulsing or self._fade_pending:
+            return
+        self._fade_pending = True
+
+    def pulse(self, active: bool) -> bool:
+        if active == self._pulsing:
+            return True
+        now = self.clock.time()
+        self._cancel(now)
+        self._pulsing = active
+        if not active:
+            self._schedule_ramp(now, self._level, self._target, self.ramp_time)
+        return True
+
+    def step(self, now: float) -> Optional[float]:
+        if self._holding and now >= self._hold_until:
+            metrics.incr('display.transition_overrun')
+            self._cancel(now)
+            self._schedule_ramp(now, self._level, self._target, self.ramp_time)
+        while True:
+            if not self._steps:
+                if not self._pulsing or self._target <= self.pulse_min:
+                    return None
+                low_at = self._schedule_ramp(now, self._level, self.pulse_min, self.pulse_period / 2.0)
+                self._schedule_ramp(low_at, self.pulse_min, self._target, self.pulse_period / 2.0)
+
+            due, kind, value = self._steps[0]
+            if due > now:
+                return min(due, self._hold_until) if self._holding else due
+            if kind == RELEASE:
+                self._steps.popleft()
+                self._holding = False
+                if self._held is not None:
+                    self._forward(self._held, now)
+                self._held = None
+                continue
+            if kind == LEVEL and value == self._level:
+                self._steps.popleft()
+                continue
+            if not self.budget.try_spend(now, self.reserve):
+                metrics.incr('display.transition_deferred')
+                ready = self.budget.ready_at(now, self.reserve)
+                return min(ready, self._hold_until) if self._holding else ready
+            self._steps.popleft()
+            if kind == LEVEL:
+                self._level = value
+                self.inner.set_brightness(value)
+            else:
+                self.inner.show_frame(bytes(4))
+
+    def clear(self) -> None:
+        interrupted = self._fade_pending or self._holding
+        if interrupted:
+            self._held = None
+            self._cancel(self.clock.time())
+            if self._level != self._target:
+                self._set_brightness_internal(self._target)
+        self._write_segments([0, 0, 0, 0], force=interrupted)
+
+    def cleanup(self) -> None:
+        self._cancel(self.clock.time())
+        self.inner.cleanup()
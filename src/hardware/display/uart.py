@@ -0,0 +1,134 @@
+import argparse
+import os
+import threading
+import time
+from typing import Callable, List, Optional
+from src.utils.clock import Clock, SYSTEM_CLOCK
+from src.utils.logger import Logger
+
+log = Logger()
+
+BITS_PER_BYTE = 11
+
+class RawUART:
+    paced = True
+
+    def __init__(self, port: str, baudrate: int = 19200, gap: float = 0.002,
+                 clock: Optional[Clock] = None) -> None:
+        import termios
+
+        self.port = port
+        self.baudrate = baudrate
+        self.gap = gap
+        self.clock = clock or SYSTEM_CLOCK
+        self.byte_time = BITS_PER_BYTE / float(baudrate)
+        self._ready_at = 0.0
+        self._fd: Optional[int] = os.open(port, os.O_WRONLY | os.O_NOCTTY | os.O_NONBLOCK)
+        try:
+            speed = getattr(termios, f"B{baudrate}")
+            attrs = termios.tcgetattr(self._fd)
+            attrs[0] = 0
+            attrs[1] = 0
+            attrs[2] &= ~(termios.CSIZE | termios.CSTOPB | getattr(termios, 'CRTSCTS', 0))
+            attrs[2] |= termios.CS8 | termios.PARENB | termios.PARODD | termios.CLOCAL | termios.CREAD
+            attrs[3] = 0
+            attrs[4] = attrs[5] = speed
+            termios.tcsetattr(self._fd, termios.TCSANOW, attrs)
+            os.set_blocking(self._fd, True)
+        except Exception:
+            os.close(self._fd)
+            self._fd = None
+            raise
+
+    @property
+    def is_open(self) -> bool:
+        return self._fd is not None
+
+    def frame_time(self, size: int) -> float:
+        return size * self.byte_time
+
+    def write(self, data: bytes) -> int:
+        wait = self._ready_at - self.clock.monotonic()
+        if wait > 0:
+            self.clock.sleep(wait)
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self._fd, view):]
+        self._ready_at = self.clock.monotonic() + self.frame_time(len(data)) + self.gap
+        return len(data)
+
+    def flush(self) -> None:
+        import termios
+
+        if self._fd is not None:
+            termios.tcdrain(self._fd)
+
+    def close(self) -> None:
+        fd, self._fd = self._fd, None
+        if fd is not None:
+            os.close(fd)
+
+def _drain(fd: int, stop: threading.Event) -> None:
+    while not stop.is_set():
+        try:
+            if not os.read(fd, 4096):
+                return
+        except OSError:
+            return
+
+def _measure(name: str, write: Callable[[bytes], None], frames: int, interval: float) -> None:
+    frame = bytes([0x08, 0x3F, 0x06, 0x5B, 0x4F])
+    costs: List[float] = []
+    started = time.perf_counter()
+    for _ in range(frames):
+        call_started = time.perf_counter()
+        write(frame)
+        costs.append((time.perf_counter() - call_started) * 1000.0)
+        if interval:
+            time.sleep(interval)
+    total = time.perf_counter() - started
+    costs.sort()
+    log.info(f"{name}: {frames} frames in {total:.2f}s, write call p50 {costs[len(costs) // 2]:.3f} ms, "
+             f"p99 {costs[int(len(costs) * 0.99)]:.3f} ms, max {costs[-1]:.3f} ms")
+
+def _run_on_pty(name: str, backend: Callable[[str], Callable[[bytes], None]], frames: int, interval: float) -> None:
+    master, slave = os.openpty()
+    stop = threading.Event()
+    threading.Thread(target=_drain, args=(master, stop), daemon=True).start()
+    try:
+        _measure(name, backend(os.ttyname(slave)), frames, interval)
+    finally:
+        stop.set()
+        os.close(slave)
+        os.close(master)
+
+def benchmark(frames: int = 500, interval: float = 0.01, baudrate: int = 19200) -> None:
+    try:
+        import serial
+
+        def open_pyserial(port: str) -> Callable[[bytes], None]:
+            ser = serial.Serial(port=port, baudrate=baudrate, bytesize=8, parity=serial.PARITY_ODD,
+                                stopbits=1, timeout=0.1)
+
+            def write(data: bytes) -> None:
+                ser.write(data)
+                ser.flush()
+                time.sleep(0.002)
+            return write
+
+        _run_on_pty('pyserial', open_pyserial, frames, interval)
+    except ImportError:
+        log.warning("pyserial not installed, skipping the pyserial path")
+
+    _run_on_pty('termios', lambda port: RawUART(port, baudrate).write, frames, interval)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Compare pyserial and raw termios TM1652 writes over a pty')
+    parser.add_argument('--frames', type=int, default=500)
+    parser.add_argument('--interval', type=float, default=0.01, help='Seconds between frames (0 for back-to-back)')
+    parser.add_argument('--baudrate', type=int, default=19200)
+    args = parser.parse_args()
+    benchmark(args.frames, args.interval, args.baudrate)
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,3 @@
-from .controller import LEDController
+from .controller import LEDController, LEDState
 
-__all__ = ["LEDController"]
+__all__ = ["LEDController", "LEDState"]
@@ -1,34 +1,44 @@
-from rpi_ws281x import PixelStrip, Color
+import os
+import subprocess
+import sys
 import threading
-import time
-from typing import Dict, Any
+from typing import Callable, Dict, Any, NamedTuple, Optional, Tuple
 from src.core.config import Config
+from src.core.store import Store
+from src.hardware.led.shared import FrameRing, SharedStrip
+from src.utils.clock import Clock, SYSTEM_CLOCK
 from src.utils.logger import Logger
+from src.utils.paths import PROJECT_ROOT
+from src.utils.metrics import Metrics
+from src.utils.trace import Trace
 
 log = Logger()
+metrics = Metrics()
+trace = Trace()
+
+def color(r: int, g: int, b: int, white: int = 0) -> int:
+    return (white << 24) | (r << 16) | (g << 8) | b
+
+class LEDState(NamedTuple):
+    options: Tuple[Tuple[str, bool], ...] = ()
+    brightness: int = 32
+    dim: float = 1.0
+    clears: int = 0
 
 class LEDController:
-    def __init__(self) -> None:
-        self.config = Config()
+    def __init__(self, config: Optional[Config] = None, strip: Optional[Any] = None,
+                 clock: Optional[Clock] = None) -> None:
+        self.config = config or Config()
+        self.clock = clock or SYSTEM_CLOCK
         
         status_leds_config = self.config.get('gpio.status_leds', {})
-        pin = status_leds_config.get('pin', 21)
-        count = status_leds_config.get('count', 4)
-        color_order = status_leds_config.get('order', 'GRB')
-        
-        import rpi_ws281x as ws
-        color_order_map = {
-            'RGB': ws.WS2811_STRIP_RGB,
-            'GRB': ws.WS2811_STRIP_GRB,
-            'BGR': ws.WS2811_STRIP_BGR,
-            'BRG': ws.WS2811_STRIP_BRG,
-            'GBR': ws.WS2811_STRIP_GBR,
-            'RBG': ws.WS2811_STRIP_RBG
-        }
-        
-        self.strip = PixelStrip(count, pin, strip_type=color_order_map.get(color_order, ws.WS2811_STRIP_GRB))
-        self.strip.begin()
         
+        self.strip = strip
+        self._ring = None
+        self._driver_process = None
+        if strip is None:
+            self.strip = self._create_strip(status_leds_config)
+
         self.led_map = {
             'repeat': 0,
             'random': 1,
@@ -36,133 +46,284 @@ class LEDController:
             'consume': 3
         }
         
-        self.brightness = max(0, min(255, int(status_leds_config.get('brightness', 32))))
-        self._last_status = {}
+        self.state = Store(LEDState(brightness=max(0, min(255, int(status_leds_config.get('brightness', 32))))), 'leds')
+        self._drawn_clears = -1
+        self._meter: Optional[Tuple[float, float]] = None
+        self._meter_drawn = False
+        self._effect: Optional[Callable[[], None]] = None
         self._animation_lock = threading.Lock()
+        self._cond = threading.Condition()
+        self._requests = 0
+        self._handled = 0
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+        self.run_effects_inline = False
 
-        self.all_off()
+        self._render_base()
         log.ok("Status LEDs initialized")
 
+    def _create_strip(self, status_leds_config: Dict[str, Any]) -> Any:
+        mode = status_leds_config.get('driver', 'inline')
+        if mode not in ('spawn', 'external'):
+            from src.hardware.led.driver import create_strip
+            return create_strip(status_leds_config)
+
+        self._ring = FrameRing(status_leds_config.get('shm_path', '/dev/shm/adam3-gpio-leds'),
+                               status_leds_config.get('count', 4),
+                               group=status_leds_config.get('shm_group'))
+        if mode == 'spawn':
+            self._driver_process = subprocess.Popen(
+                [sys.executable, '-m', 'src.hardware.led.driver', '--parent', str(os.getpid())],
+                cwd=PROJECT_ROOT
+            )
+            log.info(f"LED driver process started (pid {self._driver_process.pid})")
+        else:
+            log.info(f"Writing LED frames to {self._ring.path} for external driver")
+        return SharedStrip(self._ring)
+
+    def _stop_driver(self) -> None:
+        process, self._driver_process = self._driver_process, None
+        if process is not None:
+            process.terminate()
+            try:
+                process.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        if self._ring is not None:
+            self._ring.close()
+            self._ring = None
+
+    @property
+    def brightness(self) -> int:
+        return self.state.state.brightness
+
+    @property
+    def meter_active(self) -> bool:
+        return self._meter is not None
+
     def _setup_leds(self) -> None:
         try:
-            old_brightness = self.brightness
             configured_brightness = int(self.config.get('gpio.status_leds.brightness', self.brightness))
-            self.brightness = max(0, min(255, configured_brightness))
-            log.debug(f"Status LEDs brightness set to {self.brightness}/255")
+            brightness = max(0, min(255, configured_brightness))
+            log.debug("Status LEDs brightness set to %d/255", brightness)
 
-            if old_brightness != self.brightness:
-                self._update_leds(self._last_status)
+            if self.state.update(brightness=brightness):
+                self._schedule()
 
         except Exception as e:
             log.error(f"Status LEDs setup failed: {e}")
-            self.brightness = 32
+            self.state.update(brightness=32)
+
+    def _schedule(self) -> None:
+        if self.run_effects_inline or self._closed:
+            self._render_base()
+            return
+        with self._cond:
+            self._requests += 1
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name='leds', daemon=True)
+                self._worker.start()
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._closed and self._requests == self._handled:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                requests = self._requests
+                effect, self._effect = self._effect, None
+            if effect is not None:
+                self._play_effect(effect)
+            elif self._meter is not None:
+                self._draw_meter(*self._meter)
+            else:
+                self._render_base()
+            with self._cond:
+                self._handled = requests
+                self._cond.notify_all()
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        with self._cond:
+            return self._cond.wait_for(lambda: self._requests == self._handled, timeout)
 
-    def _update_leds(self, state_map: Dict[str, bool]) -> None:
+    def _stop_worker(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        worker, self._worker = self._worker, None
+        if worker is not None:
+            worker.join(timeout=1.0)
+
+    def _show(self) -> None:
+        with metrics.timer('led.show'):
+            self.strip.show()
+        if trace.enabled:
+            trace.record('led', [self.strip.getPixelColor(i) for i in range(self.strip.numPixels())])
+
+    def _render_base(self) -> None:
+        state = self.state.state
+        if self._meter is not None:
+            return
         try:
-            for led_name, is_on in state_map.items():
+            if state.clears != self._drawn_clears or self._meter_drawn:
+                for i in range(self.strip.numPixels()):
+                    self.strip.setPixelColor(i, color(0, 0, 0))
+                self._drawn_clears = state.clears
+                self._meter_drawn = False
+            for led_name, is_on in state.options:
                 led_index = self.led_map[led_name]
-                color = Color(0, 0, self.brightness) if is_on else Color(0, 0, 0)
-                self.strip.setPixelColor(led_index, color)
-            self.strip.show()
+                pixel = color(0, 0, int(state.brightness * state.dim)) if is_on else color(0, 0, 0)
+                self.strip.setPixelColor(led_index, pixel)
+            self._show()
         except Exception as e:
             log.error(f"LED update failed: {e}")
 
+    def _draw_meter(self, level: float, peak: float) -> None:
+        try:
+            self._meter_drawn = True
+            count = self.strip.numPixels()
+            lit = max(0.0, min(1.0, level)) * count
+            peak_index = min(count - 1, int(max(0.0, min(1.0, peak)) * count))
+            for i in range(count):
+                r, g = (255, 0) if i == count - 1 else (160, 120) if i == count - 2 else (0, 255)
+                fill = 1.0 if i == peak_index and peak > 0 else max(0.0, min(1.0, lit - i))
+                self.strip.setPixelColor(i, self._rgb(int(r * fill), int(g * fill), 0))
+            self._show()
+        except Exception as e:
+            log.error(f"LED meter update failed: {e}")
+
+    def show_meter(self, level: float, peak: float) -> bool:
+        if self._animation_lock.locked():
+            return False
+        self._meter = (level, peak)
+        if self.run_effects_inline:
+            self._draw_meter(level, peak)
+        else:
+            self._schedule()
+        return True
+
+    def stop_meter(self) -> None:
+        if self._meter is not None:
+            self._meter = None
+            self._schedule()
+
+    def set_dim(self, factor: float) -> None:
+        factor = max(0.0, min(1.0, factor))
+        if self.state.update(dim=factor) and self.state.state.options:
+            self._schedule()
+
     def update_from_mpd_status(self, status: Dict[str, Any]) -> None:
         if not status:
             return
 
         try:
-            state_map = {
-                'repeat': status.get('repeat', '0') == '1',
-                'random': status.get('random', '0') == '1',
-                'single': status.get('single', '0') == '1',
-                'consume': status.get('consume', '0') == '1'
-            }
-
-            if state_map != self._last_status:
-                self._last_status = state_map
-                self._update_leds(state_map)
+            options = tuple((name, status.get(name, '0') == '1') for name in self.led_map)
+            if self.state.update(options=options):
+                self._schedule()
         except Exception as e:
             log.error(f"MPD status update failed: {e}")
 
     def all_off(self) -> None:
-        try:
-            for i in range(self.strip.numPixels()):
-                self.strip.setPixelColor(i, Color(0, 0, 0))
-            self.strip.show()
-            self._last_status = {}
-        except Exception as e:
-            log.error(f"LED all_off failed: {e}")
+        self.state.apply(lambda state: state._replace(options=(), clears=state.clears + 1))
+        self._schedule()
 
     def cleanup(self) -> None:
         try:
-            self.all_off()
-            self.strip = None
+            self._stop_worker()
+            with self._cond:
+                queued, self._effect = self._effect, None
+            if queued is not None:
+                self._animation_lock.release()
+            idle = self._animation_lock.acquire(timeout=1.0)
+            if not idle:
+                log.warning("LED effect still running at cleanup")
+            try:
+                self._meter = None
+                self.all_off()
+                self._stop_driver()
+                self.strip = None
+            finally:
+                if idle:
+                    self._animation_lock.release()
         except Exception as e:
             log.error(f"LED cleanup failed: {e}")
   
-    def _run_one_shot(self, effect_fn) -> None:
+    def _run_one_shot(self, effect_fn: Callable[[], None]) -> None:
+        if self.strip is None:
+            return
         if not self._animation_lock.acquire(blocking=False):
+            metrics.incr('led.effects_dropped')
             return
+        metrics.incr('led.effects_started')
 
-        def _worker() -> None:
-            try:
-                effect_fn()
-            finally:
-                self._update_leds(self._last_status)
-                self._animation_lock.release()
+        if self.run_effects_inline or self._closed:
+            self._play_effect(effect_fn)
+            return
+        self._effect = effect_fn
+        self._schedule()
 
-        threading.Thread(target=_worker, daemon=True).start()
+    def _play_effect(self, effect_fn: Callable[[], None]) -> None:
+        try:
+            effect_fn()
+        except Exception as e:
+            log.error(f"LED effect failed: {e}")
+        finally:
+            self._render_base()
+            self._animation_lock.release()
 
-    def _rgb(self, r: int, g: int, b: int) -> Color:
-        scale = max(0, min(255, self.brightness)) / 255.0 if self.brightness else 0.0
+    def _rgb(self, r: int, g: int, b: int) -> int:
+        brightness = self.brightness
+        scale = max(0, min(255, brightness)) / 255.0 if brightness else 0.0
         sr = int(max(0, min(255, r)) * scale)
         sg = int(max(0, min(255, g)) * scale)
         sb = int(max(0, min(255, b)) * scale)
-        return Color(sr, sg, sb)
+        return color(sr, sg, sb)
 
     def flash_all(self, r: int, g: int, b: int, times: int = 1, on_ms: int = 150, off_ms: int = 120) -> None:
         def run() -> None:
             for _ in range(max(1, times)):
                 for i in range(self.strip.numPixels()):
                     self.strip.setPixelColor(i, self._rgb(r, g, b))
-                self.strip.show()
-                time.sleep(max(0, on_ms) / 1000.0)
+                self._show()
+                self.clock.sleep(max(0, on_ms) / 1000.0)
 
                 for i in range(self.strip.numPixels()):
                     self.strip.setPixelColor(i, self._rgb(0, 0, 0))
-                self.strip.show()
-                time.sleep(max(0, off_ms) / 1000.0)
+                self._show()
+                self.clock.sleep(max(0, off_ms) / 1000.0)
 
         self._run_one_shot(run)
 
     def flash_active(self, r: int, g: int, b: int, times: int = 1, on_ms: int = 150, off_ms: int = 120) -> None:
         def run() -> None:
-            active_indices = [self.led_map[name] for name, is_on in self._last_status.items() if is_on]
-            base_on_color = Color(0, 0, self.brightness)
+            state = self.state.state
+            active_indices = [self.led_map[name] for name, is_on in state.options if is_on]
+            base_on_color = color(0, 0, int(state.brightness * state.dim))
 
             if not active_indices:
                 first = 0
                 for _ in range(max(1, times)):
                     self.strip.setPixelColor(first, self._rgb(r, g, b))
-                    self.strip.show()
-                    time.sleep(max(0, on_ms) / 1000.0)
+                    self._show()
+                    self.clock.sleep(max(0, on_ms) / 1000.0)
 
                     self.strip.setPixelColor(first, self._rgb(0, 0, 0))
-                    self.strip.show()
-                    time.sleep(max(0, off_ms) / 1000.0)
+                    self._show()
+                    self.clock.sleep(max(0, off_ms) / 1000.0)
                 return
 
             for _ in range(max(1, times)):
                 for i in active_indices:
                     self.strip.setPixelColor(i, self._rgb(r, g, b))
-                self.strip.show()
-                time.sleep(max(0, on_ms) / 1000.0)
+                self._show()
+                self.clock.sleep(max(0, on_ms) / 1000.0)
 
                 for i in active_indices:
                     self.strip.setPixelColor(i, base_on_color)
-                self.strip.show()
-                time.sleep(max(0, off_ms) / 1000.0)
+                self._show()
+                self.clock.sleep(max(0, off_ms) / 1000.0)
 
         self._run_one_shot(run)
 
@@ -0,0 +1,98 @@
+import argparse
+import os
+import signal
+from typing import Any, Optional
+from src.core.config import Config
+from src.hardware.led.shared import FrameRing
+from src.utils.logger import Logger
+
+log = Logger()
+
+COLOR_ORDERS = ('RGB', 'GRB', 'BGR', 'BRG', 'GBR', 'RBG')
+
+def create_strip(status_leds_config: dict) -> Any:
+    import rpi_ws281x as ws
+    color_order = status_leds_config.get('order', 'GRB')
+    strip_type = getattr(ws, f"WS2811_STRIP_{color_order}", ws.WS2811_STRIP_GRB) \
+        if color_order in COLOR_ORDERS else ws.WS2811_STRIP_GRB
+
+    strip = ws.PixelStrip(
+        status_leds_config.get('count', 4),
+        status_leds_config.get('pin', 21),
+        dma=status_leds_config.get('dma', 10),
+        channel=status_leds_config.get('channel', 0),
+        strip_type=strip_type
+    )
+    strip.begin()
+    return strip
+
+class LEDDriver:
+    PARENT_CHECK = 1.0
+
+    def __init__(self, ring: FrameRing, strip: Any, poll_interval: float = 0.002,
+                 parent_pid: Optional[int] = None) -> None:
+        self.ring = ring
+        self.strip = strip
+        self.poll_interval = poll_interval
+        self.parent_pid = parent_pid
+        self.running = False
+        self.frames = 0
+
+    def _parent_alive(self) -> bool:
+        return self.parent_pid is None or os.getppid() == self.parent_pid
+
+    def _blank(self) -> None:
+        for i in range(self.strip.numPixels()):
+            self.strip.setPixelColor(i, 0)
+        self.strip.show()
+
+    def run(self) -> None:
+        self.running = True
+        log.ok(f"LED driver reading frames from {self.ring.path}")
+        if self.ring.open_wait():
+            wait_timeout = self.PARENT_CHECK
+        else:
+            log.warning(f"LED frame notifications unavailable, polling every {self.poll_interval * 1000:g} ms")
+            wait_timeout = self.poll_interval
+        try:
+            while self.running and self._parent_alive():
+                pixels = self.ring.read()
+                if pixels is None:
+                    self.ring.wait(wait_timeout)
+                    continue
+                for i, pixel in enumerate(pixels):
+                    self.strip.setPixelColor(i, pixel)
+                self.strip.show()
+                self.frames += 1
+        finally:
+            self._blank()
+            log.info(f"LED driver stopped after {self.frames} frames")
+
+    def stop(self, *_: Any) -> None:
+        self.running = False
+        self.ring.wake()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='ADAM3 status LED driver')
+    parser.add_argument('--parent', type=int, default=None,
+                        help='Exit when this process is no longer our parent')
+    args = parser.parse_args()
+
+    config = Config()
+    status_leds_config = config.get('gpio.status_leds', {})
+    ring = FrameRing(status_leds_config.get('shm_path', '/dev/shm/adam3-gpio-leds'),
+                     status_leds_config.get('count', 4),
+                     group=status_leds_config.get('shm_group'))
+    driver = LEDDriver(ring, create_strip(status_leds_config),
+                       status_leds_config.get('driver_poll_ms', 2) / 1000.0, args.parent)
+
+    signal.signal(signal.SIGTERM, driver.stop)
+    signal.signal(signal.SIGINT, driver.stop)
+    try:
+        driver.run()
+    finally:
+        ring.close()
+        log.flush()
+
+if __name__ == '__main__':
+    main()
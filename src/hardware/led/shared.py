@@ -0,0 +1,181 @@
+import grp
+import mmap
+import os
+import select
+import stat
+import struct
+import time
+from array import array
+from typing import List, Optional, Union
+
+HEADER = struct.Struct('<4sHHQ')
+SLOT_SEQ = struct.Struct('<Q')
+MAGIC = b'A3LD'
+SLOTS = 4
+NOTIFY_RETRY = 0.25
+
+def _set_access(target: Union[int, str], mode: int, group: Optional[str]) -> None:
+    if os.stat(target).st_uid != os.geteuid():
+        return
+    try:
+        if group:
+            os.chown(target, -1, grp.getgrnam(group).gr_gid)
+        os.chmod(target, mode)
+    except (OSError, KeyError):
+        pass
+
+class FrameRing:
+    def __init__(self, path: str, count: int, slots: int = SLOTS, group: Optional[str] = None) -> None:
+        self.path = path
+        self.count = count
+        self.slots = slots
+        self.slot_size = SLOT_SEQ.size + 4 * count
+        size = HEADER.size + slots * self.slot_size
+
+        mode = 0o660 if group else 0o600
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, mode)
+        try:
+            _set_access(fd, mode, group)
+            if os.fstat(fd).st_size != size:
+                os.ftruncate(fd, size)
+            self._map = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+
+        magic, stored_count, stored_slots, seq = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or stored_count != count or stored_slots != slots:
+            self._map[:] = bytes(size)
+            HEADER.pack_into(self._map, 0, MAGIC, count, slots, 0)
+            seq = 0
+        self.seq = seq
+        self._last_read = -1
+
+        self.notify_path: Optional[str] = path + '.notify'
+        self._notify_fd: Optional[int] = None
+        self._notify_retry = 0.0
+        self._wait_fd: Optional[int] = None
+        try:
+            os.mkfifo(self.notify_path, mode)
+        except FileExistsError:
+            pass
+        except OSError:
+            self.notify_path = None
+            return
+        if not stat.S_ISFIFO(os.stat(self.notify_path).st_mode):
+            self.notify_path = None
+            return
+        _set_access(self.notify_path, mode, group)
+
+    def _slot_offset(self, seq: int) -> int:
+        return HEADER.size + (seq % self.slots) * self.slot_size
+
+    def _header_seq(self) -> int:
+        return HEADER.unpack_from(self._map, 0)[3]
+
+    def publish(self, pixels: array) -> int:
+        seq = self._header_seq() + 1
+        offset = self._slot_offset(seq)
+        SLOT_SEQ.pack_into(self._map, offset, 0)
+        self._map[offset + SLOT_SEQ.size:offset + self.slot_size] = pixels.tobytes()
+        SLOT_SEQ.pack_into(self._map, offset, seq)
+        HEADER.pack_into(self._map, 0, MAGIC, self.count, self.slots, seq)
+        self.seq = seq
+        self._notify()
+        return seq
+
+    def _notify(self) -> None:
+        if self.notify_path is None:
+            return
+        if self._notify_fd is None:
+            now = time.monotonic()
+            if now < self._notify_retry:
+                return
+            try:
+                self._notify_fd = os.open(self.notify_path, os.O_WRONLY | os.O_NONBLOCK)
+            except OSError:
+                self._notify_retry = now + NOTIFY_RETRY
+                return
+        try:
+            os.write(self._notify_fd, b'\0')
+        except BlockingIOError:
+            pass
+        except OSError:
+            os.close(self._notify_fd)
+            self._notify_fd = None
+
+    def open_wait(self) -> bool:
+        if self.notify_path is None:
+            return False
+        if self._wait_fd is None:
+            try:
+                self._wait_fd = os.open(self.notify_path, os.O_RDWR | os.O_NONBLOCK)
+            except OSError:
+                return False
+        return True
+
+    def wait(self, timeout: float) -> None:
+        if self._wait_fd is None:
+            time.sleep(timeout)
+            return
+        try:
+            ready, _, _ = select.select([self._wait_fd], [], [], timeout)
+            if ready:
+                while os.read(self._wait_fd, 64):
+                    pass
+        except OSError:
+            pass
+
+    def wake(self) -> None:
+        fd = self._wait_fd if self._wait_fd is not None else self._notify_fd
+        if fd is not None:
+            try:
+                os.write(fd, b'\0')
+            except OSError:
+                pass
+
+    def read(self) -> Optional[List[int]]:
+        for _ in range(self.slots):
+            seq = self._header_seq()
+            if seq == self._last_read:
+                return None
+            offset = self._slot_offset(seq)
+            if SLOT_SEQ.unpack_from(self._map, offset)[0] != seq:
+                continue
+            pixels = array('I', self._map[offset + SLOT_SEQ.size:offset + self.slot_size])
+            if SLOT_SEQ.unpack_from(self._map, offset)[0] == seq:
+                self._last_read = seq
+                return pixels.tolist()
+        return None
+
+    def close(self) -> None:
+        for fd in (self._notify_fd, self._wait_fd):
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self._notify_fd = self._wait_fd = None
+        try:
+            self._map.close()
+        except (BufferError, ValueError):
+            pass
+
+class SharedStrip:
+    def __init__(self, ring: FrameRing) -> None:
+        self.ring = ring
+        self._pixels = array('I', [0] * ring.count)
+
+    def begin(self) -> None:
+        pass
+
+    def numPixels(self) -> int:
+        return len(self._pixels)
+
+    def setPixelColor(self, index: int, value: int) -> None:
+        self._pixels[index] = value & 0xFFFFFFFF
+
+    def getPixelColor(self, index: int) -> int:
+        return self._pixels[index]
+
+    def show(self) -> None:
+        self.ring.publish(self._pixels)
@@ -0,0 +1,222 @@
+import argparse
+import math
+import os
+import select
+import threading
+import time
+from array import array
+from functools import partial
+from typing import Any, Optional, Tuple
+from src.core.config import Config
+from src.utils.logger import Logger
+from src.utils.metrics import Metrics
+
+log = Logger()
+metrics = Metrics()
+
+FULL_SCALE = 32768.0
+
+def _load_numpy() -> Any:
+    try:
+        import numpy
+        return numpy
+    except ImportError:
+        return None
+
+def measure_python(block: memoryview, channels: int = 2, frame_stride: int = 4) -> Tuple[float, float]:
+    samples = block.cast('h')
+    stride = channels * frame_stride
+    lanes = [samples[channel::stride] for channel in range(channels)]
+    count = sum(len(lane) for lane in lanes)
+    if not count:
+        return 0.0, 0.0
+    peak = max(max(max(lane), -min(lane)) for lane in lanes if len(lane))
+    rms = math.sqrt(sum(s * s for lane in lanes for s in lane) / count)
+    return rms / FULL_SCALE, peak / FULL_SCALE
+
+def make_numpy_measure(np: Any):
+    def measure(block: memoryview) -> Tuple[float, float]:
+        samples = np.frombuffer(block, dtype='<i2')
+        if not samples.size:
+            return 0.0, 0.0
+        peak = max(int(samples.max()), -int(samples.min()))
+        scaled = samples.astype(np.float32)
+        rms = math.sqrt(float(np.dot(scaled, scaled)) / samples.size)
+        return rms / FULL_SCALE, peak / FULL_SCALE
+    return measure
+
+def to_meter(value: float, floor_db: float) -> float:
+    if value <= 0:
+        return 0.0
+    return max(0.0, min(1.0, 1.0 - (20.0 * math.log10(value)) / floor_db))
+
+class VUMeter:
+    def __init__(self, led_controller: Any, config: Optional[Config] = None) -> None:
+        self.config = config or Config()
+        self.led_controller = led_controller
+        meter_cfg = self.config.get('vu_meter', {})
+        self.fifo = meter_cfg.get('fifo', '/tmp/mpd.fifo')
+        self.fps = max(1, int(meter_cfg.get('fps', 30)))
+        sample_rate = int(meter_cfg.get('sample_rate', 44100))
+        channels = int(meter_cfg.get('channels', 2))
+        self.floor_db = -abs(float(meter_cfg.get('floor_db', 48)))
+        self.decay = float(meter_cfg.get('decay', 1.5)) / self.fps
+        self.peak_hold = int(float(meter_cfg.get('peak_hold', 1.0)) * self.fps)
+        self.idle_timeout = float(meter_cfg.get('idle_timeout', 0.5))
+
+        self.block_size = (sample_rate * channels * 2 // self.fps) & ~1
+        self._buffer = bytearray(self.block_size)
+        self._view = memoryview(self._buffer)
+
+        numpy = _load_numpy()
+        self.measure = make_numpy_measure(numpy) if numpy is not None else partial(measure_python, channels=channels)
+        log.debug("VU meter using %s, %d byte blocks", 'NumPy' if numpy is not None else 'pure Python', self.block_size)
+
+        self.running = False
+        self._thread = None
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        self._level = 0.0
+        self._peak = 0.0
+        self._peak_frames = 0
+
+    def start(self) -> None:
+        if self._thread:
+            return
+        try:
+            while os.read(self._wake_r, 64):
+                pass
+        except OSError:
+            pass
+        self.running = True
+        self._thread = threading.Thread(target=self._run, name='vu-meter', daemon=True)
+        self._thread.start()
+        log.ok(f"VU meter reading {self.fifo} at {self.fps} fps")
+
+    def stop(self) -> None:
+        self.running = False
+        try:
+            os.write(self._wake_w, b'\0')
+        except OSError:
+            pass
+        if self._thread:
+            self._thread.join(timeout=1)
+            self._thread = None
+        self.led_controller.stop_meter()
+
+    def _open(self) -> Optional[int]:
+        try:
+            return os.open(self.fifo, os.O_RDWR | os.O_NONBLOCK)
+        except OSError:
+            return None
+
+    def _read_block(self, fd: int, timeout: Optional[float]) -> Optional[bool]:
+        filled = 0
+        while filled < self.block_size and self.running:
+            ready, _, _ = select.select([fd, self._wake_r], [], [], timeout if not filled else self.idle_timeout)
+            if fd not in ready:
+                return False
+            try:
+                count = os.readv(fd, [self._view[filled:]])
+            except BlockingIOError:
+                continue
+            if count == 0:
+                return None
+            filled += count
+        return filled == self.block_size
+
+    def _idle(self) -> None:
+        self.led_controller.stop_meter()
+        self._level = self._peak = 0.0
+
+    def _run(self) -> None:
+        fd = None
+        idle = True
+        try:
+            while self.running:
+                if fd is None:
+                    fd = self._open()
+                    if fd is None:
+                        select.select([self._wake_r], [], [], 1)
+                        continue
+                result = self._read_block(fd, None if idle else self.idle_timeout)
+                if result is None:
+                    os.close(fd)
+                    fd = None
+                    select.select([self._wake_r], [], [], 1)
+                if not result:
+                    if not idle:
+                        self._idle()
+                    idle = True
+                    continue
+                idle = False
+                with metrics.timer('vu_meter.block'):
+                    rms, peak = self.measure(self._view)
+                self._render(to_meter(rms, self.floor_db), to_meter(peak, self.floor_db))
+        except Exception as e:
+            log.error(f"VU meter stopped: {e}")
+        finally:
+            if fd is not None:
+                os.close(fd)
+
+    def _render(self, level: float, peak: float) -> None:
+        self._level = max(level, self._level - self.decay)
+        if peak >= self._peak:
+            self._peak, self._peak_frames = peak, self.peak_hold
+        elif self._peak_frames > 0:
+            self._peak_frames -= 1
+        else:
+            self._peak = max(peak, self._peak - self.decay)
+        if not self.led_controller.show_meter(self._level, self._peak):
+            metrics.incr('vu_meter.frames_skipped')
+
+def generate_pcm(path: str, seconds: float, sample_rate: int = 44100) -> None:
+    frames = int(seconds * sample_rate)
+    with open(path, 'wb') as f:
+        chunk = array('h')
+        for n in range(frames):
+            t = n / sample_rate
+            envelope = 0.5 + 0.5 * math.sin(2 * math.pi * 0.5 * t)
+            value = int(envelope * 20000 * math.sin(2 * math.pi * (220 + 440 * t / seconds) * t))
+            chunk.extend((value, value))
+            if len(chunk) >= 65536:
+                chunk.tofile(f)
+                del chunk[:]
+        chunk.tofile(f)
+
+def benchmark(path: str, sample_rate: int = 44100, channels: int = 2, fps: int = 30) -> None:
+    block_size = (sample_rate * channels * 2 // fps) & ~1
+    buffer = bytearray(block_size)
+    view = memoryview(buffer)
+    numpy = _load_numpy()
+    candidates = [('python (every 4th frame)', partial(measure_python, channels=channels))]
+    if numpy is not None:
+        candidates.insert(0, ('numpy', make_numpy_measure(numpy)))
+
+    for name, measure in candidates:
+        blocks = 0
+        started = time.process_time()
+        with open(path, 'rb', buffering=0) as f:
+            while f.readinto(view) == block_size:
+                measure(view)
+                blocks += 1
+        cpu = time.process_time() - started
+        audio_seconds = blocks / fps
+        log.info(f"{name}: {blocks} blocks, {cpu * 1000.0 / max(1, blocks):.3f} ms/block, "
+                 f"{100.0 * cpu / max(audio_seconds, 1e-9):.2f}% CPU at {fps} fps")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='VU meter block processing benchmark')
+    parser.add_argument('pcm', help='Raw S16LE stereo PCM file')
+    parser.add_argument('--generate', type=float, metavar='SECONDS',
+                        help='Write a synthetic test signal of this length first')
+    parser.add_argument('--fps', type=int, default=30)
+    args = parser.parse_args()
+
+    if args.generate:
+        generate_pcm(args.pcm, args.generate)
+        log.ok(f"Wrote {args.generate:g}s of synthetic PCM to {args.pcm}")
+    benchmark(args.pcm, fps=args.fps)
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 import sys
 import os
 import argparse
+import atexit
 
 PROJECT_ROOT = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
 sys.path.insert(0, PROJECT_ROOT)
@@ -8,8 +9,12 @@ sys.path.insert(0, PROJECT_ROOT)
 os.chdir(PROJECT_ROOT)
 
 from service.player_service import PlayerService
+from service.multi_player import MultiPlayerService
 from core.signal_handler import SignalHandler
 from utils.logger import Logger
+from utils.profiler import SamplingProfiler
+from src.core.config import Config
+from src.utils.trace import Trace
 from src.__version__ import __version__, __copyright__
 
 log = Logger()
@@ -34,17 +39,39 @@ def main() -> None:
     parser.add_argument('--version', '-v', action='version', version=f'ADAM3-GPIO {__version__}')
     parser.add_argument('--no-wait-mpd', action='store_true',
                        help='Do not wait for MPD to be available (start immediately)')
+    parser.add_argument('--profile', type=float, metavar='SECONDS',
+                       help='Run the sampling profiler for SECONDS and write collapsed stacks')
+    parser.add_argument('--profile-interval', type=float, default=10, metavar='MS',
+                       help='Sampling interval in milliseconds (default: 10)')
+    parser.add_argument('--profile-output', default='/tmp', metavar='DIR',
+                       help='Directory for profile output (default: /tmp)')
+    parser.add_argument('--record', metavar='FILE',
+                       help='Record MPD responses and rendered frames to a trace file (.gz to compress)')
     args = parser.parse_args()
     
     print(print_banner())
+
+    if args.record:
+        Trace().start(args.record, Config().config)
+        atexit.register(Trace().stop)
+
+    if args.profile:
+        profiler = SamplingProfiler(args.profile, args.profile_interval / 1000.0, args.profile_output)
+        profiler.start()
+        atexit.register(profiler.stop)
     
     player_service = None
     signal_handler = SignalHandler()
     
     try:
         log.wait("Initializing player service")
-        player_service = PlayerService(no_wait_mpd=args.no_wait_mpd)
+        if Config().get('players'):
+            player_service = MultiPlayerService(no_wait_mpd=args.no_wait_mpd)
+        else:
+            player_service = PlayerService(no_wait_mpd=args.no_wait_mpd)
         signal_handler.register_cleanup(player_service.cleanup)
+        signal_handler.register_playback_stop(player_service.stop_playback)
+        signal_handler.register_stop(player_service.stop)
         log.ok("Player service is ready")
         player_service.start()
     except Exception as e:
@@ -53,5 +80,8 @@ def main() -> None:
             player_service.cleanup()
         sys.exit(1)
 
+    if signal_handler.shutdown_requested:
+        signal_handler.run_shutdown()
+
 if __name__ == "__main__":
     main()
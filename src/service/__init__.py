@@ -1,7 +1,8 @@
 from .player_service import PlayerService
+from .multi_player import MultiPlayerService
 from src.utils.logger import Logger
 
 log = Logger()
 log.debug("Initializing service components")
 
-__all__ = ["PlayerService"]
+__all__ = ["PlayerService", "MultiPlayerService"]
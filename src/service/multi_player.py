@@ -0,0 +1,143 @@
+import heapq
+import select
+import time
+from typing import List, Optional
+from src.core.config import Config, PlayerConfig, UpdateTrigger
+from src.core.shutdown import ShutdownSequencer, current_deadline
+from src.core.systemd import SystemdNotifier
+from src.service.player_service import PlayerService
+from src.utils.clock import Clock, SYSTEM_CLOCK
+from src.utils.logger import Logger
+from src.utils.metrics import Metrics
+
+log = Logger()
+metrics = Metrics()
+
+class MultiPlayerService:
+    MPD_TIMEOUT = 2.0
+    RECONNECT_BACKOFF = 1.0
+    RECONNECT_BACKOFF_MAX = 30.0
+
+    def __init__(self, no_wait_mpd: bool = False, clock: Optional[Clock] = None) -> None:
+        self.config = Config()
+        self.clock = clock or SYSTEM_CLOCK
+        self.running = False
+        self._stop_requested = False
+        self.update_trigger = UpdateTrigger(self.config)
+        self.services: List[PlayerService] = []
+
+        players = self.config.get('players', [])
+        log.info(f"Setting up {len(players)} players...")
+        for index, player in enumerate(players):
+            name = player.get('name') or f"player{index + 1}"
+            self.services.append(PlayerService(
+                no_wait_mpd=True,
+                config=PlayerConfig(self.config, name, index),
+                name=name,
+                watch_trigger=False,
+                clock=self.clock,
+                mpd_timeout=self.MPD_TIMEOUT
+            ))
+        self._backoff = [0.0] * len(self.services)
+
+        if not no_wait_mpd:
+            log.info("Players connect to MPD independently; startup wait skipped")
+        log.ok("Multi-player service initialized")
+
+    def _check_config_updates(self) -> None:
+        try:
+            if self.update_trigger.poll():
+                for service in self.services:
+                    service.apply_config_update()
+        except Exception as e:
+            log.error(f"Config update check failed: {e}")
+
+    def start(self) -> None:
+        log.info("Starting multi-player service")
+        if self._stop_requested:
+            return
+        self.running = True
+        schedule = [(self.clock.time(), index) for index in range(len(self.services))]
+        heapq.heapify(schedule)
+        notifier = SystemdNotifier()
+        notifier.configure(self.config.get('timing.watchdog_budget', 2),
+                           self.config.get('timing.status_interval', 5))
+
+        try:
+            while self.running and schedule:
+                due, index = heapq.heappop(schedule)
+                sleep_time = due - self.clock.time()
+                if sleep_time > 0:
+                    self.clock.sleep(sleep_time)
+
+                self._check_config_updates()
+
+                service = self.services[index]
+                tick_started = time.monotonic()
+                try:
+                    interval = service.tick()
+                except Exception as e:
+                    service.log.error(f"Player tick failed: {e}")
+                    interval = service.default_update_interval
+                notifier.ready()
+                notifier.loop_tick(time.monotonic() - tick_started, self.describe)
+
+                if service.mpd.connected:
+                    self._backoff[index] = 0.0
+                else:
+                    self._backoff[index] = min(self.RECONNECT_BACKOFF_MAX,
+                                               max(self.RECONNECT_BACKOFF, self._backoff[index] * 2))
+                    interval = max(interval, self._backoff[index])
+
+                next_due = due + interval
+                now = self.clock.time()
+                if next_due < now:
+                    metrics.incr('service.tick_overruns')
+                    next_due = now
+                heapq.heappush(schedule, (next_due, index))
+
+                if self.running and all(s.power_save.asleep and s.mpd.connected for s in self.services):
+                    self._wait_for_activity()
+                    now = self.clock.time()
+                    schedule = [(now, i) for i in range(len(self.services))]
+
+        except Exception as e:
+            log.error(f"Multi-player service error: {e}")
+            self.cleanup()
+
+    def _wait_for_activity(self) -> None:
+        notifier = SystemdNotifier()
+        log.debug("Power save: all players asleep, waiting for MPD or button activity")
+        drain = True
+        while self.running:
+            readers = []
+            for service in self.services:
+                readers.extend(service.begin_wait(drain))
+            drain = False
+            try:
+                ready, _, _ = select.select(readers, [], [], notifier.watchdog_interval)
+            except (OSError, ValueError):
+                ready = [fd for fd in readers if isinstance(fd, int)]
+            woken = [service.end_wait(ready) for service in self.services]
+            if any(woken):
+                return
+            notifier.keepalive()
+
+    def describe(self) -> str:
+        return "; ".join(f"{service.name}: {service.describe()}" for service in self.services)
+
+    def stop(self) -> None:
+        self._stop_requested = True
+        self.running = False
+        for service in self.services:
+            service.wake()
+
+    def stop_playback(self) -> bool:
+        return all([service.stop_playback() for service in self.services])
+
+    def cleanup(self) -> None:
+        log.info("Shutting down multi-player service")
+        self.running = False
+        sequencer = ShutdownSequencer(self.config.get('timing.shutdown_deadline', 3), current_deadline())
+        sequencer.run([[(service.name, service.cleanup) for service in self.services]])
+        log.ok("Multi-player service shutdown complete")
@@ -1,59 +1,368 @@
-import time
 import os
-from typing import Dict, Any, Optional, Tuple
-from src.core.config import Config
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple, Callable, Iterator
+from src.core.config import Config, UpdateTrigger
+from src.core.events import EventBus, OptionsChanged, SongChanged, StateChanged, StatusDiffer, StatusUpdated, VolumeChanged
+from src.core.library import Library
 from src.core.mpd_client import MPDClient
+from src.core.shutdown import ShutdownSequencer, current_deadline
+from src.core.song_cache import SongCache, SongRecord
+from src.core.state_bus import DEFAULT_PATH as STATE_BUS_PATH, PlayerState, StateBusWriter
+from src.core.systemd import SystemdNotifier
+from src.core.warm_state import WarmState, load_warm_state, save_warm_state
 from src.hardware.led.controller import LEDController
-from src.hardware.display.tm1652 import TM1652
+from src.hardware.led.vu_meter import VUMeter
+from src.hardware.display.font import Marquee
+from src.hardware.display.pipeline import create_display
+from src.hardware.display.segment_display import SegmentDisplay
 from src.hardware.button.controller import ButtonController
+from src.service.power_save import PowerSave
+from src.service.status_server import StatusServer
+from src.utils.clock import Clock, SYSTEM_CLOCK
 from src.utils.logger import Logger
+from src.utils.metrics import Metrics
 from src.utils.paths import PROJECT_ROOT
+from src.utils.trace import Trace
 
 log = Logger()
+metrics = Metrics()
+trace = Trace()
 
 DISPLAY_MODES = {
     'ELAPSED': 'elapsed',
     'REMAINING': 'remaining'
 }
 
+ACTIVITY_SUBSYSTEMS = ('player', 'mixer', 'options', 'playlist')
+
+class ArmedTrack(NamedTuple):
+    song_id: str
+    song: SongRecord
+    at: float
+
 class PlayerService:
-    def __init__(self, no_wait_mpd: bool = False) -> None:
-        log.debug("Initializing player service")
-        self.config = Config()
+    BOUNDARY_RESYNC = 0.25
+
+    def __init__(self, no_wait_mpd: bool = False, config: Optional[Config] = None,
+                 name: str = '', watch_trigger: bool = True,
+                 devices: Optional[Dict[str, Any]] = None, clock: Optional[Clock] = None,
+                 mpd_timeout: Optional[float] = None) -> None:
+        self.name = name
+        self.clock = clock or SYSTEM_CLOCK
+        self.log = log.child(name) if name else log
+        self.log.debug("Initializing player service")
+        self._boot_started = time.monotonic()
+        self._boot_step = 0
+        self._first_frame_pending = True
+        self.config = config or Config()
         self.no_wait_mpd = no_wait_mpd
+        self.update_trigger = UpdateTrigger(self.config) if watch_trigger else None
 
         mpd_config = self.config.get('mpd', {})
-        self.mpd = MPDClient(
-            host=mpd_config.get('host', 'localhost'),
-            port=mpd_config.get('port', 6600)
-        )
-
-        log.info("Setting up hardware controllers...")
-        self.led_controller = LEDController()
-
-        self.display = TM1652()
-        self.display.show_dashes()
-        self.button_controller = ButtonController()
 
+        if devices is not None:
+            self.display = devices.get('display')
+            self.led_controller = devices.get('led_controller')
+            self.button_controller = devices.get('button_controller')
+            self.mpd = devices.get('mpd')
+        else:
+            self.log.info("Setting up hardware controllers...")
+            with self._startup_phase('hardware'):
+                with ThreadPoolExecutor(max_workers=4, thread_name_prefix='bringup') as pool:
+                    display = pool.submit(self._timed_init, 'display', self._init_display)
+                    leds = pool.submit(self._timed_init, 'leds', lambda: LEDController(self.config, clock=self.clock))
+                    button = pool.submit(self._timed_init, 'button', lambda: ButtonController(self.config, clock=self.clock))
+                    mpd = pool.submit(self._timed_init, 'mpd_client', lambda: MPDClient(
+                        host=mpd_config.get('host', 'localhost'),
+                        port=mpd_config.get('port', 6600),
+                        timeout=mpd_config.get('timeout') or mpd_timeout
+                    ))
+                    self.display = display.result()
+                    self.led_controller = leds.result()
+                    self.button_controller = button.result()
+                    self.mpd = mpd.result()
 
         effects_cfg = self.config.get('effects', {})
         self.effects_enabled = effects_cfg.get('enabled', True)
         self.effects_events = effects_cfg.get('events', {})
 
         self.running = False
-        self.last_config_check = 0
+        self._stop_requested = False
+        self.now = self.clock.time()
         self.last_song_id = None
+        self._track_check_pending = False
+        self._armed: Optional[ArmedTrack] = None
+        self._preflipped: Optional[ArmedTrack] = None
+        self._marquee = None
+        self._next_poll = 0.0
+        self._poll_due = True
+        self._screen: Optional[str] = None
+        self.events = EventBus()
+        self.status_events = StatusDiffer()
+        self.events.subscribe(OptionsChanged, lambda event: self.led_controller.update_from_mpd_status(event.status))
+        self.events.subscribe(VolumeChanged, lambda event: self.show_volume(event.status))
+        self.events.subscribe(StateChanged, self._on_track_event)
+        self.events.subscribe(SongChanged, self._on_track_event)
+        self.events.subscribe(StatusUpdated, lambda event: self._update_display(event.status))
         self._playlist_cache = {}
         self._playlist_version = None
+        self._playlist_total = -1.0
+        self.song_cache = SongCache(self.config.get('cache.songs', 128))
+        self.state_bus = self._open_state_bus()
+        self.status_server = self._open_status_server()
+        self.power_save = PowerSave(self.config)
+        self._power_level = 1.0
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+        if self.button_controller is not None:
+            self.button_controller.on_activity = self.wake
+
+        self.vu_meter = None
+        if self.config.get('vu_meter.enable', False):
+            self.vu_meter = VUMeter(self.led_controller, self.config)
+            self.vu_meter.start()
+
+        self.library = None
+        library_cfg = self.config.get('library', {})
+        if library_cfg.get('enable', False):
+            self.library = Library(
+                host=mpd_config.get('host', 'localhost'),
+                port=mpd_config.get('port', 6600),
+                path=self._player_file(library_cfg.get('file', 'config/.library.json'))
+            )
+            self.library.start()
+            if self.button_controller is not None:
+                self.button_controller.on_short_press = self.library.request_roulette
 
-        log.info("Loading service configurations...")
+        self.log.info("Loading service configurations...")
         self._load_config()
-        log.ok("Player service initialized")
+        self._warm_state_path = self._warm_state_file()
+        self._warm_saved = None
+        self._warm_saved_at = self.now
+        self._warm_restored = None
+        self._warm_painted = self._restore_warm_state()
+        metrics.start_server()
+        self.log.ok("Player service initialized")
+
+    @contextmanager
+    def _startup_phase(self, name: str) -> Iterator[None]:
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.monotonic() - started) * 1000.0
+            metrics.observe(f'startup.{name}', elapsed_ms)
+            self.log.info("Startup phase %s: %.0f ms", name, elapsed_ms)
+
+    def _timed_init(self, name: str, factory: Callable[[], Any]) -> Any:
+        with self._startup_phase(name):
+            return factory()
+
+    def _init_display(self) -> SegmentDisplay:
+        display = create_display(self.config, self.clock)
+        display.show_boot_frame(self._boot_step)
+        return display
+
+    def _advance_boot_animation(self) -> None:
+        self._boot_step += 1
+        self.display.show_boot_frame(self._boot_step)
+
+    def _open_state_bus(self) -> Optional[StateBusWriter]:
+        bus_cfg = self.config.get('state_bus', {})
+        if not bus_cfg.get('enable', False):
+            return None
+        path = bus_cfg.get('path') or STATE_BUS_PATH
+        if self.name and not self.config.get('state_bus.path'):
+            path = f"{path}-{self.name}"
+        try:
+            bus = StateBusWriter(path)
+            self.log.ok(f"Publishing player state to {path}")
+            return bus
+        except OSError as e:
+            self.log.error(f"State bus unavailable: {e}")
+            return None
+
+    def _open_status_server(self) -> Optional[StatusServer]:
+        server_cfg = self.config.get('status_server', {})
+        if not server_cfg.get('enable', False):
+            return None
+        server = StatusServer(
+            host=server_cfg.get('host', '127.0.0.1'),
+            port=server_cfg.get('port', 8600),
+            client_buffer=server_cfg.get('client_buffer', 64),
+            max_clients=server_cfg.get('max_clients', 16)
+        )
+        return server if server.start() else None
+
+    def _publish_state(self, status: Dict[str, Any]) -> None:
+        if self.state_bus is None and self.status_server is None:
+            return
+        try:
+            self._refresh_playlist_cache(status)
+            state = PlayerState.from_mpd(
+                status,
+                updated_at=self.now,
+                playlist_total=self._playlist_total,
+                display_mode=self.display_mode or '',
+                pid=os.getpid()
+            )
+            if self.state_bus is not None:
+                self.state_bus.publish(state)
+            if self.status_server is not None:
+                snapshot = state._asdict()
+                del snapshot['updated_at'], snapshot['pid']
+                frame = getattr(self.display, 'current_frame', None)
+                snapshot['frame'] = frame.hex() if frame else None
+                self.status_server.publish(snapshot)
+        except Exception as e:
+            self.log.error(f"State publish failed: {e}")
+
+    def wake(self) -> None:
+        try:
+            os.write(self._wake_w, b'\0')
+        except OSError:
+            pass
+
+    def _apply_power_level(self, level: float, status: Dict[str, Any]) -> None:
+        if level == self._power_level:
+            return
+        previous, self._power_level = self._power_level, level
+
+        if level == 0.0:
+            self.log.info("Power save: display and LEDs blanked")
+            metrics.incr('power_save.sleeps')
+            self._marquee = None
+            self.display.clear()
+            self.led_controller.all_off()
+            return
+
+        self.display.dim(level)
+        self.led_controller.set_dim(level)
+        if previous == 0.0:
+            self.led_controller.update_from_mpd_status(status)
+            self.log.info("Power save: resumed")
+
+    def _wait_for_activity(self) -> None:
+        notifier = SystemdNotifier()
+        self.log.debug("Power save: waiting for MPD or button activity")
+        self._drain_wake_pipe()
+        changed = None
+        while self.running:
+            changed = self.mpd.wait_idle(self._wake_r, notifier.watchdog_interval, ACTIVITY_SUBSYSTEMS)
+            if self._is_activity(changed):
+                break
+            notifier.keepalive()
+        self._woken(changed)
+
+    def begin_wait(self, drain: bool = True) -> List[Any]:
+        if drain:
+            self._drain_wake_pipe()
+        readers: List[Any] = [self._wake_r]
+        if self.mpd.begin_idle(ACTIVITY_SUBSYSTEMS):
+            readers.append(self.mpd)
+        return readers
+
+    def end_wait(self, ready: List[Any]) -> bool:
+        changed = self.mpd.end_idle(self.mpd in ready, self._wake_r in ready)
+        if not self._is_activity(changed):
+            return False
+        self._woken(changed)
+        return True
+
+    @staticmethod
+    def _is_activity(changed: Optional[List[str]]) -> bool:
+        return changed is not None and (not changed or 'wake' in changed
+                                        or bool(set(changed) & set(ACTIVITY_SUBSYSTEMS)))
+
+    def _woken(self, changed: Optional[List[str]]) -> None:
+        self._drain_wake_pipe()
+        self._poll_due = True
+        self.power_save.wake(self.clock.time())
+        self.log.debug("Power save: woken by %s", changed if self.running else 'shutdown')
+
+    def _drain_wake_pipe(self) -> None:
+        try:
+            while os.read(self._wake_r, 64):
+                pass
+        except OSError:
+            pass
+
+    def _warm_state_file(self) -> Optional[str]:
+        warm_cfg = self.config.get('cache.warm_state', {})
+        if not warm_cfg.get('enable', False):
+            return None
+        return self._player_file(warm_cfg.get('file', 'config/.warm_state'))
+
+    def _player_file(self, path: str) -> str:
+        if self.name:
+            path = f"{path}-{self.name}"
+        return path if os.path.isabs(path) else os.path.join(PROJECT_ROOT, path)
+
+    def _restore_warm_state(self) -> bool:
+        if not self._warm_state_path:
+            return False
+        warm = load_warm_state(self._warm_state_path)
+        if warm is None:
+            return False
+
+        self._warm_restored = warm
+        self._playlist_version = str(warm.playlist_version)
+        self._playlist_cache = {'total_tracks': warm.track_count, 'tracks': []}
+        self._playlist_total = warm.playlist_total
+        if warm.state != 'stop' and 1 <= warm.track <= 99:
+            self.display.show_track_number(warm.track)
+        else:
+            self.display.show_track_total(warm.track_count)
+        self.log.info("Restored warm state: %d tracks, playlist version %d", warm.track_count, warm.playlist_version)
+        return True
+
+    def _save_warm_state(self, force: bool = False) -> None:
+        if not self._warm_state_path:
+            return
+        interval = self.config.get('cache.warm_state.save_interval', 60)
+        if not force and self.now - self._warm_saved_at < interval:
+            return
+        self._warm_saved_at = self.now
+
+        status = self.status_events.status
+        if not status:
+            return
+        try:
+            if not force:
+                self._refresh_playlist_cache(status)
+            if self._playlist_version is None:
+                return
+            song_id = status.get('songid')
+            record = self.song_cache.get(song_id, status.get('playlist')) if song_id else None
+            track = record.track if record and record.track is not None else -1
+            restored = self._warm_restored
+            if record is None and restored and str(restored.song_id) == song_id:
+                track = restored.track
+            warm = WarmState(
+                saved_at=self.clock.time(),
+                playlist_version=int(self._playlist_version or 0),
+                track_count=int(self._playlist_cache.get('total_tracks', 0)),
+                playlist_total=max(0.0, self._playlist_total),
+                song_id=int(song_id or -1),
+                track=track,
+                state=status.get('state', 'stop'),
+                volume=int(status.get('volume', -1)),
+                elapsed=float(status.get('elapsed', 0))
+            )
+        except (TypeError, ValueError) as e:
+            self.log.error(f"Warm state snapshot failed: {e}")
+            return
+
+        packed = warm._replace(saved_at=0.0, elapsed=0.0).pack()
+        if packed != self._warm_saved and save_warm_state(self._warm_state_path, warm):
+            self._warm_saved = packed
 
     def _load_config(self) -> None:
-        log.debug("Loading service configuration")
+        self.log.debug("Loading service configuration")
         self.display_mode = self.config.get('display.mode', DISPLAY_MODES['ELAPSED'])
-        self.last_volume = None
         self.volume_display_until = 0
         self.default_update_interval = self.config.get('timing.update_interval', 0.5)
         self.volume_update_interval = self.config.get('timing.volume_update_interval', 0.1)
@@ -63,13 +372,21 @@ class PlayerService:
         self._load_display_config()
 
     def _load_display_config(self) -> None:
-        log.debug("Loading display configuration")
+        self.log.debug("Loading display configuration")
         self._load_stop_mode_config()
         self.pause_blink_interval = self.config.get('display.pause_mode.blink_interval', 1)
+        self.pause_style = self.config.get('display.pause_mode.style', 'blink')
         track_cfg = self.config.get('display.play_mode.track_number', {})
         self.track_number_time = track_cfg.get('display_time', 2)
+        self.track_prefetch = track_cfg.get('prefetch', True)
+        self.track_confirm_time = track_cfg.get('confirm_time', 1.5)
+        scroll_cfg = self.config.get('display.play_mode.title_scroll', {})
+        self.title_scroll_enabled = scroll_cfg.get('enabled', False)
+        self.title_scroll_fps = scroll_cfg.get('fps', 4)
+        self.title_scroll_format = scroll_cfg.get('format', '{artist} - {title}')
 
     def _load_stop_mode_config(self) -> None:
+        self.stop_symbol = self.config.get('display.stop_mode.symbol', '----')
         self.stop_mode_times = {
             'symbol': self.config.get('display.stop_mode.stop_symbol_time', 2),
             'tracks': self.config.get('display.stop_mode.track_total_time', 2),
@@ -77,7 +394,7 @@ class PlayerService:
         }
 
     def _handle_config_update(self) -> None:
-        log.info("Processing configuration update")
+        self.log.info("Processing configuration update")
         
         self.display_mode = self.config.get('display.mode', DISPLAY_MODES['ELAPSED'])
         self._load_display_config()
@@ -106,8 +423,14 @@ class PlayerService:
             return merged
         return None
 
+    def _set_screen(self, name: str, fade: bool = True) -> None:
+        if name != self._screen:
+            if fade and self._screen is not None:
+                self.display.fade()
+            self._screen = name
+
     def _update_stop_display(self) -> None:
-        current_time = time.time()
+        current_time = self.now
 
         current_duration = self.stop_mode_times.get(
             ['symbol', 'tracks', 'total'][self.stop_display_state],
@@ -117,83 +440,187 @@ class PlayerService:
         if current_time - self.stop_state_changed_at >= current_duration:
             self.stop_display_state = (self.stop_display_state + 1) % 3
             self.stop_state_changed_at = current_time
-            log.debug(f"Stop display state changed to {self.stop_display_state}")
+            self.log.debug("Stop display state changed to %d", self.stop_display_state)
 
         status = self.mpd.get_status()
         if status:
-            playlist_version = status.get('playlist', '0')
-
-            if playlist_version != self._playlist_version:
-                self._playlist_cache = self.mpd.get_playlist_info()
-                self._playlist_version = playlist_version
-                log.debug("Playlist cache updated")
+            self._refresh_playlist_cache(status)
 
         playlist_info = self._playlist_cache
 
+        self._set_screen(f"stop{self.stop_display_state}")
         if self.stop_display_state == 0:
-            self.display.show_dashes()
+            self.display.show_text(self.stop_symbol)
         elif self.stop_display_state == 1:
             self.display.show_track_total(playlist_info.get('total_tracks', 0))
         elif self.stop_display_state == 2:
-            total_time = sum(
-                float(track.get('duration', 0))
-                for track in playlist_info.get('tracks', [])
-            )
+            total_time = max(0, self._playlist_total)
             minutes = int(total_time) // 60
             seconds = int(total_time) % 60
             self.display.show_time(minutes, seconds, True)
 
+    def _refresh_playlist_cache(self, status: Dict[str, Any]) -> None:
+        playlist_version = status.get('playlist', '0')
+        if (playlist_version == self._playlist_version and
+                status.get('playlistlength', str(self._playlist_cache.get('total_tracks', 0))) ==
+                str(self._playlist_cache.get('total_tracks', 0))):
+            return
+
+        self._playlist_cache = self.mpd.get_playlist_info()
+        self._playlist_version = playlist_version
+        self._playlist_total = sum(
+            float(track.get('duration', 0))
+            for track in self._playlist_cache.get('tracks', [])
+        )
+        self._prefill_song_cache(self._playlist_cache.get('tracks', []), playlist_version)
+        self.log.debug("Playlist cache updated")
+
+    def _prefill_song_cache(self, tracks: List[Dict[str, Any]], playlist_version: str) -> None:
+        if len(tracks) > self.song_cache.max_size:
+            return
+        for track in tracks:
+            if 'id' in track:
+                self.song_cache.put(track['id'], SongRecord.from_mpd(track), playlist_version)
+
+    def _lookup_song(self, song_id: str, status: Dict[str, Any]) -> Optional[SongRecord]:
+        playlist_version = status.get('playlist')
+        record = self.song_cache.get(song_id, playlist_version)
+        if record is None:
+            current_song = self.mpd.get_current_song()
+            if not current_song:
+                return None
+            record = SongRecord.from_mpd(current_song)
+            self.song_cache.put(current_song.get('id', song_id), record, playlist_version)
+        return record
+
+    def _on_track_event(self, event: Any) -> None:
+        self._track_check_pending = True
+
     def _check_track_change(self, status: Dict[str, Any]) -> None:
+        if not self._track_check_pending:
+            return
         song_id = status.get('songid', '0')
 
         track_config = self.config.get('display.play_mode.track_number', {})
         show_number = track_config.get('show_number', True)
-        display_time = self.track_number_time
 
-        if show_number and ((song_id and song_id != self.last_song_id) or
+        if (show_number or self.title_scroll_enabled) and ((song_id and song_id != self.last_song_id) or
                           (not hasattr(self, '_last_state') or self._last_state != 'play')):
 
-            current_song = self.mpd.get_current_song()
-            if not current_song:
+            song = self._lookup_song(song_id, status)
+            if not song:
                 return
 
+            self._track_check_pending = False
+            self._preflipped = None
             self.last_song_id = song_id
-            track_number = current_song.get('track', '0')
-
-            if track_number.isdigit():
-                track_num = int(track_number)
-                if 1 <= track_num <= 99:
-                    log.debug(f"Track changed to {track_num}")
-                    self.track_display_until = time.time() + display_time
-                    self.display.show_track_number(track_num)
-
-                    event = self._get_event(
-                        'on_track_change',
-                        {
-                            "effect": "flash_active",
-                            "repeat_count": 2,
-                            "on_duration": 0.20,
-                            "off_duration": 0.10,
-                            "r": 0,
-                            "g": 255,
-                            "b": 0,
-                        },
+            self._show_track_change(song)
+        else:
+            self._track_check_pending = False
+
+    def _show_track_change(self, song: SongRecord) -> None:
+        self._marquee = None
+        show_number = self.config.get('display.play_mode.track_number.show_number', True)
+        if show_number and song.track is not None:
+            track_num = song.track
+            if 1 <= track_num <= 99:
+                self.log.debug("Track changed to %d", track_num)
+                self.track_display_until = self.now + self.track_number_time
+                self._set_screen('track')
+                self.display.show_track_number(track_num)
+
+                event = self._get_event(
+                    'on_track_change',
+                    {
+                        "effect": "flash_active",
+                        "repeat_count": 2,
+                        "on_duration": 0.20,
+                        "off_duration": 0.10,
+                        "r": 0,
+                        "g": 255,
+                        "b": 0,
+                    },
+                )
+                effect = (event or {}).get('effect')
+                if effect == 'flash_active':
+                    self.led_controller.flash_active(
+                        event.get('r', 0), event.get('g', 255), event.get('b', 0),
+                        times=event.get('repeat_count'),
+                        on_ms=int(round(event.get('on_duration') * 1000)),
+                        off_ms=int(round(event.get('off_duration') * 1000))
+                    )
+                elif effect == 'flash_all':
+                    self.led_controller.flash_all(
+                        event.get('r', 0), event.get('g', 255), event.get('b', 0),
+                        times=event.get('repeat_count'),
+                        on_ms=int(round(event.get('on_duration') * 1000)),
+                        off_ms=int(round(event.get('off_duration') * 1000))
                     )
-                    effect = (event or {}).get('effect')
-                    if effect == 'flash_active':
-                        self.led_controller.flash_active(
-                            event.get('r', 0), event.get('g', 255), event.get('b', 0),
-                            times=event.get('repeat_count'),
-                            on_ms=int(round(event.get('on_duration') * 1000)),
-                            off_ms=int(round(event.get('off_duration') * 1000))
-                        )
-                    elif effect == 'flash_all':
-                        self.led_controller.flash_all(
-                            event.get('r', 0), event.get('g', 255), event.get('b', 0),
-                            times=event.get('repeat_count'),
-                            on_ms=int(round(event.get('on_duration') * 1000)),
-                            off_ms=int(round(event.get('off_duration') * 1000))
-                        )
+
+        if self.title_scroll_enabled:
+            self._start_title_scroll(song)
+
+    def _arm_next_track(self, status: Dict[str, Any]) -> None:
+        next_id = status.get('nextsongid')
+        if (not self.track_prefetch or not next_id or next_id == status.get('songid') or
+                status.get('single', '0') != '0'):
+            self._armed = None
+            return
+        try:
+            at = self.now + float(status['duration']) - float(status['elapsed'])
+        except (KeyError, ValueError, TypeError):
+            self._armed = None
+            return
+
+        armed = self._armed
+        if armed is not None and armed.song_id == next_id:
+            if abs(armed.at - at) > self.BOUNDARY_RESYNC:
+                self._armed = armed._replace(at=at)
+            return
+
+        playlist_version = status.get('playlist')
+        song = self.song_cache.get(next_id, playlist_version)
+        if song is None:
+            next_song = self.mpd.get_song(next_id)
+            if not next_song:
+                self._armed = None
+                return
+            song = SongRecord.from_mpd(next_song)
+            self.song_cache.put(next_id, song, playlist_version)
+        self._armed = ArmedTrack(next_id, song, at)
+
+    def _check_track_boundary(self, status: Dict[str, Any]) -> None:
+        song_id = status.get('songid')
+        preflipped = self._preflipped
+        if preflipped is not None:
+            if song_id == preflipped.song_id:
+                self._preflipped = None
+                metrics.incr('service.track_preflip_confirmed')
+            elif self.now >= preflipped.at + self.track_confirm_time:
+                self._preflipped = None
+                metrics.incr('service.track_preflip_missed')
+                self.log.debug("Predicted track %s did not start, showing current track", preflipped.song_id)
+                self.last_song_id = None
+                self._track_check_pending = True
+            return
+
+        armed = self._armed
+        if armed is None or self.now < armed.at or song_id != self.last_song_id:
+            return
+        self._armed = None
+        self._preflipped = armed
+        self.last_song_id = armed.song_id
+        self._show_track_change(armed.song)
+
+    def _start_title_scroll(self, song: SongRecord) -> None:
+        try:
+            text = self.title_scroll_format.format(artist=song.artist, title=song.title).strip(' -')
+        except (KeyError, IndexError, ValueError):
+            text = song.title
+        if not text:
+            return
+        self._marquee = Marquee(text, fps=self.title_scroll_fps, hold=self.track_number_time)
+        self._marquee.start(max(self.now, self.track_display_until))
 
     def _convert_time_to_minutes_seconds(self, time_value: float) -> Tuple[Optional[int], Optional[int]]:
         try:
@@ -216,7 +643,11 @@ class PlayerService:
             return None, None
 
     def _update_pause_display(self, elapsed_time: str, total_time: str) -> None:
-        phase = int(time.time() / self.pause_blink_interval) % 2
+        if self.pause_style == 'pulse' and self.display.pulse(True):
+            self._update_time_display(elapsed_time, total_time)
+            return
+
+        phase = int(self.now / self.pause_blink_interval) % 2
 
         if phase == 0:
             minutes, seconds = self._calculate_display_time(elapsed_time, total_time)
@@ -235,11 +666,19 @@ class PlayerService:
             self.display.show_dashes()
 
     def _update_display(self, status: Dict[str, Any]) -> None:
-        current_time = time.time()
+        with metrics.timer('service.update_display'):
+            self._render_status(status)
+
+    def _render_status(self, status: Dict[str, Any]) -> None:
+        current_time = self.now
         state = status.get('state', 'stop')
 
+        if state != 'pause':
+            self.display.pulse(False)
+
         if current_time < self.volume_display_until:
             current_volume = int(status.get('volume', '0'))
+            self._set_screen('volume', fade=False)
             self.display.show_volume(current_volume)
             return
 
@@ -247,14 +686,25 @@ class PlayerService:
         total_time = status.get('duration', '0')
 
         if state == 'play':
+            self._arm_next_track(status)
+            self._check_track_boundary(status)
             self._check_track_change(status)
 
             if current_time >= self.track_display_until:
-                self._update_time_display(elapsed_time, total_time)
+                if self._marquee and not self._marquee.finished(current_time):
+                    self._set_screen('marquee')
+                    self.display.show_segments(self._marquee.frame_at(current_time))
+                else:
+                    self._marquee = None
+                    self._set_screen('time')
+                    self._update_time_display(elapsed_time, total_time)
 
         elif state == 'pause':
+            self._marquee = None
+            self._set_screen('time')
             self._update_pause_display(elapsed_time, total_time)
         elif state == 'stop':
+            self._marquee = None
             if not hasattr(self, '_last_state') or self._last_state != 'stop':
                 self.stop_display_state = 0
                 self.stop_state_changed_at = current_time
@@ -265,123 +715,195 @@ class PlayerService:
     def show_volume(self, status: Dict[str, Any]) -> None:
         try:
             current_volume = int(status.get('volume', '0'))
-            log.debug(f"Displaying volume: {current_volume}")
+            self.log.debug("Displaying volume: %d", current_volume)
+            self._set_screen('volume', fade=False)
             self.display.show_volume(current_volume)
             duration_seconds = self.config.get('timing.volume_display_duration', 3)
-            self.volume_display_until = time.time() + duration_seconds
+            self.volume_display_until = self.now + duration_seconds
             
         except (ValueError, TypeError):
             return
 
     def _check_config_updates(self) -> None:
-        current_time = time.time()
-        update_config = self.config.get('updates.trigger', {})
-        check_interval = update_config.get('check_interval', 2)
-        trigger_file = update_config.get('file', '.update_trigger')
-        debounce_time = update_config.get('debounce_time', 0.1)
-
-        if (current_time - self.last_config_check) >= check_interval:
-            trigger_path = os.path.join(PROJECT_ROOT, 'config', trigger_file)
-
-            try:
-                os.stat(trigger_path)
-
-                log.debug("Configuration update triggered")
-                time.sleep(debounce_time)
-
-                self.config.load_config()
+        try:
+            if self.update_trigger and self.update_trigger.poll():
+                self.apply_config_update()
+        except Exception as e:
+            self.log.error(f"Config update check failed: {e}")
 
-                new_brightness = self.config.get('display.brightness')
-                new_display_mode = self.config.get('display.mode')
+    def apply_config_update(self) -> None:
+        new_brightness = self.config.get('display.brightness')
+        new_display_mode = self.config.get('display.mode')
 
-                self.led_controller._setup_leds()
+        self.led_controller._setup_leds()
+        self.power_save.configure(self.config)
 
-                if new_brightness != self.display._brightness:
-                    self.display.update_brightness()
+        if new_brightness != self.display._brightness:
+            self.display.update_brightness()
 
-                if new_display_mode != self.display_mode:
-                    log.debug("Updating display mode")
-                    self.display_mode = new_display_mode
-                    status = self.mpd.get_status()
-                    if status:
-                        self._update_display(status)
+        if new_display_mode != self.display_mode:
+            self.log.debug("Updating display mode")
+            self.display_mode = new_display_mode
+            status = self.mpd.get_status()
+            if status:
+                self._update_display(status)
 
-                os.unlink(trigger_path)
-            except FileNotFoundError:
-                pass
-            except Exception as e:
-                log.error(f"Config update check failed: {e}")
-            finally:
-                self.last_config_check = current_time
+    def prepare(self) -> bool:
+        if not self.no_wait_mpd:
+            with self._startup_phase('mpd_wait'):
+                mpd_ready = self.mpd.wait_for_mpd(
+                    on_wait=None if self._warm_painted else self._advance_boot_animation,
+                    cancelled=lambda: self._stop_requested
+                )
+            if not mpd_ready:
+                self.log.error("MPD connection failed")
+                return False
+        else:
+            self.log.info("MPD wait disabled")
+        return True
+
+    def tick(self) -> float:
+        self.now = self.clock.time()
+        trace.record('tick', self.now)
+        if not self._poll_due and self.now < self._next_poll and self._animate():
+            return self._next_wake()
+        with metrics.timer('service.tick'):
+            self._check_config_updates()
+
+            status = self.mpd.get_status()
+            if status:
+                events = self.status_events.diff(status)
+                if any(isinstance(event, VolumeChanged) for event in events):
+                    self.power_save.wake(self.now)
+                self._apply_power_level(self.power_save.update(status.get('state', 'stop'), self.now), status)
+
+                if not self.power_save.asleep:
+                    self.events.publish_all(events)
+                self._publish_state(status)
+                self._save_warm_state()
+
+                if self._first_frame_pending:
+                    self._first_frame_pending = False
+                    elapsed_ms = (time.monotonic() - self._boot_started) * 1000.0
+                    metrics.observe('startup.first_frame', elapsed_ms)
+                    self.log.info("First frame after %.0f ms", elapsed_ms)
+
+        if self.now < self.volume_display_until:
+            interval = self.volume_update_interval
+        else:
+            interval = self.default_update_interval
+        if self._armed is not None and self.now < self._armed.at < self.now + interval:
+            interval = self._armed.at - self.now
+        self._next_poll = self.now + interval
+        return self._next_wake()
+
+    def _animate(self) -> bool:
+        marquee = self._marquee
+        if marquee is None or self.now < self.track_display_until or self.now < self.volume_display_until:
+            return True
+        if marquee.finished(self.now):
+            return False
+        self._set_screen('marquee')
+        self.display.show_segments(marquee.frame_at(self.now))
+        return True
+
+    def _next_wake(self) -> float:
+        wake = self._next_poll
+        if self._marquee is not None:
+            wake = min(wake, self._marquee.next_change(max(self.now, self.track_display_until)))
+        due = self.display.step(self.now)
+        if due is not None:
+            wake = min(wake, due)
+        self._poll_due = wake >= self._next_poll
+        return max(0.0, wake - self.now)
 
     def start(self) -> None:
-        log.info("Starting player service")
+        self.log.info("Starting player service")
 
-        if not self.no_wait_mpd:
-            if not self.mpd.wait_for_mpd():
-                log.error("MPD connection failed")
-                return
-        else:
-            log.info("MPD wait disabled")
+        if not self.prepare() or self._stop_requested:
+            return
 
         self.running = True
-        next_update = time.time()
+        next_update = self.clock.time()
+        notifier = SystemdNotifier()
+        notifier.configure(self.config.get('timing.watchdog_budget', 2),
+                           self.config.get('timing.status_interval', 5))
 
         try:
             while self.running:
-                self._check_config_updates()
-
-                status = self.mpd.get_status()
-                if status:
-                    self.led_controller.update_from_mpd_status(status)
-
-                    current_volume = status.get('volume', '0')
-                    if current_volume != self.last_volume:
-                        self.show_volume(status)
-                        self.last_volume = current_volume
-
-                    self._update_display(status)
-
-                current_time = time.time()
-                update_interval = (self.volume_update_interval
-                                 if current_time < self.volume_display_until
-                                 else self.default_update_interval)
-
-                next_update += update_interval
-                sleep_time = next_update - time.time()
+                tick_started = time.monotonic()
+                next_update += self.tick()
+                notifier.ready()
+                notifier.loop_tick(time.monotonic() - tick_started, self.describe)
+                if self.power_save.asleep and self.running:
+                    self._wait_for_activity()
+                    next_update = self.clock.time()
+                    continue
+                sleep_time = next_update - self.clock.time()
 
                 if sleep_time > 0:
-                    time.sleep(sleep_time)
+                    self.clock.sleep(sleep_time)
                 else:
-                    next_update = time.time()
+                    metrics.incr('service.tick_overruns')
+                    next_update = self.clock.time()
 
         except Exception as e:
-            log.error(f"Player service error: {e}")
+            self.log.error(f"Player service error: {e}")
             self.cleanup()
 
+    def stop(self) -> None:
+        self._stop_requested = True
+        self.running = False
+        self.wake()
+
+    def stop_playback(self) -> bool:
+        return self.mpd.stop_playback()
+
+    def describe(self) -> str:
+        rtt = self.mpd.last_rtt_ms
+        rtt_text = f"{rtt:.1f} ms" if rtt is not None else "n/a"
+        return f"{getattr(self, '_last_state', 'unknown')}, MPD RTT {rtt_text}"
+
     def cleanup(self) -> None:
-        log.info("Shutting down player service")
+        self.log.info("Shutting down player service")
         self.running = False
+        trace.record('cleanup')
+        self._save_warm_state(force=True)
+        if self.vu_meter is not None:
+            self.vu_meter.stop()
+        if self.library is not None:
+            self.library.stop()
         
-        components = [
+        devices = [
             ("Status LEDs", self.led_controller),
-            ("Display TM1652", self.display),
-            ("Button Controller", self.button_controller),
-            ("MPD Client", self.mpd)
+            ("Display", self.display),
+            ("Button Controller", self.button_controller)
         ]
-        
-        for name, component in components:
+
+        sequencer = ShutdownSequencer(self.config.get('timing.shutdown_deadline', 3), current_deadline())
+        sequencer.run([
+            [(name, self._shutdown_step(name, component)) for name, component in devices],
+            [("MPD Client", self._shutdown_step("MPD Client", self.mpd))]
+        ])
+        if self.state_bus is not None:
+            self.state_bus.close()
+        if self.status_server is not None:
+            self.status_server.stop()
+        for fd in (self._wake_r, self._wake_w):
             try:
-                log.debug(f"Shutting down {name}")
-                if hasattr(component, 'cleanup'):
-                    component.cleanup()
-                elif hasattr(component, 'close'):
-                    component.close()
-                log.debug(f"{name} shutdown complete")
-            except Exception as e:
-                log.error(f"Error shutting down {name}: {e}")
-                continue
-        
-        time.sleep(0.3)
+                os.close(fd)
+            except OSError:
+                pass
+        metrics.stop_server()
         
-        log.ok("Player service shutdown complete")
+        self.log.ok("Player service shutdown complete")
+
+    def _shutdown_step(self, name: str, component: Any) -> Callable[[], None]:
+        def step() -> None:
+            self.log.debug("Shutting down %s", name)
+            if hasattr(component, 'cleanup'):
+                component.cleanup()
+            elif hasattr(component, 'close'):
+                component.close()
+            self.log.debug("%s shutdown complete", name)
+        return step
@@ -0,0 +1,41 @@
+from typing import Optional, Tuple
+from src.core.config import Config
+
+class PowerSave:
+    def __init__(self, config: Config) -> None:
+        self.configure(config)
+        self.idle_since: Optional[float] = None
+        self.level = 1.0
+
+    def configure(self, config: Config) -> None:
+        power_cfg = config.get('power_save', {})
+        self.enabled = bool(power_cfg.get('enable', False))
+        self.idle_after = max(0.0, float(power_cfg.get('idle_after', 300)))
+        self.ramp_time = max(0.0, float(power_cfg.get('ramp_time', 3)))
+        self.states: Tuple[str, ...] = tuple(power_cfg.get('states', ['stop', 'pause']))
+
+    @property
+    def asleep(self) -> bool:
+        return self.level == 0.0
+
+    def update(self, state: str, now: float) -> float:
+        if not self.enabled or state not in self.states:
+            self.idle_since = None
+            self.level = 1.0
+            return self.level
+
+        if self.idle_since is None:
+            self.idle_since = now
+
+        idle = now - self.idle_since - self.idle_after
+        if idle < 0:
+            self.level = 1.0
+        elif idle < self.ramp_time:
+            self.level = 1.0 - idle / self.ramp_time
+        else:
+            self.level = 0.0
+        return self.level
+
+    def wake(self, now: float) -> None:
+        self.idle_since = now
+        self.level = 1.0
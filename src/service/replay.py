@@ -0,0 +1,216 @@
+import argparse
+import sys
+import time
+from collections import defaultdict, deque
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.hardware.display.tm1652 import TM1652
+from src.hardware.led.controller import LEDController
+from src.service.player_service import PlayerService
+from src.utils.clock import VirtualClock
+from src.utils.logger import Logger
+from src.utils.trace import read_trace
+
+log = Logger()
+
+class TraceConfig:
+    def __init__(self, config: Dict[str, Any]) -> None:
+        self.config = config
+
+    def load_config(self) -> None:
+        pass
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self.config
+        for k in key.split('.'):
+            value = value.get(k) if isinstance(value, dict) else None
+            if value is None:
+                return default
+        return value
+
+class ReplayTrigger:
+    def __init__(self, config: TraceConfig) -> None:
+        self.config = config
+        self.pending: Optional[Dict[str, Any]] = None
+
+    def poll(self) -> bool:
+        if self.pending is None:
+            return False
+        self.config.config, self.pending = self.pending, None
+        return True
+
+class ReplayMPD:
+    def __init__(self) -> None:
+        self._responses = defaultdict(deque)
+        self.unconsumed = 0
+
+    def feed(self, method: str, response: Any) -> None:
+        self._responses[method].append(response)
+
+    def drain(self) -> None:
+        for queue in self._responses.values():
+            self.unconsumed += len(queue)
+            queue.clear()
+
+    def _next(self, method: str) -> Any:
+        queue = self._responses[method]
+        return queue.popleft() if queue else None
+
+    def get_status(self) -> Optional[Dict[str, Any]]:
+        return self._next('status')
+
+    def get_current_song(self) -> Optional[Dict[str, Any]]:
+        return self._next('currentsong')
+
+    def get_song(self, song_id: str) -> Optional[Dict[str, Any]]:
+        return self._next('playlistid')
+
+    def get_playlist_info(self) -> Dict[str, Any]:
+        return self._next('playlistinfo') or {'total_tracks': 0, 'tracks': []}
+
+    def stop_playback(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        pass
+
+class CaptureSerial:
+    is_open = True
+
+    def __init__(self) -> None:
+        self.frames: List[str] = []
+
+    def write(self, data: bytes) -> None:
+        self.frames.append(bytes(data).hex())
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+class CaptureStrip:
+    def __init__(self, count: int) -> None:
+        self._pixels = [0] * count
+        self.frames: List[List[int]] = []
+
+    def begin(self) -> None:
+        pass
+
+    def numPixels(self) -> int:
+        return len(self._pixels)
+
+    def setPixelColor(self, index: int, value: int) -> None:
+        self._pixels[index] = value
+
+    def getPixelColor(self, index: int) -> int:
+        return self._pixels[index]
+
+    def show(self) -> None:
+        self.frames.append(list(self._pixels))
+
+def split_ticks(events: List[list]) -> Tuple[Dict[str, Any], float, List[Tuple[float, List[list]]]]:
+    config: Dict[str, Any] = {}
+    wall_start = time.time()
+    ticks: List[Tuple[float, List[list]]] = []
+    for event in events:
+        kind = event[1]
+        if kind == 'tick':
+            ticks.append((event[2], []))
+        elif kind == 'cleanup':
+            break
+        elif ticks:
+            ticks[-1][1].append(event)
+        elif kind == 'config':
+            config = event[2]
+        elif kind == 'clock':
+            wall_start = event[2]
+    return config, wall_start, ticks
+
+def golden_frames(events: List[list]) -> Dict[str, list]:
+    frames = {'display': [], 'led': []}
+    started = False
+    for event in events:
+        kind = event[1]
+        if kind == 'tick':
+            started = True
+        elif kind == 'cleanup':
+            break
+        elif started and kind in frames:
+            frames[kind].append(event[2])
+    return frames
+
+def replay(events: List[list]) -> Dict[str, Any]:
+    config_data, wall_start, ticks = split_ticks(events)
+    config = TraceConfig(config_data)
+    config_data.setdefault('cache', {})['warm_state'] = {'enable': False}
+    clock = VirtualClock(ticks[0][0] if ticks else wall_start)
+
+    serial = CaptureSerial()
+    strip = CaptureStrip(config.get('gpio.status_leds.count', 4))
+    mpd = ReplayMPD()
+    display = TM1652(config, transport=serial, clock=clock.passive())
+    led_controller = LEDController(config, strip=strip, clock=clock.passive())
+    led_controller.run_effects_inline = True
+
+    service = PlayerService(no_wait_mpd=True, config=config, watch_trigger=False, devices={
+        'display': display, 'led_controller': led_controller, 'mpd': mpd
+    }, clock=clock)
+    trigger = service.update_trigger = ReplayTrigger(config)
+
+    serial.frames.clear()
+    strip.frames.clear()
+    for tick_time, tick_events in ticks:
+        clock.set(tick_time)
+        for event in tick_events:
+            if event[1] == 'mpd':
+                mpd.feed(event[2], event[3])
+            elif event[1] == 'config':
+                trigger.pending = event[2]
+        service.tick()
+        mpd.drain()
+
+    return {
+        'ticks': len(ticks),
+        'unconsumed': mpd.unconsumed,
+        'frames': {'display': serial.frames, 'led': strip.frames}
+    }
+
+def diff_frames(expected: Dict[str, list], actual: Dict[str, list]) -> List[str]:
+    problems = []
+    for kind in ('display', 'led'):
+        want, got = expected.get(kind, []), actual.get(kind, [])
+        for index, (a, b) in enumerate(zip(want, got)):
+            if a != b:
+                problems.append(f"{kind} frame {index}: expected {a}, got {b}")
+                break
+        if len(want) != len(got):
+            problems.append(f"{kind}: expected {len(want)} frames, got {len(got)}")
+    return problems
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Replay an ADAM3-GPIO trace and diff the rendered frames')
+    parser.add_argument('trace', help='Trace recorded with main.py --record')
+    parser.add_argument('--golden', help='Trace whose frames are expected (default: the input trace)')
+    args = parser.parse_args()
+
+    events = read_trace(args.trace)
+    golden = golden_frames(read_trace(args.golden) if args.golden else events)
+
+    started = time.monotonic()
+    result = replay(events)
+    elapsed = time.monotonic() - started
+
+    problems = diff_frames(golden, result['frames'])
+    if result['unconsumed']:
+        problems.append(f"{result['unconsumed']} recorded MPD responses were not requested")
+
+    log.info(f"Replayed {result['ticks']} ticks in {elapsed:.2f}s")
+    for problem in problems:
+        log.error(problem)
+    if problems:
+        sys.exit(1)
+    log.ok("Frames match golden trace")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+import argparse
+import copy
+import json
+import random
+import time
+from collections import Counter, deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from src.core.config import Config
+from src.hardware.display.tm1652 import TM1652
+from src.hardware.led.controller import LEDController
+from src.service.player_service import PlayerService
+from src.service.replay import CaptureStrip, TraceConfig
+from src.utils.clock import VirtualClock
+from src.utils.logger import Logger
+
+log = Logger()
+
+START_TIME = 1_700_000_000.0
+ACTIONS = (('play', 35), ('pause', 15), ('stop', 15), ('volume', 25), ('mode', 10))
+
+class SimulatedMPD:
+    def __init__(self, clock: VirtualClock, rng: random.Random, tracks: int = 12) -> None:
+        self.clock = clock
+        self.rng = rng
+        self.tracks = [{
+            'id': str(i + 1),
+            'pos': str(i),
+            'track': str(i + 1),
+            'duration': f"{rng.uniform(150, 420):.3f}",
+            'file': f"album/{i + 1:02d}.flac",
+            'title': f"Track {i + 1}",
+            'artist': 'Simulated'
+        } for i in range(tracks)]
+        self.state = 'stop'
+        self.position = 0
+        self.elapsed = 0.0
+        self.volume = 50
+        self.modes = {'repeat': '1', 'random': '0', 'single': '0', 'consume': '0'}
+        self.requests: Counter = Counter()
+        self.last_rtt_ms = 0.0
+        self.offline_until = 0.0
+        self._updated = clock.time()
+
+    def _advance(self) -> None:
+        now = self.clock.time()
+        if self.state == 'play':
+            self.elapsed += now - self._updated
+            while self.elapsed >= float(self.tracks[self.position]['duration']):
+                self.elapsed -= float(self.tracks[self.position]['duration'])
+                self.position += 1
+                if self.position >= len(self.tracks):
+                    self.position = 0
+                    if self.modes['repeat'] != '1':
+                        self.state, self.elapsed = 'stop', 0.0
+                        break
+        self._updated = now
+
+    def apply(self, action: str) -> None:
+        self._advance()
+        if action == 'play':
+            self.state = 'play'
+        elif action == 'pause' and self.state == 'play':
+            self.state = 'pause'
+        elif action == 'stop':
+            self.state, self.elapsed = 'stop', 0.0
+        elif action == 'volume':
+            self.volume = max(0, min(100, self.volume + self.rng.choice((-5, 5))))
+        elif action == 'mode':
+            mode = self.rng.choice(list(self.modes))
+            self.modes[mode] = '0' if self.modes[mode] == '1' else '1'
+
+    def disconnect(self, seconds: float) -> None:
+        self.offline_until = self.clock.time() + seconds
+
+    def get_status(self) -> Optional[Dict[str, Any]]:
+        self._advance()
+        self.requests['status'] += 1
+        if self.clock.time() < self.offline_until:
+            self.requests['errors'] += 1
+            return None
+        song = self.tracks[self.position]
+        upcoming = self.tracks[(self.position + 1) % len(self.tracks)]
+        return {
+            'state': self.state,
+            'volume': str(self.volume),
+            'playlist': '1',
+            'playlistlength': str(len(self.tracks)),
+            'song': song['pos'],
+            'songid': song['id'],
+            'elapsed': f"{self.elapsed:.3f}",
+            'duration': song['duration'],
+            'nextsong': upcoming['pos'],
+            'nextsongid': upcoming['id'],
+            **self.modes
+        }
+
+    def get_current_song(self) -> Dict[str, Any]:
+        self.requests['currentsong'] += 1
+        return dict(self.tracks[self.position])
+
+    def get_song(self, song_id: str) -> Optional[Dict[str, Any]]:
+        self.requests['playlistid'] += 1
+        return next((dict(t) for t in self.tracks if t['id'] == song_id), None)
+
+    def get_playlist_info(self) -> Dict[str, Any]:
+        self.requests['playlistinfo'] += 1
+        return {'total_tracks': len(self.tracks), 'tracks': [dict(t) for t in self.tracks]}
+
+    def stop_playback(self) -> bool:
+        self.apply('stop')
+        return True
+
+    def close(self) -> None:
+        pass
+
+class CountingSerial:
+    is_open = True
+
+    def __init__(self) -> None:
+        self.writes = 0
+        self.bytes = 0
+
+    def write(self, data: bytes) -> None:
+        self.writes += 1
+        self.bytes += len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+class CountingStrip(CaptureStrip):
+    def __init__(self, count: int) -> None:
+        super().__init__(count)
+        self.shows = 0
+
+    def show(self) -> None:
+        self.shows += 1
+
+def session_events(rng: random.Random, start: float, duration: float,
+                   mean_gap: float = 1200.0) -> Deque[Tuple[float, str]]:
+    names = [name for name, _ in ACTIONS]
+    weights = [weight for _, weight in ACTIONS]
+    events: Deque[Tuple[float, str]] = deque([(start + 1.0, 'play')])
+    at = start + 1.0
+    while True:
+        at += rng.expovariate(1.0 / mean_gap)
+        if at >= start + duration:
+            return events
+        events.append((at, rng.choices(names, weights)[0]))
+
+def _percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+class Simulation:
+    def __init__(self, hours: float = 24.0, seed: int = 1, settings: Optional[Dict[str, Any]] = None,
+                 inline_effects: bool = True, keep_latencies: bool = True,
+                 mpd_factory: Optional[Callable[[SimulatedMPD], Any]] = None) -> None:
+        data = copy.deepcopy(settings if settings is not None else Config().config)
+        for key in ('state_bus', 'status_server'):
+            data.setdefault(key, {})['enable'] = False
+        data.setdefault('cache', {})['warm_state'] = {'enable': False}
+        self.config = TraceConfig(data)
+
+        self.rng = random.Random(seed)
+        self.clock = VirtualClock(START_TIME)
+        self.events = session_events(self.rng, START_TIME, hours * 3600.0)
+
+        self.serial = CountingSerial()
+        self.strip = CountingStrip(self.config.get('gpio.status_leds.count', 4))
+        self.mpd = SimulatedMPD(self.clock, self.rng)
+        display = TM1652(self.config, transport=self.serial, clock=self.clock.passive())
+        led_controller = LEDController(self.config, strip=self.strip, clock=self.clock.passive())
+        led_controller.run_effects_inline = inline_effects
+        mpd = mpd_factory(self.mpd) if mpd_factory else self.mpd
+        self.service = PlayerService(no_wait_mpd=True, config=self.config, watch_trigger=False, devices={
+            'display': display, 'led_controller': led_controller, 'mpd': mpd
+        }, clock=self.clock)
+
+        self.keep_latencies = keep_latencies
+        self.latencies: List[float] = []
+        self.ticks = 0
+        self.idle_waits = 0
+        self.wall = 0.0
+
+    def run_until(self, end: float) -> None:
+        service, clock, events = self.service, self.clock, self.events
+        started = time.perf_counter()
+        while clock.time() < end:
+            if service.power_save.asleep:
+                self.idle_waits += 1
+                clock.set(min(events[0][0], end) if events else end)
+                service.power_save.wake(clock.time())
+
+            now = clock.time()
+            while events and events[0][0] <= now:
+                self.mpd.apply(events.popleft()[1])
+
+            tick_started = time.perf_counter()
+            interval = service.tick()
+            if self.keep_latencies:
+                self.latencies.append((time.perf_counter() - tick_started) * 1000.0)
+            self.ticks += 1
+            clock.sleep(interval)
+        self.wall += time.perf_counter() - started
+
+    def report(self) -> Dict[str, Any]:
+        duration = self.clock.time() - START_TIME
+        return {
+            'simulated_hours': round(duration / 3600.0, 3),
+            'wall_seconds': round(self.wall, 2),
+            'speedup': round(duration / self.wall) if self.wall else None,
+            'ticks': self.ticks,
+            'idle_waits': self.idle_waits,
+            'display_writes': self.serial.writes,
+            'display_bytes': self.serial.bytes,
+            'led_shows': self.strip.shows,
+            'mpd_requests': dict(self.mpd.requests),
+            'tick_ms': {
+                'p50': round(_percentile(self.latencies, 0.50), 4),
+                'p99': round(_percentile(self.latencies, 0.99), 4),
+                'max': round(max(self.latencies, default=0.0), 4)
+            }
+        }
+
+def simulate(hours: float = 24.0, seed: int = 1, settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    simulation = Simulation(hours, seed, settings)
+    simulation.run_until(START_TIME + hours * 3600.0)
+    return simulation.report()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Run PlayerService against a simulated MPD in virtual time')
+    parser.add_argument('--hours', type=float, default=24.0, help='Simulated session length')
+    parser.add_argument('--seed', type=int, default=1, help='Seed for the generated listening session')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    args = parser.parse_args()
+
+    report = simulate(args.hours, args.seed)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    log.info(f"Simulated {report['simulated_hours']:g} h in {report['wall_seconds']} s ({report['speedup']}x)")
+    log.info(f"Ticks: {report['ticks']}, idle waits: {report['idle_waits']}")
+    log.info(f"Display writes: {report['display_writes']} ({report['display_bytes']} bytes), LED shows: {report['led_shows']}")
+    log.info(f"MPD requests: {report['mpd_requests']}")
+    log.info("Tick cost p50 {p50} ms, p99 {p99} ms, max {max} ms".format(**report['tick_ms']))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+import argparse
+import copy
+import gc
+import os
+import selectors
+import shlex
+import socket
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from src.core.mpd_client import MPDClient
+from src.hardware.led.controller import LEDController
+from src.service.replay import ReplayTrigger
+from src.service.simulator import START_TIME, Simulation, SimulatedMPD
+from src.utils.logger import Logger
+
+log = Logger()
+
+class Sample(NamedTuple):
+    day: int
+    memory: int
+    threads: int
+    fds: int
+
+class StubMPDServer:
+    def __init__(self, model: SimulatedMPD) -> None:
+        self.model = model
+        self.connections = 0
+        self.refused = 0
+        self.dropped = 0
+        self._buffers: Dict[socket.socket, bytes] = {}
+        self._selector = selectors.DefaultSelector()
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind(('127.0.0.1', 0))
+        self._server.listen(4)
+        self.port = self._server.getsockname()[1]
+        self._selector.register(self._server, selectors.EVENT_READ)
+        self._running = True
+        self._thread = threading.Thread(target=self._serve, name='stub-mpd', daemon=True)
+        self._thread.start()
+
+    def _offline(self) -> bool:
+        return self.model.clock.time() < self.model.offline_until
+
+    def _serve(self) -> None:
+        while self._running:
+            for key, _ in self._selector.select(0.2):
+                if key.fileobj is self._server:
+                    self._accept()
+                else:
+                    self._receive(key.fileobj)
+
+    def _accept(self) -> None:
+        try:
+            conn, _ = self._server.accept()
+        except OSError:
+            return
+        if self._offline():
+            self.refused += 1
+            conn.close()
+            return
+        self.connections += 1
+        self._buffers[conn] = b''
+        self._selector.register(conn, selectors.EVENT_READ)
+        conn.sendall(b'OK MPD 0.23.5\n')
+
+    def _close(self, conn: socket.socket) -> None:
+        self._buffers.pop(conn, None)
+        self._selector.unregister(conn)
+        conn.close()
+
+    def _receive(self, conn: socket.socket) -> None:
+        try:
+            data = conn.recv(4096)
+        except OSError:
+            data = b''
+        if not data:
+            self._close(conn)
+            return
+        buffer = self._buffers[conn] + data
+        while b'\n' in buffer:
+            line, buffer = buffer.split(b'\n', 1)
+            if self._offline():
+                self.dropped += 1
+                self._close(conn)
+                return
+            reply = self._reply(*self._parse(line.decode()))
+            if reply is None:
+                self._close(conn)
+                return
+            conn.sendall(reply.encode())
+        self._buffers[conn] = buffer
+
+    @staticmethod
+    def _parse(line: str) -> Tuple[str, List[str]]:
+        parts = shlex.split(line) or ['']
+        return parts[0], parts[1:]
+
+    def _reply(self, command: str, args: List[str]) -> Optional[str]:
+        model = self.model
+        if command == 'close':
+            return None
+        if command == 'status':
+            items = [model.get_status()]
+        elif command == 'currentsong':
+            items = [model.get_current_song()]
+        elif command == 'playlistid':
+            song = model.get_song(args[0]) if args else None
+            if song is None:
+                return f"ACK [50@0] {{{command}}} No such song\n"
+            items = [song]
+        elif command == 'playlistinfo':
+            items = model.get_playlist_info()['tracks']
+        elif command == 'stop':
+            model.apply('stop')
+            items = []
+        elif command in ('ping', 'noidle'):
+            items = []
+        else:
+            return f"ACK [5@0] {{{command}}} unknown command \"{command}\"\n"
+
+        lines = []
+        for item in items:
+            if 'file' in item:
+                lines.append(f"file: {item['file']}")
+            lines.extend(f"{key}: {value}" for key, value in item.items() if key != 'file')
+        lines.append('OK')
+        return '\n'.join(lines) + '\n'
+
+    def stop(self) -> None:
+        self._running = False
+        self._thread.join(1.0)
+        for conn in list(self._buffers):
+            self._close(conn)
+        self._selector.close()
+        self._server.close()
+
+def _fd_count() -> int:
+    try:
+        return len(os.listdir('/proc/self/fd'))
+    except OSError:
+        return -1
+
+def _settle(led_controller: LEDController, timeout: float = 1.0) -> None:
+    led_controller.wait_idle(timeout)
+    gc.collect()
+
+def _snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces((tracemalloc.Filter(False, tracemalloc.__file__),))
+
+def _sample(day: int, led_controller: LEDController) -> Sample:
+    _settle(led_controller)
+    return Sample(day, tracemalloc.get_traced_memory()[0], threading.active_count(), _fd_count())
+
+def _toggled_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    data = copy.deepcopy(config)
+    display = data.setdefault('display', {})
+    display['mode'] = 'remaining' if display.get('mode') == 'elapsed' else 'elapsed'
+    return data
+
+def _baseline(samples: List[Any]) -> int:
+    return 1 if len(samples) > 2 else 0
+
+def soak(days: int = 3, seed: int = 1, disconnects_per_day: int = 6,
+         stub_mpd: bool = True) -> Tuple[List[Sample], List[tracemalloc.Snapshot]]:
+    servers: List[StubMPDServer] = []
+
+    def connect(model: SimulatedMPD) -> MPDClient:
+        servers.append(StubMPDServer(model))
+        return MPDClient('127.0.0.1', servers[-1].port, retry_interval=0)
+
+    simulation = Simulation(days * 24.0, seed, inline_effects=False, keep_latencies=False,
+                            mpd_factory=connect if stub_mpd else None)
+    service = simulation.service
+    trigger = service.update_trigger = ReplayTrigger(simulation.config)
+    rng = simulation.rng
+
+    samples = [_sample(0, service.led_controller)]
+    snapshots = [_snapshot()] if tracemalloc.is_tracing() else []
+    for day in range(days):
+        outages = set(rng.sample(range(24), min(24, disconnects_per_day)))
+        for hour in range(24):
+            if hour in outages:
+                simulation.mpd.disconnect(rng.uniform(5, 120))
+            trigger.pending = _toggled_config(simulation.config.config)
+            simulation.run_until(START_TIME + (day * 24 + hour + 1) * 3600.0)
+        samples.append(_sample(day + 1, service.led_controller))
+        if day == 0 and snapshots:
+            snapshots.append(_snapshot())
+        sample = samples[-1]
+        log.info(f"Day {sample.day}: {sample.memory / 1024:.1f} KiB traced, {sample.threads} threads, "
+                 f"{sample.fds} fds, {simulation.ticks} ticks")
+
+    for server in servers:
+        log.info(f"MPD stub: {server.connections} connections, {server.dropped} dropped, "
+                 f"{server.refused} refused")
+        service.mpd.close()
+        server.stop()
+    return samples, snapshots
+
+def check(samples: List[Sample], max_memory_kib: float, max_threads: int, max_fds: int) -> List[str]:
+    baseline, last = samples[_baseline(samples)], samples[-1]
+    problems = []
+    growth_kib = (last.memory - baseline.memory) / 1024
+    if growth_kib > max_memory_kib:
+        problems.append(f"Traced memory grew {growth_kib:.1f} KiB after day {baseline.day} (limit {max_memory_kib} KiB)")
+    if last.threads - baseline.threads > max_threads:
+        problems.append(f"Thread count grew from {baseline.threads} to {last.threads}")
+    if baseline.fds >= 0 and last.fds - baseline.fds > max_fds:
+        problems.append(f"Open file descriptors grew from {baseline.fds} to {last.fds}")
+    return problems
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Soak PlayerService through simulated days and check for leaks')
+    parser.add_argument('--days', type=int, default=3, help='Simulated days')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--disconnects', type=int, default=6, help='MPD outages per simulated day')
+    parser.add_argument('--mpd', choices=('stub', 'model'), default='stub',
+                        help='Talk to MPD through MPDClient and a local stub server, or call the model directly')
+    parser.add_argument('--max-memory-kib', type=float, default=256.0, help='Allowed traced memory growth after day one')
+    parser.add_argument('--max-threads', type=int, default=0, help='Allowed thread count growth after day one')
+    parser.add_argument('--max-fds', type=int, default=0, help='Allowed file descriptor growth after day one')
+    args = parser.parse_args()
+
+    tracemalloc.start(1)
+    started = time.monotonic()
+    samples, snapshots = soak(args.days, args.seed, args.disconnects, args.mpd == 'stub')
+    snapshot = _snapshot()
+
+    problems = check(samples, args.max_memory_kib, args.max_threads, args.max_fds)
+    log.info(f"Soaked {args.days} simulated days in {time.monotonic() - started:.1f}s")
+    if not problems:
+        log.ok("No growth past thresholds")
+        return
+
+    for problem in problems:
+        log.error(problem)
+    baseline = snapshots[min(_baseline(samples), len(snapshots) - 1)]
+    for stat in snapshot.compare_to(baseline, 'lineno')[:10]:
+        log.info(str(stat))
+    sys.exit(1)
+
+if __name__ == "__main__":
+    main()
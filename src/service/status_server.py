@@ -0,0 +1,139 @@
+import json
+import queue
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from src.utils.logger import Logger
+from src.utils.metrics import Metrics
+
+log = Logger()
+metrics = Metrics()
+
+def _event(kind: str, version: int, payload: Dict[str, Any]) -> bytes:
+    return f"id: {version}\nevent: {kind}\ndata: {json.dumps(payload, separators=(',', ':'))}\n\n".encode()
+
+class Subscriber:
+    __slots__ = ('queue', 'dropped')
+
+    def __init__(self, size: int) -> None:
+        self.queue: 'queue.Queue[bytes]' = queue.Queue(maxsize=size)
+        self.dropped = False
+
+class _Handler(BaseHTTPRequestHandler):
+    timeout = 10
+    keepalive = 15
+
+    def log_message(self, format: str, *args: Any) -> None:
+        log.debug("Status endpoint: " + format, *args)
+
+    def do_GET(self) -> None:
+        status: 'StatusServer' = self.server.status
+        if self.path == '/state':
+            body = json.dumps(status.state()).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        elif self.path == '/events':
+            self._stream(status)
+        else:
+            self.send_error(404)
+
+    def _stream(self, status: 'StatusServer') -> None:
+        subscriber = status.subscribe()
+        if subscriber is None:
+            self.send_error(503, 'Too many subscribers')
+            return
+
+        try:
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Cache-Control', 'no-cache')
+            self.end_headers()
+            while status.running and not subscriber.dropped:
+                try:
+                    message = subscriber.queue.get(timeout=self.keepalive)
+                except queue.Empty:
+                    message = b': keepalive\n\n'
+                if subscriber.dropped:
+                    break
+                self.wfile.write(message)
+                self.wfile.flush()
+        except OSError:
+            pass
+        finally:
+            status.unsubscribe(subscriber)
+
+class StatusServer:
+    def __init__(self, host: str = '127.0.0.1', port: int = 8600,
+                 client_buffer: int = 64, max_clients: int = 16) -> None:
+        self.host = host
+        self.port = port
+        self.client_buffer = max(1, client_buffer)
+        self.max_clients = max_clients
+        self.running = False
+        self._lock = threading.Lock()
+        self._state: Dict[str, Any] = {}
+        self._version = 0
+        self._subscribers: List[Subscriber] = []
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def start(self) -> bool:
+        try:
+            server = ThreadingHTTPServer((self.host, self.port), _Handler)
+        except OSError as e:
+            log.error(f"Status endpoint failed on {self.host}:{self.port}: {e}")
+            return False
+        server.daemon_threads = True
+        server.status = self
+        self._server = server
+        self.running = True
+        threading.Thread(target=server.serve_forever, name='status-server', daemon=True).start()
+        log.ok(f"Status endpoint listening on http://{self.host}:{server.server_address[1]}/events")
+        return True
+
+    def state(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._state)
+
+    def subscribe(self) -> Optional[Subscriber]:
+        with self._lock:
+            if len(self._subscribers) >= self.max_clients:
+                return None
+            subscriber = Subscriber(self.client_buffer)
+            subscriber.queue.put_nowait(_event('snapshot', self._version, self._state))
+            self._subscribers.append(subscriber)
+        metrics.incr('status_server.clients')
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        with self._lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+
+    def publish(self, state: Dict[str, Any]) -> None:
+        with self._lock:
+            delta = {key: value for key, value in state.items() if self._state.get(key) != value}
+            if not delta:
+                return
+            self._state.update(delta)
+            self._version += 1
+            subscribers = list(self._subscribers)
+            message = _event('delta', self._version, delta)
+
+        for subscriber in subscribers:
+            try:
+                subscriber.queue.put_nowait(message)
+            except queue.Full:
+                subscriber.dropped = True
+                self.unsubscribe(subscriber)
+                metrics.incr('status_server.clients_dropped')
+                log.warning("Status endpoint dropped a slow subscriber")
+
+    def stop(self) -> None:
+        self.running = False
+        server, self._server = self._server, None
+        if server is not None:
+            server.shutdown()
+            server.server_close()
@@ -1,6 +1,7 @@
 from .logger import Logger
+from .metrics import Metrics
 
 log = Logger()
 log.debug("Initializing utility modules")
 
-__all__ = ["Logger"] 
+__all__ = ["Logger", "Metrics"] 
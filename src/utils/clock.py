@@ -0,0 +1,36 @@
+import time
+from typing import Optional
+
+class Clock:
+    def time(self) -> float:
+        return time.time()
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            time.sleep(seconds)
+
+SYSTEM_CLOCK = Clock()
+
+class VirtualClock(Clock):
+    def __init__(self, now: float = 0.0, source: Optional['VirtualClock'] = None) -> None:
+        self._now = now
+        self._source = source
+
+    def time(self) -> float:
+        return self._source.time() if self._source else self._now
+
+    monotonic = time
+
+    def sleep(self, seconds: float) -> None:
+        if not self._source:
+            self._now += max(0.0, seconds)
+
+    def set(self, now: float) -> None:
+        if not self._source:
+            self._now = max(self._now, now)
+
+    def passive(self) -> 'VirtualClock':
+        return VirtualClock(source=self)
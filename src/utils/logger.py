@@ -1,4 +1,10 @@
-from typing import Dict, Any
+import atexit
+import json
+import sys
+import threading
+import time
+from collections import deque
+from typing import Dict, Any, Optional
 
 class Logger:
     LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "WAIT": 21, "OK": 22}
@@ -10,6 +16,16 @@ class Logger:
             cls._instance.enabled = True
             cls._instance.level = "INFO"
             cls._instance.format = "[{level}] {message}"
+            cls._instance.asynchronous = True
+            cls._instance.buffer_size = 1000
+            cls._instance.json_file = None
+            cls._instance.dropped = 0
+            cls._instance._threshold = cls.LEVELS["INFO"]
+            cls._instance._buffer = deque()
+            cls._instance._in_flight = 0
+            cls._instance._cond = threading.Condition()
+            cls._instance._writer = None
+            cls._instance._json_sink = None
         return cls._instance
 
     def configure(self, settings: Dict[str, Any]) -> None:
@@ -17,15 +33,115 @@ class Logger:
         self.enabled = log_cfg.get('enable', True)
         self.level = log_cfg.get('level', 'INFO').upper()
         self.format = log_cfg.get('format', '[{level}] {message}')
+        self.asynchronous = log_cfg.get('async', True)
+        self.buffer_size = max(1, int(log_cfg.get('buffer_size', 1000)))
+        self._threshold = self.LEVELS.get(self.level, self.LEVELS["INFO"])
+        self._set_json_file(log_cfg.get('json_file') or None)
 
-    def _log(self, level: str, message: str) -> None:
-        if self.enabled and self.LEVELS[self.level] <= self.LEVELS[level]:
-            print(self.format.format(level=level, message=message))
+    def _set_json_file(self, path: Optional[str]) -> None:
+        if path == self.json_file:
+            return
+        with self._cond:
+            if self._json_sink:
+                self._json_sink.close()
+                self._json_sink = None
+            self.json_file = path
+            if path:
+                try:
+                    self._json_sink = open(path, 'a', buffering=1)
+                except OSError as e:
+                    self.json_file = None
+                    print(f"[ERROR] Log JSON sink failed: {e}")
 
-    def debug(self, message: str) -> None: self._log("DEBUG", message)
-    def info(self, message: str) -> None: self._log("INFO", message)
-    def wait(self, message: str) -> None: self._log("WAIT", message)
-    def ok(self, message: str) -> None: self._log("OK", message)
-    def warning(self, message: str) -> None: self._log("WARNING", message)
-    def error(self, message: str) -> None: self._log("ERROR", message)
+    def is_enabled_for(self, level: str) -> bool:
+        return self.enabled and self._threshold <= self.LEVELS[level]
 
+    def _log(self, level: str, message: str, args: tuple) -> None:
+        if not self.enabled or self._threshold > self.LEVELS[level]:
+            return
+        if args:
+            try:
+                message = message % args
+            except (TypeError, ValueError):
+                message = f"{message} {args}"
+        record = (time.time(), level, message)
+
+        if not self.asynchronous:
+            with self._cond:
+                self._emit(record)
+            return
+
+        with self._cond:
+            if len(self._buffer) >= self.buffer_size:
+                self.dropped += 1
+                return
+            self._buffer.append(record)
+            if self._writer is None:
+                self._start_writer()
+            self._cond.notify()
+
+    def _start_writer(self) -> None:
+        self._writer = threading.Thread(target=self._drain, name="log-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.flush)
+
+    def _drain(self) -> None:
+        while True:
+            with self._cond:
+                while not self._buffer:
+                    self._cond.wait()
+                batch = list(self._buffer)
+                self._buffer.clear()
+                self._in_flight = len(batch)
+            for record in batch:
+                self._emit(record)
+            with self._cond:
+                self._in_flight = 0
+                self._cond.notify_all()
+
+    def _emit(self, record: tuple) -> None:
+        timestamp, level, message = record
+        try:
+            sys.stdout.write(self.format.format(level=level, message=message) + "\n")
+            sys.stdout.flush()
+            if self._json_sink:
+                self._json_sink.write(json.dumps({"ts": round(timestamp, 3), "level": level, "message": message}) + "\n")
+        except (OSError, ValueError):
+            pass
+
+    def flush(self, timeout: float = 1.0) -> None:
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while (self._buffer or self._in_flight) and self._writer is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+    def child(self, prefix: str) -> 'Logger':
+        return PrefixedLogger(self, prefix)
+
+    def debug(self, message: str, *args: Any) -> None: self._log("DEBUG", message, args)
+    def info(self, message: str, *args: Any) -> None: self._log("INFO", message, args)
+    def wait(self, message: str, *args: Any) -> None: self._log("WAIT", message, args)
+    def ok(self, message: str, *args: Any) -> None: self._log("OK", message, args)
+    def warning(self, message: str, *args: Any) -> None: self._log("WARNING", message, args)
+    def error(self, message: str, *args: Any) -> None: self._log("ERROR", message, args)
+
+class PrefixedLogger(Logger):
+    def __new__(cls, parent: Logger, prefix: str) -> 'PrefixedLogger':
+        return object.__new__(cls)
+
+    def __init__(self, parent: Logger, prefix: str) -> None:
+        self._parent = parent
+        self._prefix = f"[{prefix}] "
+
+    def is_enabled_for(self, level: str) -> bool:
+        return self._parent.is_enabled_for(level)
+
+    def _log(self, level: str, message: str, args: tuple) -> None:
+        prefix = self._prefix.replace('%', '%%') if args else self._prefix
+        self._parent._log(level, prefix + message, args)
+
+    def flush(self, timeout: float = 1.0) -> None:
+        self._parent.flush(timeout)
@@ -0,0 +1,167 @@
+import json
+import os
+import socket
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import ContextManager, Dict, Any, Iterator, List, Optional
+from src.utils.logger import Logger
+
+log = Logger()
+
+_NULL_TIMER = nullcontext()
+
+class Histogram:
+    BUCKETS_MS = (0.5, 1, 2, 5, 10, 20, 50, 100, 250, 500, 1000, 2500)
+
+    __slots__ = ('counts', 'count', 'total', 'max')
+
+    def __init__(self) -> None:
+        self.counts: List[int] = [0] * (len(self.BUCKETS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value_ms: float) -> None:
+        self.counts[bisect_left(self.BUCKETS_MS, value_ms)] += 1
+        self.count += 1
+        self.total += value_ms
+        if value_ms > self.max:
+            self.max = value_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        buckets = {f"le_{b}": c for b, c in zip(self.BUCKETS_MS, self.counts)}
+        buckets['inf'] = self.counts[-1]
+        return {
+            'count': self.count,
+            'avg_ms': round(self.total / self.count, 3) if self.count else 0.0,
+            'max_ms': round(self.max, 3),
+            'buckets': buckets
+        }
+
+class Metrics:
+    _instance = None
+
+    def __new__(cls) -> 'Metrics':
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance.enabled = False
+            cls._instance.socket_path = ''
+            cls._instance.dump_file = '/tmp/adam3-gpio-metrics.json'
+            cls._instance._counters = {}
+            cls._instance._histograms = {}
+            cls._instance._lock = threading.Lock()
+            cls._instance._started_at = time.time()
+            cls._instance._server = None
+        return cls._instance
+
+    def configure(self, settings: Dict[str, Any]) -> None:
+        metrics_cfg = settings.get('metrics', {})
+        enabled = bool(metrics_cfg.get('enable', False))
+        if enabled != self.enabled:
+            log.debug("Metrics %s", 'enabled' if enabled else 'disabled')
+        self.enabled = enabled
+        self.socket_path = metrics_cfg.get('socket', '') or ''
+        self.dump_file = metrics_cfg.get('dump_file', self.dump_file)
+
+    def incr(self, name: str, value: int = 1) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, value_ms: float) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram()
+            histogram.observe(value_ms)
+
+    def timer(self, name: str) -> ContextManager[None]:
+        if not self.enabled:
+            return _NULL_TIMER
+        return self._timed(name)
+
+    @contextmanager
+    def _timed(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, (time.perf_counter() - start) * 1000.0)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'uptime': round(time.time() - self._started_at, 1),
+                'counters': dict(self._counters),
+                'log_dropped': log.dropped,
+                'timers': {name: h.to_dict() for name, h in self._histograms.items()}
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def dump_async(self) -> None:
+        threading.Thread(target=self.dump, name='metrics-dump', daemon=True).start()
+
+    def dump(self, path: Optional[str] = None) -> None:
+        target = path or self.dump_file
+        temp_file = Path(target).with_suffix('.tmp')
+        try:
+            with open(temp_file, 'w') as f:
+                json.dump(self.snapshot(), f, indent=2)
+            os.replace(temp_file, target)
+            log.info(f"Metrics written to {target}")
+        except Exception as e:
+            log.error(f"Metrics dump failed: {e}")
+
+    def start_server(self) -> None:
+        if self._server or not self.socket_path:
+            return
+        try:
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+            server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            server.bind(self.socket_path)
+            server.listen(2)
+            self._server = server
+            threading.Thread(target=self._serve, args=(server,), daemon=True).start()
+            log.ok(f"Metrics socket listening on {self.socket_path}")
+        except Exception as e:
+            log.error(f"Metrics socket failed: {e}")
+            self._server = None
+
+    def _serve(self, server: socket.socket) -> None:
+        while self._server is server:
+            try:
+                conn, _ = server.accept()
+            except OSError:
+                return
+            try:
+                conn.sendall(json.dumps(self.snapshot()).encode() + b'\n')
+            except OSError:
+                pass
+            finally:
+                conn.close()
+
+    def stop_server(self) -> None:
+        server, self._server = self._server, None
+        if server is None:
+            return
+        try:
+            server.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        try:
+            server.close()
+            os.unlink(self.socket_path)
+        except OSError:
+            pass
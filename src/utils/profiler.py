@@ -0,0 +1,147 @@
+import os
+import selectors
+import signal
+import socket
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+from src.utils.logger import Logger
+
+log = Logger()
+
+def _code_of(owner: Any, name: str) -> Optional[Any]:
+    function = getattr(owner, name, None)
+    return getattr(function, '__code__', None)
+
+BLOCKING_CODES = frozenset(code for code in (
+    _code_of(threading.Condition, 'wait'),
+    _code_of(threading.Thread, 'join'),
+    _code_of(threading.Thread, '_wait_for_tstate_lock'),
+    _code_of(socket.socket, 'accept'),
+    *(_code_of(getattr(selectors, name), 'select')
+      for name in ('SelectSelector', 'PollSelector', 'EpollSelector', 'DevpollSelector', 'KqueueSelector')
+      if hasattr(selectors, name)),
+) if code is not None)
+
+BLOCKING_FUNCTIONS = frozenset((
+    ('clock.py', 'sleep'),
+    ('mpd_client.py', 'wait_idle'),
+    ('mpd_client.py', 'wait_for_mpd'),
+    ('multi_player.py', '_wait_for_activity'),
+    ('vu_meter.py', '_read_block'),
+    ('uart.py', 'write'),
+))
+
+class SamplingProfiler:
+    CATEGORY_MARKERS = (
+        ('mpd_io', ('/mpd/', 'mpd_client.py')),
+        ('serial_io', ('/serial/', 'tm1652.py:_write_command')),
+        ('led_io', ('rpi_ws281x', 'led/controller.py:_show')),
+    )
+    CATEGORIES = ('mpd_io', 'serial_io', 'led_io', 'sleep', 'compute')
+
+    def __init__(self, duration: float, interval: float = 0.01, output_dir: str = '/tmp') -> None:
+        self.duration = max(0.1, float(duration))
+        self.interval = max(0.001, float(interval))
+        self.output_dir = output_dir
+        self._stacks = Counter()
+        self._categories = Counter()
+        self._samples = 0
+        self._running = False
+        self._previous_handler = None
+        self._stop_lock = threading.Lock()
+        self._done = threading.Event()
+        self._main_ident = threading.main_thread().ident
+
+    def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._previous_handler = signal.signal(signal.SIGALRM, self._sample)
+        signal.setitimer(signal.ITIMER_REAL, self.interval, self.interval)
+        threading.Thread(target=self._finish_after, name='profiler', daemon=True).start()
+        log.info(f"Profiling for {self.duration:g}s at {self.interval * 1000:.0f}ms intervals")
+
+    def _finish_after(self) -> None:
+        if not self._done.wait(self.duration):
+            self.stop()
+
+    def stop(self) -> None:
+        with self._stop_lock:
+            if not self._running:
+                return
+            self._running = False
+            self._done.set()
+            signal.setitimer(signal.ITIMER_REAL, 0, 0)
+            if threading.current_thread() is threading.main_thread():
+                signal.signal(signal.SIGALRM, self._previous_handler or signal.SIG_DFL)
+            self._write_output()
+
+    def _sample(self, signum: int, frame) -> None:
+        if not self._running:
+            return
+        names = {t.ident: t.name for t in threading.enumerate()}
+        for ident, thread_frame in sys._current_frames().items():
+            if ident == self._main_ident:
+                thread_frame = frame
+            if thread_frame is None:
+                continue
+            stack, category = self._walk(thread_frame)
+            thread_name = names.get(ident, str(ident))
+            self._stacks[f"{thread_name};{';'.join(stack)}"] += 1
+            self._categories[category] += 1
+        self._samples += 1
+
+    def _walk(self, frame) -> Tuple[List[str], str]:
+        stack = []
+        category = None
+        leaf = frame
+        while frame is not None:
+            code = frame.f_code
+            location = f"{code.co_filename}:{code.co_name}"
+            stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+            if category is None:
+                category = self._match_category(location)
+            frame = frame.f_back
+        stack.reverse()
+
+        if self._is_sleeping(leaf):
+            category = 'sleep'
+        return stack, category or 'compute'
+
+    def _match_category(self, location: str) -> Optional[str]:
+        for category, markers in self.CATEGORY_MARKERS:
+            if any(marker in location for marker in markers):
+                return category
+        return None
+
+    def _is_sleeping(self, frame) -> bool:
+        code = frame.f_code
+        return code in BLOCKING_CODES or (os.path.basename(code.co_filename), code.co_name) in BLOCKING_FUNCTIONS
+
+    def summary(self) -> Dict[str, float]:
+        total = sum(self._categories.values()) or 1
+        return {name: round(100.0 * self._categories[name] / total, 1) for name in self.CATEGORIES}
+
+    def _write_output(self) -> None:
+        stamp = time.strftime('%Y%m%d-%H%M%S')
+        base = os.path.join(self.output_dir, f"adam3-profile-{stamp}")
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            with open(f"{base}.collapsed", 'w') as f:
+                for stack, count in self._stacks.most_common():
+                    f.write(f"{stack} {count}\n")
+
+            summary = self.summary()
+            with open(f"{base}.summary.txt", 'w') as f:
+                f.write(f"samples: {self._samples}\n")
+                f.write(f"interval_ms: {self.interval * 1000:.1f}\n")
+                for name in self.CATEGORIES:
+                    f.write(f"{name}: {summary[name]}%\n")
+
+            log.ok(f"Profile written to {base}.collapsed")
+            log.info("Profile summary: " + ", ".join(f"{k} {v}%" for k, v in summary.items()))
+        except Exception as e:
+            log.error(f"Profile output failed: {e}")
@@ -0,0 +1,62 @@
+import gzip
+import json
+import threading
+import time
+from typing import Any, IO, List, Optional
+from src.utils.logger import Logger
+
+log = Logger()
+
+def _open(path: str, mode: str) -> IO[str]:
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't')
+    return open(path, mode)
+
+def read_trace(path: str) -> List[list]:
+    with _open(path, 'r') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+class Trace:
+    _instance = None
+
+    def __new__(cls) -> 'Trace':
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance.enabled = False
+            cls._instance.path = None
+            cls._instance._file = None
+            cls._instance._started = 0.0
+            cls._instance._lock = threading.Lock()
+        return cls._instance
+
+    def start(self, path: str, config: Optional[dict] = None) -> None:
+        if self.enabled:
+            return
+        try:
+            self._file = _open(path, 'w')
+        except OSError as e:
+            log.error(f"Trace recording failed: {e}")
+            return
+        self.path = path
+        self._started = time.monotonic()
+        self.enabled = True
+        self.record('clock', time.time())
+        if config is not None:
+            self.record('config', config)
+        log.info(f"Recording trace to {path}")
+
+    def record(self, kind: str, *data: Any) -> None:
+        if not self.enabled:
+            return
+        line = json.dumps([round(time.monotonic() - self._started, 4), kind, *data], separators=(',', ':'))
+        with self._lock:
+            if self._file:
+                self._file.write(line + "\n")
+
+    def stop(self) -> None:
+        with self._lock:
+            self.enabled = False
+            if self._file:
+                self._file.close()
+                self._file = None
+                log.info(f"Trace saved to {self.path}")